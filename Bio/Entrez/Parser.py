@@ -297,6 +297,116 @@ class ValidationError(ValueError):
         )
 
 
+def _classify_element(name, model):
+    """Classify an element declaration in a DTD (PRIVATE).
+
+    Returns a tuple (table, value), where table is the name of the
+    DataHandler attribute in which the element should be registered
+    ("errors", "items", "strings", or "constructors"), and value is the
+    allowed tags or the constructor and its arguments.
+    """
+    if name.upper() == "ERROR":
+        return "errors", None
+    if name == "Item" and model == (
+        expat.model.XML_CTYPE_MIXED,
+        expat.model.XML_CQUANT_REP,
+        None,
+        ((expat.model.XML_CTYPE_NAME, expat.model.XML_CQUANT_NONE, "Item", ()),),
+    ):
+        # Special case. As far as I can tell, this only occurs in the
+        # eSummary DTD.
+        return "items", None
+    # First, remove ignorable parentheses around declarations
+    while (
+        model[0] in (expat.model.XML_CTYPE_SEQ, expat.model.XML_CTYPE_CHOICE)
+        and model[1] in (expat.model.XML_CQUANT_NONE, expat.model.XML_CQUANT_OPT)
+        and len(model[3]) == 1
+    ):
+        model = model[3][0]
+    # PCDATA declarations correspond to strings
+    if model[0] in (expat.model.XML_CTYPE_MIXED, expat.model.XML_CTYPE_EMPTY):
+        if model[1] == expat.model.XML_CQUANT_REP:
+            children = model[3]
+            allowed_tags = frozenset(child[2] for child in children)
+        else:
+            allowed_tags = frozenset()
+        return "strings", allowed_tags
+    # Children can be anything; use a dictionary-type element
+    if model == (expat.model.XML_CTYPE_ANY, expat.model.XML_CQUANT_NONE, None, ()):
+        allowed_tags = None
+        repeated_tags = None
+        args = (allowed_tags, repeated_tags)
+        return "constructors", (DictionaryElement, args)
+    # List-type elements
+    if model[0] in (
+        expat.model.XML_CTYPE_CHOICE,
+        expat.model.XML_CTYPE_SEQ,
+    ) and model[1] in (
+        expat.model.XML_CQUANT_PLUS,
+        expat.model.XML_CQUANT_REP,
+    ):
+        children = model[3]
+        allowed_tags = frozenset(child[2] for child in children)
+        if model[0] == expat.model.XML_CTYPE_SEQ:
+            if len(children) > 1:
+                assert model[1] == expat.model.XML_CQUANT_PLUS
+                first_child = children[0]
+                assert first_child[1] == expat.model.XML_CQUANT_NONE
+                first_tag = first_child[2]
+                args = allowed_tags, first_tag
+                return "constructors", (OrderedListElement, args)
+            assert len(children) == 1
+        return "constructors", (ListElement, (allowed_tags,))
+    # This is the tricky case. Check which keys can occur multiple
+    # times. If only one key is possible, and it can occur multiple
+    # times, then this is a list. If more than one key is possible,
+    # but none of them can occur multiple times, then this is a
+    # dictionary. Otherwise, this is a structure.
+    # In 'single' and 'multiple', we keep track which keys can occur
+    # only once, and which can occur multiple times.
+    single = []
+    multiple = []
+    errors = []
+    # The 'count' function is called recursively to make sure all the
+    # children in this model are counted.
+
+    def count(model):
+        quantifier, key, children = model[1:]
+        if key is None:
+            if quantifier in (
+                expat.model.XML_CQUANT_PLUS,
+                expat.model.XML_CQUANT_REP,
+            ):
+                for child in children:
+                    multiple.append(child[2])
+            else:
+                for child in children:
+                    count(child)
+        elif key.upper() == "ERROR":
+            errors.append(key)
+        else:
+            if quantifier in (
+                expat.model.XML_CQUANT_NONE,
+                expat.model.XML_CQUANT_OPT,
+            ):
+                single.append(key)
+            elif quantifier in (
+                expat.model.XML_CQUANT_PLUS,
+                expat.model.XML_CQUANT_REP,
+            ):
+                multiple.append(key)
+
+    count(model)
+    if len(single) == 0 and len(multiple) == 1:
+        allowed_tags = frozenset(multiple + errors)
+        return "constructors", (ListElement, (allowed_tags,))
+    else:
+        allowed_tags = frozenset(single + multiple + errors)
+        repeated_tags = frozenset(multiple)
+        args = (allowed_tags, repeated_tags)
+        return "constructors", (DictionaryElement, args)
+
+
 class DataHandlerMeta(type):
     """A metaclass is needed until Python supports @classproperty."""
 
@@ -366,6 +476,9 @@ class DataHandler(metaclass=DataHandlerMeta):
         self.ignore_errors = ignore_errors
         self.parser = expat.ParserCreate(namespace_separator=" ")
         self.parser.SetParamEntityParsing(expat.XML_PARAM_ENTITY_PARSING_ALWAYS)
+        # Deliver each run of text in one call to characterDataHandler,
+        # instead of splitting it at every line break and entity reference.
+        self.parser.buffer_text = True
         self.parser.XmlDeclHandler = self.xmlDeclHandler
         self.schema_namespace = None
         self.namespace_level = Counter()
@@ -570,7 +683,12 @@ class DataHandler(metaclass=DataHandlerMeta):
         handle = self.open_xsd_file(os.path.basename(schema))
         # if there is no local xsd file grab the url and parse the file
         if not handle:
-            handle = urlopen(schema)
+            try:
+                handle = urlopen(schema)
+            except OSError:
+                raise RuntimeError(
+                    f"Failed to access {os.path.basename(schema)} at {schema}"
+                ) from None
             text = handle.read()
             self.save_xsd_file(os.path.basename(schema), text)
             handle.close()
@@ -913,109 +1031,15 @@ class DataHandler(metaclass=DataHandlerMeta):
         should be regarded as a string, integer, list, dictionary, structure,
         or error.
         """
-        if name.upper() == "ERROR":
-            self.errors.add(name)
-            return
-        if name == "Item" and model == (
-            expat.model.XML_CTYPE_MIXED,
-            expat.model.XML_CQUANT_REP,
-            None,
-            ((expat.model.XML_CTYPE_NAME, expat.model.XML_CQUANT_NONE, "Item", ()),),
-        ):
-            # Special case. As far as I can tell, this only occurs in the
-            # eSummary DTD.
+        table, value = _classify_element(name, model)
+        if table == "strings":
+            self.strings[name] = value
+        elif table == "constructors":
+            self.constructors[name] = value
+        elif table == "items":
             self.items.add(name)
-            return
-        # First, remove ignorable parentheses around declarations
-        while (
-            model[0] in (expat.model.XML_CTYPE_SEQ, expat.model.XML_CTYPE_CHOICE)
-            and model[1] in (expat.model.XML_CQUANT_NONE, expat.model.XML_CQUANT_OPT)
-            and len(model[3]) == 1
-        ):
-            model = model[3][0]
-        # PCDATA declarations correspond to strings
-        if model[0] in (expat.model.XML_CTYPE_MIXED, expat.model.XML_CTYPE_EMPTY):
-            if model[1] == expat.model.XML_CQUANT_REP:
-                children = model[3]
-                allowed_tags = frozenset(child[2] for child in children)
-            else:
-                allowed_tags = frozenset()
-            self.strings[name] = allowed_tags
-            return
-        # Children can be anything; use a dictionary-type element
-        if model == (expat.model.XML_CTYPE_ANY, expat.model.XML_CQUANT_NONE, None, ()):
-            allowed_tags = None
-            repeated_tags = None
-            args = (allowed_tags, repeated_tags)
-            self.constructors[name] = (DictionaryElement, args)
-            return
-        # List-type elements
-        if model[0] in (
-            expat.model.XML_CTYPE_CHOICE,
-            expat.model.XML_CTYPE_SEQ,
-        ) and model[1] in (expat.model.XML_CQUANT_PLUS, expat.model.XML_CQUANT_REP):
-            children = model[3]
-            allowed_tags = frozenset(child[2] for child in children)
-            if model[0] == expat.model.XML_CTYPE_SEQ:
-                if len(children) > 1:
-                    assert model[1] == expat.model.XML_CQUANT_PLUS
-                    first_child = children[0]
-                    assert first_child[1] == expat.model.XML_CQUANT_NONE
-                    first_tag = first_child[2]
-                    args = allowed_tags, first_tag
-                    self.constructors[name] = (OrderedListElement, args)
-                    return
-                assert len(children) == 1
-            self.constructors[name] = (ListElement, (allowed_tags,))
-            return
-        # This is the tricky case. Check which keys can occur multiple
-        # times. If only one key is possible, and it can occur multiple
-        # times, then this is a list. If more than one key is possible,
-        # but none of them can occur multiple times, then this is a
-        # dictionary. Otherwise, this is a structure.
-        # In 'single' and 'multiple', we keep track which keys can occur
-        # only once, and which can occur multiple times.
-        single = []
-        multiple = []
-        errors = []
-        # The 'count' function is called recursively to make sure all the
-        # children in this model are counted.
-
-        def count(model):
-            quantifier, key, children = model[1:]
-            if key is None:
-                if quantifier in (
-                    expat.model.XML_CQUANT_PLUS,
-                    expat.model.XML_CQUANT_REP,
-                ):
-                    for child in children:
-                        multiple.append(child[2])
-                else:
-                    for child in children:
-                        count(child)
-            elif key.upper() == "ERROR":
-                errors.append(key)
-            else:
-                if quantifier in (
-                    expat.model.XML_CQUANT_NONE,
-                    expat.model.XML_CQUANT_OPT,
-                ):
-                    single.append(key)
-                elif quantifier in (
-                    expat.model.XML_CQUANT_PLUS,
-                    expat.model.XML_CQUANT_REP,
-                ):
-                    multiple.append(key)
-
-        count(model)
-        if len(single) == 0 and len(multiple) == 1:
-            allowed_tags = frozenset(multiple + errors)
-            self.constructors[name] = (ListElement, (allowed_tags,))
         else:
-            allowed_tags = frozenset(single + multiple + errors)
-            repeated_tags = frozenset(multiple)
-            args = (allowed_tags, repeated_tags)
-            self.constructors[name] = (DictionaryElement, args)
+            self.errors.add(name)
 
     def open_dtd_file(self, filename):
         """Open specified DTD file."""
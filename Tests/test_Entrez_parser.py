@@ -10,7 +10,7 @@ import pickle
 import unittest
 from io import BytesIO
 from textwrap import dedent
-from unittest.mock import call, Mock
+from unittest.mock import call, Mock, patch
 
 from Bio import Entrez
 from Bio import StreamModeError
@@ -109,7 +109,7 @@ class EInfoTest(unittest.TestCase):
         # >>> Bio.Entrez.einfo()
         with open("Entrez/einfo1.xml", "rb") as stream:
             record = Entrez.read(stream)
-        self.assertEqual(
+        self.assertListEqual(
             record["DbList"],
             [
                 "pubmed",
@@ -444,7 +444,7 @@ class ESearchTest(unittest.TestCase):
         self.assertEqual(record["TranslationStack"][1]["Count"], "1528859")
         self.assertEqual(record["TranslationStack"][1]["Explode"], "N")
         self.assertEqual(record["TranslationStack"][1].tag, "TermSet")
-        self.assertEqual(
+        self.assertDictEqual(
             record["TranslationStack"][2],
             {
                 "Term": '"cells"[All Fields]',
@@ -460,7 +460,7 @@ class ESearchTest(unittest.TestCase):
         self.assertEqual(record["TranslationStack"][4].tag, "OP")
         self.assertEqual(record["TranslationStack"][5], "OR")
         self.assertEqual(record["TranslationStack"][5].tag, "OP")
-        self.assertEqual(
+        self.assertDictEqual(
             record["TranslationStack"][6],
             {
                 "Term": '"stem cells"[All Fields]',
@@ -671,7 +671,7 @@ class ESummaryTest(unittest.TestCase):
         self.assertEqual(record[0]["Volume"], "92")
         self.assertEqual(record[0]["Issue"], "2")
         self.assertEqual(record[0]["Pages"], "188-91")
-        self.assertEqual(record[0]["LangList"], ["English"])
+        self.assertListEqual(record[0]["LangList"], ["English"])
         self.assertEqual(record[0]["NlmUniqueID"], "0372433")
         self.assertEqual(record[0]["ISSN"], "0003-987X")
         self.assertEqual(record[0]["ESSN"], "")
@@ -837,7 +837,7 @@ class ESummaryTest(unittest.TestCase):
         self.assertEqual(record[0]["PdbClass"], "LYASE")
         self.assertEqual(record[0]["PdbDepositDate"], "2002/03/07 00:00")
         self.assertEqual(record[0]["MMDBEntryDate"], "2002/07/11 00:00")
-        self.assertEqual(record[0]["OrganismList"], ["Escherichia coli"])
+        self.assertListEqual(record[0]["OrganismList"], ["Escherichia coli"])
         self.assertEqual(record[0]["LigCode"], "F3S|TRA")
         self.assertEqual(record[0]["LigCount"], "2")
         self.assertEqual(record[0]["ModProteinResCount"], "0")
@@ -858,7 +858,7 @@ class ESummaryTest(unittest.TestCase):
         self.assertEqual(record[1]["PdbClass"], "LYASE")
         self.assertEqual(record[1]["PdbDepositDate"], "1998/11/11 00:00")
         self.assertEqual(record[1]["MMDBEntryDate"], "2000/01/24 00:00")
-        self.assertEqual(record[1]["OrganismList"], ["Sus scrofa"])
+        self.assertListEqual(record[1]["OrganismList"], ["Sus scrofa"])
         self.assertEqual(record[1]["LigCode"], "FLC|O|SF4")
         self.assertEqual(record[1]["LigCount"], "3")
         self.assertEqual(record[1]["ModProteinResCount"], "0")
@@ -926,8 +926,8 @@ class ESummaryTest(unittest.TestCase):
         record = records[0]
         self.assertEqual(record["Id"], "7488")
         self.assertEqual(record["CID"], 7488)
-        self.assertEqual(record["SourceNameList"], [])
-        self.assertEqual(record["SourceIDList"], [])
+        self.assertListEqual(record["SourceNameList"], [])
+        self.assertListEqual(record["SourceIDList"], [])
         self.assertEqual(len(record["SourceCategoryList"]), 8)
         self.assertEqual(record["SourceCategoryList"][0], "Chemical Vendors")
         self.assertEqual(record["SourceCategoryList"][1], "Research and Development")
@@ -1032,7 +1032,7 @@ class ESummaryTest(unittest.TestCase):
         self.assertEqual(record["MeSHTermList"][3], "1,4-phthaloyl dichloride")
         self.assertEqual(record["MeSHTermList"][4], "terephthaloyl chloride")
         self.assertEqual(len(record["PharmActionList"]), 0)
-        self.assertEqual(record["CommentList"], [])
+        self.assertListEqual(record["CommentList"], [])
         self.assertEqual(record["IUPACName"], "benzene-1,4-dicarbonyl chloride")
         self.assertEqual(record["CanonicalSmiles"], "C1=CC(=CC=C1C(=O)Cl)C(=O)Cl")
         self.assertEqual(record["IsomericSmiles"], "C1=CC(=CC=C1C(=O)Cl)C(=O)Cl")
@@ -1054,9 +1054,9 @@ class ESummaryTest(unittest.TestCase):
         self.assertEqual(record["IsotopeAtomCount"], 0)
         self.assertEqual(record["CovalentUnitCount"], 1)
         self.assertEqual(record["TautomerCount"], NoneElement(None, None, None))
-        self.assertEqual(record["SubstanceIDList"], [])
+        self.assertListEqual(record["SubstanceIDList"], [])
         self.assertEqual(record["TPSA"], "34.1")
-        self.assertEqual(record["AssaySourceNameList"], [])
+        self.assertListEqual(record["AssaySourceNameList"], [])
         self.assertEqual(record["MinAC"], "")
         self.assertEqual(record["MaxAC"], "")
         self.assertEqual(record["MinTC"], "")
@@ -1083,7 +1083,7 @@ class ELinkTest(unittest.TestCase):
         self.assertEqual(len(record), 1)
         self.assertEqual(len(record[0]), 5)
         self.assertEqual(record[0]["DbFrom"], "pubmed")
-        self.assertEqual(record[0]["IdList"], ["9298984"])
+        self.assertListEqual(record[0]["IdList"], ["9298984"])
         self.assertEqual(len(record[0]["LinkSetDb"]), 7)
         self.assertEqual(record[0]["LinkSetDb"][0]["DbTo"], "pubmed")
         self.assertEqual(record[0]["LinkSetDb"][0]["LinkName"], "pubmed_pubmed")
@@ -1318,7 +1318,7 @@ class ELinkTest(unittest.TestCase):
         self.assertEqual(len(record), 1)
         self.assertEqual(len(record[0]), 5)
         self.assertEqual(record[0]["DbFrom"], "nuccore")
-        self.assertEqual(record[0]["IdList"], ["48819", "7140345"])
+        self.assertListEqual(record[0]["IdList"], ["48819", "7140345"])
         self.assertEqual(len(record[0]["LinkSetDb"]), 1)
         self.assertEqual(len(record[0]["LinkSetDb"][0]), 3)
         self.assertEqual(record[0]["LinkSetDb"][0]["DbTo"], "protein")
@@ -1393,7 +1393,7 @@ class ELinkTest(unittest.TestCase):
             record = Entrez.read(stream)
         self.assertEqual(len(record), 1)
         self.assertEqual(record[0]["DbFrom"], "pubmed")
-        self.assertEqual(record[0]["IdList"], ["12242737"])
+        self.assertListEqual(record[0]["IdList"], ["12242737"])
         self.assertEqual(len(record[0]["LinkSetDb"]), 6)
         self.assertEqual(record[0]["LinkSetDb"][0]["DbTo"], "pubmed")
         self.assertEqual(record[0]["LinkSetDb"][0]["Link"][0]["Id"], "38997184")
@@ -2010,9 +2010,8 @@ class ELinkTest(unittest.TestCase):
         self.assertEqual(len(record[0]["IdCheckList"]), 2)
         self.assertEqual(len(record[0]["IdCheckList"]["Id"]), 1)
         self.assertEqual(record[0]["IdCheckList"]["Id"][0], "12068369")
-        self.assertEqual(len(record[0]["IdCheckList"]["Id"][0].attributes), 1)
         self.assertEqual(
-            record[0]["IdCheckList"]["Id"][0].attributes["HasNeighbor"], "Y"
+            record[0]["IdCheckList"]["Id"][0].attributes, {"HasNeighbor": "Y"}
         )
         self.assertEqual(len(record[0]["IdCheckList"]["IdLinkSet"]), 0)
 
@@ -2137,7 +2136,7 @@ class EFetchTest(unittest.TestCase):
             record[0]["MedlineCitation"]["Article"]["AuthorList"][0]["Initials"], "JM"
         )
         self.assertEqual(record[0]["MedlineCitation"]["Article"]["Language"], ["eng"])
-        self.assertEqual(
+        self.assertListEqual(
             record[0]["MedlineCitation"]["Article"]["PublicationTypeList"],
             ["Journal Article", "Review"],
         )
@@ -2386,7 +2385,7 @@ class EFetchTest(unittest.TestCase):
             record[0]["MedlineCitation"]["GeneralNote"][2].attributes["Owner"], "KIE"
         )
         self.assertEqual(
-            record[0]["PubmedData"]["History"][0].attributes["PubStatus"], "pubmed"
+            record[0]["PubmedData"]["History"][0].attributes, {"PubStatus": "pubmed"}
         )
         self.assertEqual(record[0]["PubmedData"]["History"][0]["Year"], "1990")
         self.assertEqual(record[0]["PubmedData"]["History"][0]["Month"], "4")
@@ -2394,7 +2393,7 @@ class EFetchTest(unittest.TestCase):
         self.assertEqual(record[0]["PubmedData"]["History"][0]["Hour"], "0")
         self.assertEqual(record[0]["PubmedData"]["History"][0]["Minute"], "0")
         self.assertEqual(
-            record[0]["PubmedData"]["History"][1].attributes["PubStatus"], "medline"
+            record[0]["PubmedData"]["History"][1].attributes, {"PubStatus": "medline"}
         )
         self.assertEqual(record[0]["PubmedData"]["History"][1]["Year"], "2002")
         self.assertEqual(record[0]["PubmedData"]["History"][1]["Month"], "7")
@@ -2489,7 +2488,7 @@ class EFetchTest(unittest.TestCase):
             record[1]["MedlineCitation"]["Article"]["AuthorList"][0]["Initials"], "TC"
         )
         self.assertEqual(record[1]["MedlineCitation"]["Article"]["Language"], ["eng"])
-        self.assertEqual(
+        self.assertListEqual(
             record[1]["MedlineCitation"]["Article"]["PublicationTypeList"],
             ["Journal Article"],
         )
@@ -2650,11 +2649,11 @@ class EFetchTest(unittest.TestCase):
             record[1]["MedlineCitation"]["MeshHeadingList"][12]["DescriptorName"].attributes["MajorTopicYN"],
             "N",
         )
-        self.assertEqual(record[1]["PubmedData"]["History"][0].attributes["PubStatus"], "pubmed")
+        self.assertEqual(record[1]["PubmedData"]["History"][0].attributes, {"PubStatus": "pubmed"})
         self.assertEqual(record[1]["PubmedData"]["History"][0]["Year"], "1976")
         self.assertEqual(record[1]["PubmedData"]["History"][0]["Month"], "9")
         self.assertEqual(record[1]["PubmedData"]["History"][0]["Day"], "28")
-        self.assertEqual(record[1]["PubmedData"]["History"][1].attributes["PubStatus"], "medline")
+        self.assertEqual(record[1]["PubmedData"]["History"][1].attributes, {"PubStatus": "medline"})
         self.assertEqual(record[1]["PubmedData"]["History"][1]["Year"], "1976")
         self.assertEqual(record[1]["PubmedData"]["History"][1]["Month"], "9")
         self.assertEqual(record[1]["PubmedData"]["History"][1]["Day"], "28")
@@ -3100,7 +3099,7 @@ class EFetchTest(unittest.TestCase):
             "Y",
         )
         self.assertEqual(
-            record[0]["PubmedData"]["History"][0].attributes["PubStatus"], "pubmed"
+            record[0]["PubmedData"]["History"][0].attributes, {"PubStatus": "pubmed"}
         )
         self.assertEqual(record[0]["PubmedData"]["History"][0]["Year"], "2001")
         self.assertEqual(record[0]["PubmedData"]["History"][0]["Month"], "12")
@@ -3108,7 +3107,7 @@ class EFetchTest(unittest.TestCase):
         self.assertEqual(record[0]["PubmedData"]["History"][0]["Hour"], "10")
         self.assertEqual(record[0]["PubmedData"]["History"][0]["Minute"], "0")
         self.assertEqual(
-            record[0]["PubmedData"]["History"][1].attributes["PubStatus"], "medline"
+            record[0]["PubmedData"]["History"][1].attributes, {"PubStatus": "medline"}
         )
         self.assertEqual(record[0]["PubmedData"]["History"][1]["Year"], "2002")
         self.assertEqual(record[0]["PubmedData"]["History"][1]["Month"], "3")
@@ -3317,7 +3316,7 @@ class EFetchTest(unittest.TestCase):
             record[1]["MedlineCitation"]["MedlineJournalInfo"]["NlmUniqueID"], "9707935"
         )
         self.assertEqual(
-            record[1]["PubmedData"]["History"][0].attributes["PubStatus"], "pubmed"
+            record[1]["PubmedData"]["History"][0].attributes, {"PubStatus": "pubmed"}
         )
         self.assertEqual(record[1]["PubmedData"]["History"][0]["Year"], "2001")
         self.assertEqual(record[1]["PubmedData"]["History"][0]["Month"], "11")
@@ -3325,7 +3324,7 @@ class EFetchTest(unittest.TestCase):
         self.assertEqual(record[1]["PubmedData"]["History"][0]["Hour"], "10")
         self.assertEqual(record[1]["PubmedData"]["History"][0]["Minute"], "0")
         self.assertEqual(
-            record[1]["PubmedData"]["History"][1].attributes["PubStatus"], "medline"
+            record[1]["PubmedData"]["History"][1].attributes, {"PubStatus": "medline"}
         )
         self.assertEqual(record[1]["PubmedData"]["History"][1]["Year"], "2001")
         self.assertEqual(record[1]["PubmedData"]["History"][1]["Month"], "11")
@@ -3482,14 +3481,8 @@ class EFetchTest(unittest.TestCase):
         self.assertEqual(
             records["PubmedArticle"][0]["MedlineCitation"]["Article"]["ELocationID"][
                 0
-            ].attributes["EIdType"],
-            "doi",
-        )
-        self.assertEqual(
-            records["PubmedArticle"][0]["MedlineCitation"]["Article"]["ELocationID"][
-                0
-            ].attributes["ValidYN"],
-            "Y",
+            ].attributes,
+            {"EIdType": "doi", "ValidYN": "Y"},
         )
         self.assertEqual(
             len(records["PubmedArticle"][0]["MedlineCitation"]["Article"]["Abstract"]),
@@ -3698,4674 +3691,1557 @@ class EFetchTest(unittest.TestCase):
         self.assertEqual(len(record), 2)
         self.assertEqual(len(record["PubmedArticle"]), 1)
         self.assertEqual(len(record["PubmedBookArticle"]), 0)
-        article = record["PubmedArticle"][0]
-        self.assertEqual(len(article), 2)
-        self.assertEqual(len(article["PubmedData"]), 3)
-        self.assertEqual(len(article["PubmedData"]["ArticleIdList"]), 5)
-        self.assertEqual(article["PubmedData"]["ArticleIdList"][0], "28775130")
-        self.assertEqual(
-            article["PubmedData"]["ArticleIdList"][0].attributes, {"IdType": "pubmed"}
-        )
-        self.assertEqual(article["PubmedData"]["ArticleIdList"][1], "oemed-2017-104431")
-        self.assertEqual(
-            article["PubmedData"]["ArticleIdList"][1].attributes, {"IdType": "pii"}
-        )
-        self.assertEqual(
-            article["PubmedData"]["ArticleIdList"][2], "10.1136/oemed-2017-104431"
-        )
-        self.assertEqual(
-            article["PubmedData"]["ArticleIdList"][2].attributes, {"IdType": "doi"}
-        )
-        self.assertEqual(article["PubmedData"]["ArticleIdList"][3], "PMC5771820")
-        self.assertEqual(
-            article["PubmedData"]["ArticleIdList"][3].attributes, {"IdType": "pmc"}
-        )
-        self.assertEqual(article["PubmedData"]["ArticleIdList"][4], "NIHMS932407")
-        self.assertEqual(
-            article["PubmedData"]["ArticleIdList"][4].attributes, {"IdType": "mid"}
-        )
-        self.assertEqual(article["PubmedData"]["PublicationStatus"], "ppublish")
-        self.assertEqual(len(article["PubmedData"]["History"]), 7)
-        self.assertEqual(len(article["PubmedData"]["History"][0]), 3)
-        self.assertEqual(article["PubmedData"]["History"][0]["Year"], "2017")
-        self.assertEqual(article["PubmedData"]["History"][0]["Month"], "03")
-        self.assertEqual(article["PubmedData"]["History"][0]["Day"], "10")
-        self.assertEqual(
-            article["PubmedData"]["History"][0].attributes, {"PubStatus": "received"}
-        )
-        self.assertEqual(len(article["PubmedData"]["History"][1]), 3)
-        self.assertEqual(article["PubmedData"]["History"][1]["Year"], "2017")
-        self.assertEqual(article["PubmedData"]["History"][1]["Month"], "06")
-        self.assertEqual(article["PubmedData"]["History"][1]["Day"], "13")
-        self.assertEqual(
-            article["PubmedData"]["History"][1].attributes, {"PubStatus": "revised"}
-        )
-        self.assertEqual(len(article["PubmedData"]["History"][2]), 3)
-        self.assertEqual(article["PubmedData"]["History"][2]["Year"], "2017")
-        self.assertEqual(article["PubmedData"]["History"][2]["Month"], "06")
-        self.assertEqual(article["PubmedData"]["History"][2]["Day"], "22")
-        self.assertEqual(
-            article["PubmedData"]["History"][2].attributes, {"PubStatus": "accepted"}
-        )
-        self.assertEqual(len(article["PubmedData"]["History"][3]), 3)
-        self.assertEqual(article["PubmedData"]["History"][3]["Year"], "2019")
-        self.assertEqual(article["PubmedData"]["History"][3]["Month"], "02")
-        self.assertEqual(article["PubmedData"]["History"][3]["Day"], "01")
-        self.assertEqual(
-            article["PubmedData"]["History"][3].attributes, {"PubStatus": "pmc-release"}
-        )
-        self.assertEqual(len(article["PubmedData"]["History"][4]), 5)
-        self.assertEqual(article["PubmedData"]["History"][4]["Year"], "2017")
-        self.assertEqual(article["PubmedData"]["History"][4]["Month"], "8")
-        self.assertEqual(article["PubmedData"]["History"][4]["Day"], "5")
-        self.assertEqual(article["PubmedData"]["History"][4]["Hour"], "6")
-        self.assertEqual(article["PubmedData"]["History"][4]["Minute"], "0")
+        pubmed_article = record["PubmedArticle"][0]
+        self.assertEqual(len(pubmed_article), 2)
+        pubmed_data = pubmed_article["PubmedData"]
+        self.assertEqual(len(pubmed_data), 3)
+        self.assertEqual(len(pubmed_data["ArticleIdList"]), 5)
+        self.assertEqual(pubmed_data["ArticleIdList"][0], "28775130")
+        self.assertEqual(
+            pubmed_data["ArticleIdList"][0].attributes, {"IdType": "pubmed"}
+        )
+        self.assertEqual(pubmed_data["ArticleIdList"][1], "oemed-2017-104431")
+        self.assertEqual(pubmed_data["ArticleIdList"][1].attributes, {"IdType": "pii"})
+        self.assertEqual(pubmed_data["ArticleIdList"][2], "10.1136/oemed-2017-104431")
+        self.assertEqual(pubmed_data["ArticleIdList"][2].attributes, {"IdType": "doi"})
+        self.assertEqual(pubmed_data["ArticleIdList"][3], "PMC5771820")
+        self.assertEqual(pubmed_data["ArticleIdList"][3].attributes, {"IdType": "pmc"})
+        self.assertEqual(pubmed_data["ArticleIdList"][4], "NIHMS932407")
+        self.assertEqual(pubmed_data["ArticleIdList"][4].attributes, {"IdType": "mid"})
+        self.assertEqual(pubmed_data["PublicationStatus"], "ppublish")
+        added = {"Year": "2017", "Month": "8", "Day": "5", "Hour": "6", "Minute": "0"}
+        history = [
+            (
+                {"Year": "2017", "Month": "03", "Day": "10"},
+                {"PubStatus": "received"},
+            ),
+            (
+                {"Year": "2017", "Month": "06", "Day": "13"},
+                {"PubStatus": "revised"},
+            ),
+            (
+                {"Year": "2017", "Month": "06", "Day": "22"},
+                {"PubStatus": "accepted"},
+            ),
+            (
+                {"Year": "2019", "Month": "02", "Day": "01"},
+                {"PubStatus": "pmc-release"},
+            ),
+            (added, {"PubStatus": "pubmed"}),
+            (added, {"PubStatus": "medline"}),
+            (added, {"PubStatus": "entrez"}),
+        ]
+        self.assertEqual(len(pubmed_data["History"]), len(history))
+        for entry, (date, attributes) in zip(pubmed_data["History"], history):
+            self.assertDictEqual(entry, date)
+            self.assertEqual(entry.attributes, attributes)
+        medline_citation = pubmed_article["MedlineCitation"]
+        self.assertEqual(len(medline_citation), 12)
+        self.assertEqual(len(medline_citation["CitationSubset"]), 0)
         self.assertEqual(
-            article["PubmedData"]["History"][4].attributes, {"PubStatus": "pubmed"}
+            medline_citation["CoiStatement"],
+            "Competing interests: None declared.",
         )
-        self.assertEqual(len(article["PubmedData"]["History"][5]), 5)
-        self.assertEqual(article["PubmedData"]["History"][5]["Year"], "2017")
-        self.assertEqual(article["PubmedData"]["History"][5]["Month"], "8")
-        self.assertEqual(article["PubmedData"]["History"][5]["Day"], "5")
-        self.assertEqual(article["PubmedData"]["History"][5]["Hour"], "6")
-        self.assertEqual(article["PubmedData"]["History"][5]["Minute"], "0")
+        comments_corrections = medline_citation["CommentsCorrectionsList"]
+        self.assertEqual(len(comments_corrections), 40)
+        cited = [
+            ("J Toxicol Environ Health A. 2003 Jun 13;66(11):965-86", "12775511"),
+            ("Ann Intern Med. 2015 May 5;162(9):641-50", "25798805"),
+            ("Cancer Causes Control. 1999 Dec;10(6):583-95", "10616827"),
+            ("Thyroid. 2010 Jul;20(7):755-61", "20578899"),
+            ("Environ Health Perspect. 1999 Mar;107(3):205-11", "10064550"),
+            ("J Clin Endocrinol Metab. 2006 Nov;91(11):4295-301", "16868053"),
+            ("Endocrinology. 1998 Oct;139(10):4252-63", "9751507"),
+            ("Eur J Endocrinol. 2016 Apr;174(4):409-14", "26863886"),
+            ("Eur J Endocrinol. 2000 Nov;143(5):639-47", "11078988"),
+            ("Environ Res. 2016 Nov;151:389-398", "27540871"),
+            ("Am J Epidemiol. 2010 Jan 15;171(2):242-52", "19951937"),
+            ("Thyroid. 1998 Sep;8(9):827-56", "9777756"),
+            ("Curr Opin Pharmacol. 2001 Dec;1(6):626-31", "11757819"),
+            ("Breast Cancer Res Treat. 2012 Jun;133(3):1169-77", "22434524"),
+            ("Int J Environ Res Public Health. 2011 Dec;8(12 ):4608-22", "22408592"),
+            ("Ann Oncol. 2014 Oct;25(10):2025-30", "25081899"),
+            ("Environ Health. 2006 Dec 06;5:32", "17147831"),
+            ("Environ Health Perspect. 1998 Aug;106(8):437-45", "9681970"),
+            ("Arch Intern Med. 2000 Feb 28;160(4):526-34", "10695693"),
+            ("Endocrine. 2011 Jun;39(3):259-65", "21161440"),
+            ("Cancer Epidemiol Biomarkers Prev. 2008 Aug;17(8):1880-3", "18708375"),
+            ("Am J Epidemiol. 2010 Feb 15;171(4):455-64", "20061368"),
+            ("J Clin Endocrinol Metab. 2002 Feb;87(2):489-99", "11836274"),
+            ("J Toxicol Environ Health A. 2015 ;78(21-22):1338-47", "26555155"),
+            ("Toxicol Sci. 2002 Jun;67(2):207-18", "12011480"),
+            ("Natl Cancer Inst Carcinog Tech Rep Ser. 1978;21:1-184", "12844187"),
+            ("Environ Res. 2013 Nov;127:7-15", "24183346"),
+            ("JAMA. 2004 Jan 14;291(2):228-38", "14722150"),
+            ("J Expo Sci Environ Epidemiol. 2010 Sep;20(6):559-69", "19888312"),
+            ("Environ Health Perspect. 1996 Apr;104(4):362-9", "8732939"),
+            ("Lancet. 2012 Mar 24;379(9821):1142-54", "22273398"),
+            ("JAMA. 1995 Mar 8;273(10):808-12", "7532241"),
+            ("Sci Total Environ. 2002 Aug 5;295(1-3):207-15", "12186288"),
+            ("Eur J Endocrinol. 2006 May;154(5):599-611", "16645005"),
+            ("J Occup Environ Med. 2013 Oct;55(10):1171-8", "24064777"),
+            ("Thyroid. 2007 Sep;17(9):811-7", "17956155"),
+            ("Rev Environ Contam Toxicol. 1991;120:1-82", "1899728"),
+            ("Environ Health Perspect. 1997 Oct;105(10):1126-30", "9349837"),
+            ("J Biochem Mol Toxicol. 2005;19(3):175", "15977190"),
+            ("Immunogenetics. 2002 Jun;54(3):141-57", "12073143"),
+        ]
+        cites = {"RefType": "Cites"}
         self.assertEqual(
-            article["PubmedData"]["History"][5].attributes, {"PubStatus": "medline"}
+            [
+                (len(entry), entry["RefSource"], entry["PMID"], entry.attributes)
+                for entry in comments_corrections
+            ],
+            [(2, ref_source, pmid, cites) for ref_source, pmid in cited],
         )
-        self.assertEqual(len(article["PubmedData"]["History"][6]), 5)
-        self.assertEqual(article["PubmedData"]["History"][6]["Year"], "2017")
-        self.assertEqual(article["PubmedData"]["History"][6]["Month"], "8")
-        self.assertEqual(article["PubmedData"]["History"][6]["Day"], "5")
-        self.assertEqual(article["PubmedData"]["History"][6]["Hour"], "6")
-        self.assertEqual(article["PubmedData"]["History"][6]["Minute"], "0")
-        self.assertEqual(
-            article["PubmedData"]["History"][6].attributes, {"PubStatus": "entrez"}
+        self.assertDictEqual(
+            medline_citation["DateRevised"],
+            {"Year": "2018", "Month": "04", "Day": "25"},
         )
-        self.assertEqual(len(article["MedlineCitation"]), 12)
-        self.assertEqual(len(article["MedlineCitation"]["CitationSubset"]), 0)
+        self.assertEqual(medline_citation["DateRevised"].attributes, {})
+        self.assertEqual(len(medline_citation["GeneralNote"]), 0)
+        self.assertEqual(len(medline_citation["KeywordList"]), 1)
         self.assertEqual(
-            article["MedlineCitation"]["CoiStatement"],
-            "Competing interests: None declared.",
+            [
+                (keyword, keyword.attributes)
+                for keyword in medline_citation["KeywordList"][0]
+            ],
+            [
+                ("agriculture", {"MajorTopicYN": "N"}),
+                ("hypothyroidism", {"MajorTopicYN": "N"}),
+                ("pesticides", {"MajorTopicYN": "N"}),
+                ("thyroid disease", {"MajorTopicYN": "N"}),
+                ("thyroid stimulating hormone", {"MajorTopicYN": "N"}),
+            ],
         )
-        self.assertEqual(len(article["MedlineCitation"]["CommentsCorrectionsList"]), 40)
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][0]), 2
+        self.assertDictEqual(
+            medline_citation["MedlineJournalInfo"],
+            {
+                "MedlineTA": "Occup Environ Med",
+                "Country": "England",
+                "NlmUniqueID": "9422759",
+                "ISSNLinking": "1351-0711",
+            },
         )
+        self.assertEqual(medline_citation["MedlineJournalInfo"].attributes, {})
+        self.assertEqual(len(medline_citation["OtherAbstract"]), 0)
+        self.assertEqual(len(medline_citation["OtherID"]), 0)
+        self.assertEqual(medline_citation["PMID"], "28775130")
+        self.assertEqual(len(medline_citation["SpaceFlightMission"]), 0)
+        article = medline_citation["Article"]
+        self.assertEqual(len(article["ArticleDate"]), 1)
+        self.assertEqual(len(article["ArticleDate"][0]), 3)
+        self.assertEqual(article["ArticleDate"][0]["Month"], "08")
+        self.assertEqual(article["ArticleDate"][0]["Day"], "03")
+        self.assertEqual(article["ArticleDate"][0]["Year"], "2017")
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][0]["RefSource"],
-            "J Toxicol Environ Health A. 2003 Jun 13;66(11):965-86",
+            article["ArticleDate"][0].attributes,
+            {"DateType": "Electronic"},
         )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][0]["PMID"], "12775511"
+        self.assertEqual(len(article["Pagination"]), 1)
+        self.assertEqual(article["Pagination"]["MedlinePgn"], "79-89")
+        self.assertEqual(len(article["Pagination"].attributes), 0)
+        authors = article["AuthorList"]
+        self.assertEqual(len(authors), 12)
+        nci = "Division of Cancer Epidemiology and Genetics, National Cancer Institute, Rockville, Maryland, USA."
+        uchicago = "Department of Public Health Sciences, The University of Chicago, Chicago, Illinois, USA."
+        niehs = "National Institute of Environmental Health Sciences, Research Triangle Park, North Carolina, USA."
+        expected_authors = [
+            ("Lerro", "CC", "Catherine C", [nci]),
+            ("Beane Freeman", "LE", "Laura E", [nci]),
+            (
+                "DellaValle",
+                "CT",
+                "Curt T",
+                [nci, "Environmental Working Group, Washington, DC, USA."],
+            ),
+            ("Kibriya", "MG", "Muhammad G", [uchicago]),
+            ("Aschebrook-Kilfoy", "B", "Briseis", [uchicago]),
+            ("Jasmine", "F", "Farzana", [uchicago]),
+            ("Koutros", "S", "Stella", [nci]),
+            ("Parks", "CG", "Christine G", [niehs]),
+            ("Sandler", "DP", "Dale P", [niehs]),
+            (
+                "Alavanja",
+                "MCR",
+                "Michael C R",
+                [nci, "Department of Biology, Hood College, Frederick, Maryland, USA."],
+            ),
+            ("Hofmann", "JN", "Jonathan N", [nci]),
+            ("Ward", "MH", "Mary H", [nci]),
+        ]
+        self.assertListEqual(
+            authors,
+            [
+                {
+                    "Identifier": [],
+                    "AffiliationInfo": [
+                        {"Identifier": [], "Affiliation": affiliation}
+                        for affiliation in affiliations
+                    ],
+                    "LastName": last_name,
+                    "ForeName": fore_name,
+                    "Initials": initials,
+                }
+                for last_name, initials, fore_name, affiliations in expected_authors
+            ],
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][0].attributes,
-            {"RefType": "Cites"},
+            [author.attributes for author in authors], [{"ValidYN": "Y"}] * len(authors)
         )
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][1]), 2
+            [
+                [
+                    affiliation_info.attributes
+                    for affiliation_info in author["AffiliationInfo"]
+                ]
+                for author in authors
+            ],
+            [[{}] * len(affiliations) for *_, affiliations in expected_authors],
         )
+        self.assertEqual(len(article["Language"]), 1)
+        self.assertEqual(article["Language"][0], "eng")
+        self.assertEqual(len(article["PublicationTypeList"]), 1)
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][1]["RefSource"],
-            "Ann Intern Med. 2015 May 5;162(9):641-50",
+            article["PublicationTypeList"][0],
+            "Journal Article",
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][1]["PMID"], "25798805"
+            article["PublicationTypeList"][0].attributes,
+            {"UI": "D016428"},
         )
+        journal = article["Journal"]
+        self.assertEqual(len(journal), 4)
+        self.assertEqual(journal["ISSN"], "1470-7926")
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][1].attributes,
-            {"RefType": "Cites"},
+            journal["ISSN"].attributes,
+            {"IssnType": "Electronic"},
         )
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][2]), 2
+            journal["ISOAbbreviation"],
+            "Occup Environ Med",
         )
+        self.assertEqual(len(journal["JournalIssue"]), 3)
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][2]["RefSource"],
-            "Cancer Causes Control. 1999 Dec;10(6):583-95",
+            journal["JournalIssue"]["Volume"],
+            "75",
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][2]["PMID"], "10616827"
+            journal["JournalIssue"]["Issue"],
+            "2",
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][2].attributes,
-            {"RefType": "Cites"},
+            len(journal["JournalIssue"]["PubDate"]),
+            2,
         )
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][3]), 2
+            journal["JournalIssue"]["PubDate"]["Month"],
+            "Feb",
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][3]["RefSource"],
-            "Thyroid. 2010 Jul;20(7):755-61",
+            journal["JournalIssue"]["PubDate"]["Year"],
+            "2018",
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][3]["PMID"], "20578899"
+            len(journal["JournalIssue"]["PubDate"].attributes),
+            0,
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][3].attributes,
-            {"RefType": "Cites"},
+            journal["JournalIssue"].attributes,
+            {"CitedMedium": "Internet"},
         )
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][4]), 2
+            journal["Title"],
+            "Occupational and environmental medicine",
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][4]["RefSource"],
-            "Environ Health Perspect. 1999 Mar;107(3):205-11",
+            journal["ISSN"].attributes,
+            {"IssnType": "Electronic"},
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][4]["PMID"], "10064550"
+            article["ArticleTitle"],
+            "Occupational pesticide exposure and subclinical hypothyroidism among male pesticide applicators.",
         )
+        self.assertEqual(len(article["ELocationID"]), 1)
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][4].attributes,
-            {"RefType": "Cites"},
+            article["ELocationID"][0],
+            "10.1136/oemed-2017-104431",
         )
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][5]), 2
+            article["ELocationID"][0].attributes,
+            {"EIdType": "doi", "ValidYN": "Y"},
         )
+        abstract = article["Abstract"]
+        self.assertEqual(len(abstract["AbstractText"]), 4)
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][5]["RefSource"],
-            "J Clin Endocrinol Metab. 2006 Nov;91(11):4295-301",
+            abstract["AbstractText"][0],
+            "Animal studies suggest that exposure to pesticides may alter thyroid function; however, few epidemiologic studies have examined this association. We evaluated the relationship between individual pesticides and thyroid function in 679 men enrolled in a substudy of the Agricultural Health Study, a cohort of licensed pesticide applicators.",
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][5]["PMID"], "16868053"
+            abstract["AbstractText"][0].attributes,
+            {"NlmCategory": "OBJECTIVE", "Label": "OBJECTIVES"},
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][5].attributes,
-            {"RefType": "Cites"},
+            abstract["AbstractText"][1],
+            "Self-reported lifetime pesticide use was obtained at cohort enrolment (1993-1997). Intensity-weighted lifetime days were computed for 33 pesticides, which adjusts cumulative days of pesticide use for factors that modify exposure (eg, use of personal protective equipment). Thyroid-stimulating hormone (TSH), thyroxine (T4), triiodothyronine (T3) and antithyroid peroxidase (anti-TPO) autoantibodies were measured in serum collected in 2010-2013. We used multivariate logistic regression to estimate ORs and 95% CIs for subclinical hypothyroidism (TSH &gt;4.5 mIU/L) compared with normal TSH (0.4-<u>&lt;</u>4.5 mIU/L) and for anti-TPO positivity. We also examined pesticide associations with TSH, T4 and T3 in multivariate linear regression models.",
         )
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][6]), 2
+            abstract["AbstractText"][1].attributes,
+            {"NlmCategory": "METHODS", "Label": "METHODS"},
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][6]["RefSource"],
-            "Endocrinology. 1998 Oct;139(10):4252-63",
+            abstract["AbstractText"][2],
+            "Higher exposure to the insecticide aldrin (third and fourth quartiles of intensity-weighted days vs no exposure) was positively associated with subclinical hypothyroidism (OR<sub>Q3</sub>=4.15, 95% CI 1.56 to 11.01, OR<sub>Q4</sub>=4.76, 95% CI 1.53 to 14.82, p<sub>trend</sub> &lt;0.01), higher TSH (p<sub>trend</sub>=0.01) and lower T4 (p<sub>trend</sub>=0.04). Higher exposure to the herbicide pendimethalin was associated with subclinical hypothyroidism (fourth quartile vs no exposure: OR<sub>Q4</sub>=2.78, 95% CI 1.30 to 5.95, p<sub>trend</sub>=0.02), higher TSH (p<sub>trend</sub>=0.04) and anti-TPO positivity (p<sub>trend</sub>=0.01). The fumigant methyl bromide was inversely associated with TSH (p<sub>trend</sub>=0.02) and positively associated with T4 (p<sub>trend</sub>=0.01).",
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][6]["PMID"], "9751507"
+            abstract["AbstractText"][2].attributes,
+            {"NlmCategory": "RESULTS", "Label": "RESULTS"},
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][6].attributes,
-            {"RefType": "Cites"},
+            abstract["AbstractText"][3],
+            "Our results suggest that long-term exposure to aldrin, pendimethalin and methyl bromide may alter thyroid function among male pesticide applicators.",
         )
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][7]), 2
+            abstract["AbstractText"][3].attributes,
+            {"NlmCategory": "CONCLUSIONS", "Label": "CONCLUSIONS"},
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][7]["RefSource"],
-            "Eur J Endocrinol. 2016 Apr;174(4):409-14",
+            abstract["CopyrightInformation"],
+            "\xa9 Article author(s) (or their employer(s) unless otherwise stated in the text of the article) 2018. All rights reserved. No commercial use is permitted unless otherwise expressly granted.",
         )
+        grants = article["GrantList"]
+        self.assertEqual(len(grants), 3)
+        expected_grants = [
+            (
+                {
+                    "Acronym": "CP",
+                    "Country": "United States",
+                    "Agency": "NCI NIH HHS",
+                    "GrantID": "Z01 CP010119",
+                },
+                {},
+            ),
+            (
+                {
+                    "Acronym": "ES",
+                    "Country": "United States",
+                    "Agency": "NIEHS NIH HHS",
+                    "GrantID": "Z01 ES049030",
+                },
+                {},
+            ),
+            (
+                {
+                    "Acronym": "NULL",
+                    "Country": "United States",
+                    "Agency": "Intramural NIH HHS",
+                    "GrantID": "Z99 CA999999",
+                },
+                {},
+            ),
+        ]
+        for grant, (fields, attributes) in zip(grants, expected_grants):
+            self.assertDictEqual(grant, fields)
+            self.assertEqual(grant.attributes, attributes)
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][7]["PMID"], "26863886"
+            grants.attributes,
+            {"CompleteYN": "Y"},
         )
+
+    def test_pubmed_html_mathml_tags(self):
+        """Test parsing XML returned by EFetch, PubMed database, with both HTML and MathML tags."""
+        # In PubMed display PMID 30108519 in xml retrieval mode, containing
+        # both HTML and MathML tags in the abstract text.
+        # To create the XML file, use
+        # >>> Bio.Entrez.efetch(db="pubmed", id='30108519', rettype="null",
+        #                       retmode="xml", parsed=True)
+        with open("Entrez/pubmed6.xml", "rb") as stream:
+            record = Entrez.read(stream)
+        self.assertEqual(len(record), 2)
+        self.assertEqual(record["PubmedBookArticle"], [])
+        self.assertEqual(len(record["PubmedArticle"]), 1)
+        pubmed_article = record["PubmedArticle"][0]
+        self.assertEqual(len(pubmed_article), 2)
+        pubmed_data = pubmed_article["PubmedData"]
+        self.assertEqual(len(pubmed_data), 3)
+        self.assertEqual(len(pubmed_data["ArticleIdList"]), 3)
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][7].attributes,
-            {"RefType": "Cites"},
+            [(entry, entry.attributes) for entry in pubmed_data["ArticleIdList"]],
+            [
+                ("30108519", {"IdType": "pubmed"}),
+                ("10.3389/fphys.2018.01034", {"IdType": "doi"}),
+                ("PMC6079548", {"IdType": "pmc"}),
+            ],
         )
+        self.assertEqual(pubmed_data["PublicationStatus"], "epublish")
+        self.assertEqual(len(pubmed_data["History"]), 5)
+        added = {"Year": "2018", "Month": "8", "Day": "16", "Hour": "6", "Minute": "0"}
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][8]), 2
+            [(entry, entry.attributes) for entry in pubmed_data["History"]],
+            [
+                (
+                    {"Year": "2018", "Month": "05", "Day": "22"},
+                    {"PubStatus": "received"},
+                ),
+                (
+                    {"Year": "2018", "Month": "07", "Day": "11"},
+                    {"PubStatus": "accepted"},
+                ),
+                (added, {"PubStatus": "entrez"}),
+                (added, {"PubStatus": "pubmed"}),
+                (
+                    {
+                        "Year": "2018",
+                        "Month": "8",
+                        "Day": "16",
+                        "Hour": "6",
+                        "Minute": "1",
+                    },
+                    {"PubStatus": "medline"},
+                ),
+            ],
         )
+        medline_citation = pubmed_article["MedlineCitation"]
+        self.assertEqual(len(medline_citation), 11)
+        self.assertEqual(medline_citation["GeneralNote"], [])
+        self.assertEqual(len(medline_citation["KeywordList"]), 1)
+        self.assertEqual(len(medline_citation["KeywordList"][0]), 8)
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][8]["RefSource"],
-            "Eur J Endocrinol. 2000 Nov;143(5):639-47",
+            [
+                (keyword, keyword.attributes)
+                for keyword in medline_citation["KeywordList"][0]
+            ],
+            [
+                ("Owles' point", {"MajorTopicYN": "N"}),
+                ("aerobic capacity", {"MajorTopicYN": "N"}),
+                ("aerobic threshold", {"MajorTopicYN": "N"}),
+                ("anaerobic threshold", {"MajorTopicYN": "N"}),
+                ("endurance assessment", {"MajorTopicYN": "N"}),
+                ("lactate threshold", {"MajorTopicYN": "N"}),
+                ("oxygen endurance performance limit", {"MajorTopicYN": "N"}),
+                ("submaximal exercise testing", {"MajorTopicYN": "N"}),
+            ],
         )
+        self.assertEqual(medline_citation["CitationSubset"], [])
+        self.assertEqual(medline_citation["OtherAbstract"], [])
+        self.assertEqual(medline_citation["OtherID"], [])
+        self.assertEqual(medline_citation["SpaceFlightMission"], [])
+        self.assertEqual(medline_citation["PMID"], "30108519")
+        self.assertEqual(medline_citation["PMID"].attributes, {"Version": "1"})
+        self.assertEqual(len(medline_citation["DateRevised"]), 3)
+        self.assertEqual(medline_citation["DateRevised"]["Year"], "2018")
+        self.assertEqual(medline_citation["DateRevised"]["Month"], "08")
+        self.assertEqual(medline_citation["DateRevised"]["Day"], "17")
+        self.assertEqual(medline_citation["DateRevised"].attributes, {})
+        self.assertEqual(len(medline_citation["MedlineJournalInfo"]), 4)
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][8]["PMID"], "11078988"
+            medline_citation["MedlineJournalInfo"]["Country"], "Switzerland"
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][8].attributes,
-            {"RefType": "Cites"},
+            medline_citation["MedlineJournalInfo"]["MedlineTA"], "Front Physiol"
         )
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][9]), 2
+            medline_citation["MedlineJournalInfo"]["NlmUniqueID"], "101549006"
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][9]["RefSource"],
-            "Environ Res. 2016 Nov;151:389-398",
+            medline_citation["MedlineJournalInfo"]["ISSNLinking"], "1664-042X"
         )
+        self.assertEqual(medline_citation["MedlineJournalInfo"].attributes, {})
+        comments_corrections = medline_citation["CommentsCorrectionsList"]
+        self.assertEqual(len(comments_corrections), 53)
+        cited = [
+            ("Stat Med. 2008 Feb 28;27(5):778-80", "17907247"),
+            ("Int J Sports Med. 2009 Jan;30(1):40-45", "19202577"),
+            ("Med Sci Sports Exerc. 1995 Jun;27(6):863-7", "7658947"),
+            ("Eur J Appl Physiol. 2010 Apr;108(6):1153-67", "20033207"),
+            ("Med Sci Sports Exerc. 1999 Apr;31(4):578-82", "10211855"),
+            ("Br J Sports Med. 1988 Jun;22(2):51-4", "3167501"),
+            ("Front Physiol. 2017 Jun 08;8:389", "28642717"),
+            ("Med Sci Sports Exerc. 1999 Sep;31(9):1342-5", "10487378"),
+            ("Med Sci Sports Exerc. 1998 Aug;30(8):1304-13", "9710874"),
+            ("Med Sci Sports. 1979 Winter;11(4):338-44", "530025"),
+            ("J Strength Cond Res. 2005 May;19(2):364-8", "15903376"),
+            ("Eur J Appl Physiol Occup Physiol. 1984;53(3):196-9", "6542852"),
+            ("Eur J Appl Physiol Occup Physiol. 1978 Oct 20;39(4):219-27", "710387"),
+            (
+                "J Appl Physiol Respir Environ Exerc Physiol. 1980 Mar;48(3):523-7",
+                "7372524",
+            ),
+            ("Int J Sports Med. 2015 Dec;36(14):1142-8", "26332904"),
+            ("J Physiol. 1930 Apr 14;69(2):214-37", "16994099"),
+            ("J Strength Cond Res. 2015 Oct;29(10):2794-801", "25844867"),
+            ("PLoS One. 2018 Mar 13;13(3):e0194313", "29534108"),
+            ("J Cardiopulm Rehabil Prev. 2012 Nov-Dec;32(6):327-50", "23103476"),
+            ("Exerc Sport Sci Rev. 1982;10:49-83", "6811284"),
+            ("Int J Sports Physiol Perform. 2010 Sep;5(3):276-91", "20861519"),
+            ("Eur J Appl Physiol Occup Physiol. 1990;60(4):249-53", "2357979"),
+            ("Med Sci Sports Exerc. 2004 Oct;36(10):1737-42", "15595295"),
+            ("Int J Sports Med. 2016 Jun;37(7):539-46", "27116348"),
+            ("Scand J Med Sci Sports. 2017 May;27(5):462-473", "28181710"),
+            ("Int J Sports Med. 1983 Nov;4(4):226-30", "6654546"),
+            ("J Appl Physiol (1985). 1988 Jun;64(6):2622-30", "3403447"),
+            ("Med Sci Sports Exerc. 2009 Jan;41(1):3-13", "19092709"),
+            ("Int J Sports Med. 2009 Sep;30(9):643-6", "19569005"),
+            ("Eur J Appl Physiol Occup Physiol. 1988;57(4):420-4", "3396556"),
+            ("J Physiol. 2004 Jul 1;558(Pt 1):5-30", "15131240"),
+            ("Int J Sports Med. 1990 Feb;11(1):26-32", "2318561"),
+            ("J Appl Physiol. 1973 Aug;35(2):236-43", "4723033"),
+            ("Int J Sports Med. 1987 Dec;8(6):401-6", "3429086"),
+            ("J Sci Med Sport. 2008 Jun;11(3):280-6", "17553745"),
+            (
+                "J Appl Physiol Respir Environ Exerc Physiol. 1984 May;56(5):1260-4",
+                "6725086",
+            ),
+            ("Int J Sports Med. 2008 Jun;29(6):475-9", "18302077"),
+            ("Med Sci Sports Exerc. 1985 Feb;17(1):22-34", "3884959"),
+            ("Sports Med. 2009;39(6):469-90", "19453206"),
+            ("Int J Sports Med. 2004 Aug;25(6):403-8", "15346226"),
+            ("J Sports Med Phys Fitness. 2004 Jun;44(2):132-40", "15470310"),
+            ("Int J Sports Med. 1985 Jun;6(3):117-30", "4030186"),
+            ("Int J Sports Med. 1999 Feb;20(2):122-7", "10190774"),
+            ("Int J Sports Med. 2006 May;27(5):368-72", "16729378"),
+            ("Int J Sports Med. 1985 Jun;6(3):109-16", "3897079"),
+            ("Pneumologie. 1990 Jan;44(1):2-13", "2408033"),
+            ("Eur J Appl Physiol. 2018 Apr;118(4):691-728", "29322250"),
+            (
+                "J Appl Physiol Respir Environ Exerc Physiol. 1983 Oct;55(4):1178-86",
+                "6629951",
+            ),
+            ("Sports Med. 2014 Nov;44 Suppl 2:S139-47", "25200666"),
+            ("Front Physiol. 2015 Oct 30;6:308", "26578980"),
+            ("Int J Sports Med. 2013 Mar;34(3):196-9", "22972242"),
+            ("Int J Sports Med. 1992 Oct;13(7):518-22", "1459746"),
+            ("Med Sci Sports Exerc. 1993 May;25(5):620-7", "8492691"),
+        ]
+        cites = {"RefType": "Cites"}
+        version = {"Version": "1"}
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][9]["PMID"], "27540871"
+            [
+                (
+                    len(entry),
+                    entry["RefSource"],
+                    entry["PMID"],
+                    entry["PMID"].attributes,
+                    entry.attributes,
+                )
+                for entry in comments_corrections
+            ],
+            [(2, ref_source, pmid, version, cites) for ref_source, pmid in cited],
         )
+        article = medline_citation["Article"]
+        self.assertEqual(len(article["ELocationID"]), 1)
+        self.assertEqual(article["ELocationID"][0], "10.3389/fphys.2018.01034")
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][9].attributes,
-            {"RefType": "Cites"},
+            article["ELocationID"][0].attributes, {"EIdType": "doi", "ValidYN": "Y"}
         )
+        self.assertEqual(len(article["ArticleDate"]), 1)
+        self.assertEqual(len(article["ArticleDate"][0]), 3)
+        self.assertEqual(article["ArticleDate"][0]["Year"], "2018")
+        self.assertEqual(article["ArticleDate"][0]["Month"], "07")
+        self.assertEqual(article["ArticleDate"][0]["Day"], "31")
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][10]), 2
+            article["ArticleDate"][0].attributes, {"DateType": "Electronic"}
         )
+        self.assertEqual(article["Language"], ["eng"])
+        journal = article["Journal"]
+        self.assertEqual(len(journal), 4)
+        self.assertEqual(journal["ISSN"], "1664-042X")
+        self.assertEqual(journal["ISSN"].attributes, {"IssnType": "Print"})
+        self.assertEqual(journal["JournalIssue"]["Volume"], "9")
+        self.assertEqual(journal["JournalIssue"]["PubDate"]["Year"], "2018")
+        self.assertEqual(journal["JournalIssue"]["PubDate"].attributes, {})
+        self.assertEqual(journal["JournalIssue"].attributes, {"CitedMedium": "Print"})
+        self.assertEqual(journal["Title"], "Frontiers in physiology")
+        self.assertEqual(journal["ISOAbbreviation"], "Front Physiol")
+        self.assertEqual(journal.attributes, {})
+        self.assertEqual(len(article["PublicationTypeList"]), 1)
+        self.assertEqual(article["PublicationTypeList"][0], "Journal Article")
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][10]["RefSource"],
-            "Am J Epidemiol. 2010 Jan 15;171(2):242-52",
+            article["PublicationTypeList"][0].attributes, {"UI": "D016428"}
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][10]["PMID"],
-            "19951937",
+            article["ArticleTitle"],
+            'A "<i>Blood Relationship"</i> Between the Overlooked Minimum Lactate Equivalent and Maximal Lactate Steady State in Trained Runners. Back to the Old Days?',
         )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][10].attributes,
-            {"RefType": "Cites"},
+        self.assertEqual(len(article["Pagination"]), 1)
+        self.assertEqual(article["Pagination"]["MedlinePgn"], "1034")
+        self.assertEqual(article["Pagination"].attributes, {})
+        authors = article["AuthorList"]
+        self.assertEqual(len(authors), 2)
+        navarre = "Studies, Research and Sports Medicine Center, Government of Navarre, Pamplona, Spain."
+        self.assertListEqual(
+            authors,
+            [
+                {
+                    "Identifier": [],
+                    "AffiliationInfo": [{"Identifier": [], "Affiliation": navarre}],
+                    "LastName": "Garcia-Tabar",
+                    "ForeName": "Ibai",
+                    "Initials": "I",
+                },
+                {
+                    "Identifier": [],
+                    "AffiliationInfo": [{"Identifier": [], "Affiliation": navarre}],
+                    "LastName": "Gorostiaga",
+                    "ForeName": "Esteban M",
+                    "Initials": "EM",
+                },
+            ],
         )
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][11]), 2
+            [author.attributes for author in authors], [{"ValidYN": "Y"}] * len(authors)
         )
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][11]["RefSource"],
-            "Thyroid. 1998 Sep;8(9):827-56",
+            [author["AffiliationInfo"][0].attributes for author in authors],
+            [{}] * len(authors),
         )
+        self.assertEqual(len(article["Abstract"]), 1)
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][11]["PMID"], "9777756"
+            article["Abstract"]["AbstractText"][0],
+            """\
+Maximal Lactate Steady State (MLSS) and Lactate Threshold (LT) are physiologically-related and fundamental concepts within the sports and exercise sciences. Literature supporting their relationship, however, is scarce. Among the recognized LTs, we were particularly interested in the disused "Minimum Lactate Equivalent" (LE<sub>min</sub>), first described in the early 1980s. We hypothesized that velocity at LT, conceptually comprehended as in the old days (LE<sub>min</sub>), could predict velocity at MLSS (<sub>V</sub>MLSS) more accurate than some other blood lactate-related thresholds (BL<sub>R</sub>Ts) routinely used nowadays by many sport science practitioners. Thirteen male endurance-trained [<sub>V</sub>MLSS 15.0 ± 1.1 km·h<sup>-1</sup>; maximal oxygen uptake ( <math xmlns="http://www.w3.org/1998/Math/MathML">
+                        <msub>
+                            <mrow>
+                                <mover>
+                                    <mrow>
+                                        <mi>V</mi>
+                                    </mrow>
+                                    <mo>.</mo>
+                                </mover>
+                                <mi>O</mi>
+                            </mrow>
+                            <mrow>
+                                <mn>2</mn>
+                                <mi>m</mi>
+                                <mi>a</mi>
+                                <mi>x</mi>
+                            </mrow>
+                        </msub>
+                    </math> ) 67.6 ± 4.1 ml·kg<sup>-1</sup>·min<sup>-1</sup>] homogeneous (coefficient of variation: ≈7%) runners conducted 1) a submaximal discontinuous incremental running test to determine several BL<sub>R</sub>Ts followed by a maximal ramp incremental running test for <math xmlns="http://www.w3.org/1998/Math/MathML">
+                        <msub>
+                            <mrow>
+                                <mover>
+                                    <mrow>
+                                        <mi>V</mi>
+                                    </mrow>
+                                    <mo>.</mo>
+                                </mover>
+                                <mi>O</mi>
+                            </mrow>
+                            <mrow>
+                                <mn>2</mn>
+                                <mi>m</mi>
+                                <mi>a</mi>
+                                <mi>x</mi>
+                            </mrow>
+                        </msub>
+                        <mtext> </mtext>
+                    </math> determination, and 2) several (4-5) constant velocity running tests to determine <sub>V</sub>MLSS with a precision of 0.20 km·h<sup>-1</sup>. Determined BL<sub>R</sub>Ts include LE<sub>min</sub> and LE<sub>min</sub>-related LE<sub>min</sub> plus 1 (LE<sub>min+1mM</sub>) and 1.5 mmol·L<sup>-1</sup> (LE<sub>min+1.5mM</sub>), along with well-established BL<sub>R</sub>Ts such as conventionally-calculated LT, D<sub>max</sub> and fixed blood lactate concentration thresholds. LE<sub>min</sub> did not differ from LT (<i>P</i> = 0.71; ES: 0.08) and was 27% lower than MLSS (<i>P</i> < 0.001; ES: 3.54). LE<sub>min+1mM</sub> was not different from MLSS (<i>P</i> = 0.47; ES: 0.09). LE<sub>min</sub> was the best predictor of <sub>V</sub>MLSS (<i>r</i> = 0.91; <i>P</i> < 0.001; SEE = 0.47 km·h<sup>-1</sup>), followed by LE<sub>min+1mM</sub> (<i>r</i> = 0.86; <i>P</i> < 0.001; SEE = 0.58 km·h<sup>-1</sup>) and LE<sub>min+1.5mM</sub> (<i>r</i> = 0.84; <i>P</i> < 0.001; SEE = 0.86 km·h<sup>-1</sup>). There was no statistical difference between MLSS and estimated MLSS using LE<sub>min</sub> prediction formula (<i>P</i> = 0.99; ES: 0.001). Mean bias and limits of agreement were 0.00 ± 0.45 km·h<sup>-1</sup> and ±0.89 km·h<sup>-1</sup>. Additionally, LE<sub>min</sub>, LE<sub>min+1mM</sub> and LE<sub>min+1.5mM</sub> were the best predictors of <math xmlns="http://www.w3.org/1998/Math/MathML">
+                        <msub>
+                            <mrow>
+                                <mover>
+                                    <mrow>
+                                        <mi>V</mi>
+                                    </mrow>
+                                    <mo>.</mo>
+                                </mover>
+                                <mi>O</mi>
+                            </mrow>
+                            <mrow>
+                                <mn>2</mn>
+                                <mi>m</mi>
+                                <mi>a</mi>
+                                <mi>x</mi>
+                            </mrow>
+                        </msub>
+                    </math> (<i>r</i> = 0.72-0.79; <i>P</i> < 0.001). These results support LE<sub>min</sub>, an objective submaximal overlooked and underused BL<sub>R</sub>T, to be one of the best single MLSS predictors in endurance trained runners. Our study advocates factors controlling LE<sub>min</sub> to be shared, at least partly, with those controlling MLSS.""",
         )
+
+    def test_pubmed_mathml_tags(self):
+        """Test parsing XML returned by EFetch, PubMed database, with extensive MathML tags."""
+        # In PubMed display PMID 29963580 in xml retrieval mode, containing
+        # extensive MathML tags in the abstract text.
+        # To create the XML file, use
+        # >>> Bio.Entrez.efetch(db="pubmed", id="29963580", retmode="xml")
+        with open("Entrez/pubmed7.xml", "rb") as stream:
+            record = Entrez.read(stream)
+        self.assertEqual(len(record), 2)
+        self.assertEqual(record["PubmedBookArticle"], [])
+        self.assertEqual(len(record["PubmedArticle"]), 1)
+        pubmed_article = record["PubmedArticle"][0]
+        self.assertEqual(len(pubmed_article), 2)
+        medline_citation = pubmed_article["MedlineCitation"]
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][11].attributes,
-            {"RefType": "Cites"},
+            medline_citation.attributes,
+            {"Status": "PubMed-not-MEDLINE", "Owner": "NLM"},
         )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][12]), 2
+        self.assertEqual(medline_citation["PMID"], "29963580")
+        self.assertEqual(medline_citation["PMID"].attributes, {"Version": "1"})
+        self.assertEqual(medline_citation["DateRevised"].attributes, {})
+        self.assertDictEqual(
+            medline_citation["DateRevised"],
+            {"Year": "2018", "Month": "11", "Day": "14"},
         )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][12]["RefSource"],
-            "Curr Opin Pharmacol. 2001 Dec;1(6):626-31",
+        article = medline_citation["Article"]
+        self.assertEqual(article.attributes, {"PubModel": "Print-Electronic"})
+        journal = article["Journal"]
+        self.assertEqual(journal.attributes, {})
+        self.assertEqual(journal["ISSN"].attributes, {"IssnType": "Print"})
+        self.assertEqual(journal["ISSN"], "2329-4302")
+        journal_issue = journal["JournalIssue"]
+        self.assertEqual(journal_issue.attributes, {"CitedMedium": "Print"})
+        self.assertDictEqual(
+            journal_issue,
+            {"Volume": "5", "Issue": "2", "PubDate": {"Year": "2018", "Month": "Apr"}},
+        )
+        self.assertEqual(
+            journal["Title"],
+            "Journal of medical imaging (Bellingham, Wash.)",
         )
+        self.assertEqual(journal["ISOAbbreviation"], "J Med Imaging (Bellingham)")
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][12]["PMID"],
-            "11757819",
+            article["ArticleTitle"],
+            "Development of a pulmonary imaging biomarker pipeline for phenotyping of chronic lung disease.",
         )
+        self.assertDictEqual(article["Pagination"], {"MedlinePgn": "026002"})
+        self.assertEqual(len(article["ELocationID"]), 1)
         self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][12].attributes,
-            {"RefType": "Cites"},
+            article["ELocationID"][0].attributes,
+            {"EIdType": "doi", "ValidYN": "Y"},
         )
+        self.assertEqual(article["ELocationID"][0], "10.1117/1.JMI.5.2.026002")
+        self.assertEqual(len(article["Abstract"]), 1)
+        self.assertEqual(len(article["Abstract"]["AbstractText"]), 1)
         self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][13]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][13]["RefSource"],
-            "Breast Cancer Res Treat. 2012 Jun;133(3):1169-77",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][13]["PMID"],
-            "22434524",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][13].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][14]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][14]["RefSource"],
-            "Int J Environ Res Public Health. 2011 Dec;8(12 ):4608-22",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][14]["PMID"],
-            "22408592",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][14].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][15]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][15]["RefSource"],
-            "Ann Oncol. 2014 Oct;25(10):2025-30",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][15]["PMID"],
-            "25081899",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][15].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][16]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][16]["RefSource"],
-            "Environ Health. 2006 Dec 06;5:32",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][16]["PMID"],
-            "17147831",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][16].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][17]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][17]["RefSource"],
-            "Environ Health Perspect. 1998 Aug;106(8):437-45",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][17]["PMID"], "9681970"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][17].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][18]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][18]["RefSource"],
-            "Arch Intern Med. 2000 Feb 28;160(4):526-34",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][18]["PMID"],
-            "10695693",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][18].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][19]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][19]["RefSource"],
-            "Endocrine. 2011 Jun;39(3):259-65",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][19]["PMID"],
-            "21161440",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][19].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][20]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][20]["RefSource"],
-            "Cancer Epidemiol Biomarkers Prev. 2008 Aug;17(8):1880-3",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][20]["PMID"],
-            "18708375",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][20].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][21]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][21]["RefSource"],
-            "Am J Epidemiol. 2010 Feb 15;171(4):455-64",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][21]["PMID"],
-            "20061368",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][21].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][22]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][22]["RefSource"],
-            "J Clin Endocrinol Metab. 2002 Feb;87(2):489-99",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][22]["PMID"],
-            "11836274",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][22].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][23]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][23]["RefSource"],
-            "J Toxicol Environ Health A. 2015 ;78(21-22):1338-47",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][23]["PMID"],
-            "26555155",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][23].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][24]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][24]["RefSource"],
-            "Toxicol Sci. 2002 Jun;67(2):207-18",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][24]["PMID"],
-            "12011480",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][24].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][25]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][25]["RefSource"],
-            "Natl Cancer Inst Carcinog Tech Rep Ser. 1978;21:1-184",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][25]["PMID"],
-            "12844187",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][25].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][26]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][26]["RefSource"],
-            "Environ Res. 2013 Nov;127:7-15",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][26]["PMID"],
-            "24183346",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][26].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][27]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][27]["RefSource"],
-            "JAMA. 2004 Jan 14;291(2):228-38",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][27]["PMID"],
-            "14722150",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][27].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][28]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][28]["RefSource"],
-            "J Expo Sci Environ Epidemiol. 2010 Sep;20(6):559-69",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][28]["PMID"],
-            "19888312",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][28].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][29]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][29]["RefSource"],
-            "Environ Health Perspect. 1996 Apr;104(4):362-9",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][29]["PMID"], "8732939"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][29].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][30]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][30]["RefSource"],
-            "Lancet. 2012 Mar 24;379(9821):1142-54",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][30]["PMID"],
-            "22273398",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][30].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][31]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][31]["RefSource"],
-            "JAMA. 1995 Mar 8;273(10):808-12",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][31]["PMID"], "7532241"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][31].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][32]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][32]["RefSource"],
-            "Sci Total Environ. 2002 Aug 5;295(1-3):207-15",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][32]["PMID"],
-            "12186288",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][32].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][33]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][33]["RefSource"],
-            "Eur J Endocrinol. 2006 May;154(5):599-611",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][33]["PMID"],
-            "16645005",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][33].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][34]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][34]["RefSource"],
-            "J Occup Environ Med. 2013 Oct;55(10):1171-8",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][34]["PMID"],
-            "24064777",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][34].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][35]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][35]["RefSource"],
-            "Thyroid. 2007 Sep;17(9):811-7",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][35]["PMID"],
-            "17956155",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][35].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][36]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][36]["RefSource"],
-            "Rev Environ Contam Toxicol. 1991;120:1-82",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][36]["PMID"], "1899728"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][36].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][37]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][37]["RefSource"],
-            "Environ Health Perspect. 1997 Oct;105(10):1126-30",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][37]["PMID"], "9349837"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][37].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][38]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][38]["RefSource"],
-            "J Biochem Mol Toxicol. 2005;19(3):175",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][38]["PMID"],
-            "15977190",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][38].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["CommentsCorrectionsList"][39]), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][39]["RefSource"],
-            "Immunogenetics. 2002 Jun;54(3):141-57",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][39]["PMID"],
-            "12073143",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["CommentsCorrectionsList"][39].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(article["MedlineCitation"]["DateRevised"]["Year"], "2018")
-        self.assertEqual(article["MedlineCitation"]["DateRevised"]["Month"], "04")
-        self.assertEqual(article["MedlineCitation"]["DateRevised"]["Day"], "25")
-        self.assertEqual(len(article["MedlineCitation"]["DateRevised"].attributes), 0)
-        self.assertEqual(len(article["MedlineCitation"]["GeneralNote"]), 0)
-        self.assertEqual(len(article["MedlineCitation"]["KeywordList"]), 1)
-        self.assertEqual(len(article["MedlineCitation"]["KeywordList"][0]), 5)
-        self.assertEqual(article["MedlineCitation"]["KeywordList"][0][0], "agriculture")
-        self.assertEqual(
-            article["MedlineCitation"]["KeywordList"][0][0].attributes,
-            {"MajorTopicYN": "N"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["KeywordList"][0][1], "hypothyroidism"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["KeywordList"][0][1].attributes,
-            {"MajorTopicYN": "N"},
-        )
-        self.assertEqual(article["MedlineCitation"]["KeywordList"][0][2], "pesticides")
-        self.assertEqual(
-            article["MedlineCitation"]["KeywordList"][0][2].attributes,
-            {"MajorTopicYN": "N"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["KeywordList"][0][3], "thyroid disease"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["KeywordList"][0][3].attributes,
-            {"MajorTopicYN": "N"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["KeywordList"][0][4],
-            "thyroid stimulating hormone",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["KeywordList"][0][4].attributes,
-            {"MajorTopicYN": "N"},
-        )
-        self.assertEqual(len(article["MedlineCitation"]["MedlineJournalInfo"]), 4)
-        self.assertEqual(
-            article["MedlineCitation"]["MedlineJournalInfo"]["MedlineTA"],
-            "Occup Environ Med",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["MedlineJournalInfo"]["Country"], "England"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["MedlineJournalInfo"]["NlmUniqueID"], "9422759"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["MedlineJournalInfo"]["ISSNLinking"], "1351-0711"
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["MedlineJournalInfo"].attributes), 0
-        )
-        self.assertEqual(len(article["MedlineCitation"]["OtherAbstract"]), 0)
-        self.assertEqual(len(article["MedlineCitation"]["OtherID"]), 0)
-        self.assertEqual(article["MedlineCitation"]["PMID"], "28775130")
-        self.assertEqual(len(article["MedlineCitation"]["SpaceFlightMission"]), 0)
-        self.assertEqual(len(article["MedlineCitation"]["Article"]["ArticleDate"]), 1)
-        self.assertEqual(
-            len(article["MedlineCitation"]["Article"]["ArticleDate"][0]), 3
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["ArticleDate"][0]["Month"], "08"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["ArticleDate"][0]["Day"], "03"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["ArticleDate"][0]["Year"], "2017"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["ArticleDate"][0].attributes,
-            {"DateType": "Electronic"},
-        )
-        self.assertEqual(len(article["MedlineCitation"]["Article"]["Pagination"]), 1)
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Pagination"]["MedlinePgn"], "79-89"
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["Article"]["Pagination"].attributes), 0
-        )
-        self.assertEqual(len(article["MedlineCitation"]["Article"]["AuthorList"]), 12)
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][0]["LastName"], "Lerro"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][0]["Initials"], "CC"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][0]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][0][
-                    "AffiliationInfo"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][0]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "Division of Cancer Epidemiology and Genetics, National Cancer Institute, Rockville, Maryland, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][0]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][0][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][0]["ForeName"],
-            "Catherine C",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][0].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][1]["LastName"],
-            "Beane Freeman",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][1]["Initials"], "LE"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][1]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][1][
-                    "AffiliationInfo"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][1]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "Division of Cancer Epidemiology and Genetics, National Cancer Institute, Rockville, Maryland, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][1]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][1][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][1]["ForeName"],
-            "Laura E",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][1].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][2]["LastName"],
-            "DellaValle",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][2]["Initials"], "CT"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][2]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][2][
-                    "AffiliationInfo"
-                ]
-            ),
-            2,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][2]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "Division of Cancer Epidemiology and Genetics, National Cancer Institute, Rockville, Maryland, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][2]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][2][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][2]["AffiliationInfo"][
-                1
-            ]["Affiliation"],
-            "Environmental Working Group, Washington, DC, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][2]["AffiliationInfo"][
-                1
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][2][
-                    "AffiliationInfo"
-                ][1].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][2]["ForeName"], "Curt T"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][2].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][3]["LastName"],
-            "Kibriya",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][3]["Initials"], "MG"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][3]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][3][
-                    "AffiliationInfo"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][3]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "Department of Public Health Sciences, The University of Chicago, Chicago, Illinois, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][3]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][3][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][3]["ForeName"],
-            "Muhammad G",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][3].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][4]["LastName"],
-            "Aschebrook-Kilfoy",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][4]["Initials"], "B"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][4]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][4][
-                    "AffiliationInfo"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][4]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "Department of Public Health Sciences, The University of Chicago, Chicago, Illinois, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][4]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][4][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][4]["ForeName"],
-            "Briseis",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][4].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][5]["LastName"],
-            "Jasmine",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][5]["Initials"], "F"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][5]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][5][
-                    "AffiliationInfo"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][5]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "Department of Public Health Sciences, The University of Chicago, Chicago, Illinois, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][5]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][5][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][5]["ForeName"],
-            "Farzana",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][5].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][6]["LastName"],
-            "Koutros",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][6]["Initials"], "S"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][6]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][6][
-                    "AffiliationInfo"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][6]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "Division of Cancer Epidemiology and Genetics, National Cancer Institute, Rockville, Maryland, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][6]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][6][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][6]["ForeName"], "Stella"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][6].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][7]["LastName"], "Parks"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][7]["Initials"], "CG"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][7]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][7][
-                    "AffiliationInfo"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][7]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "National Institute of Environmental Health Sciences, Research Triangle Park, North Carolina, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][7]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][7][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][7]["ForeName"],
-            "Christine G",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][7].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][8]["LastName"],
-            "Sandler",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][8]["Initials"], "DP"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][8]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][8][
-                    "AffiliationInfo"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][8]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "National Institute of Environmental Health Sciences, Research Triangle Park, North Carolina, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][8]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][8][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][8]["ForeName"], "Dale P"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][8].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][9]["LastName"],
-            "Alavanja",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][9]["Initials"], "MCR"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][9]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][9][
-                    "AffiliationInfo"
-                ]
-            ),
-            2,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][9]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "Division of Cancer Epidemiology and Genetics, National Cancer Institute, Rockville, Maryland, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][9]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][9][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][9]["AffiliationInfo"][
-                1
-            ]["Affiliation"],
-            "Department of Biology, Hood College, Frederick, Maryland, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][9]["AffiliationInfo"][
-                1
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][9][
-                    "AffiliationInfo"
-                ][1].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][9]["ForeName"],
-            "Michael C R",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][9].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][10]["LastName"],
-            "Hofmann",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][10]["Initials"], "JN"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][10]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][10][
-                    "AffiliationInfo"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][10]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "Division of Cancer Epidemiology and Genetics, National Cancer Institute, Rockville, Maryland, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][10]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][10][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][10]["ForeName"],
-            "Jonathan N",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][10].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][11]["LastName"], "Ward"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][11]["Initials"], "MH"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][11]["Identifier"], []
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][11][
-                    "AffiliationInfo"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][11]["AffiliationInfo"][
-                0
-            ]["Affiliation"],
-            "Division of Cancer Epidemiology and Genetics, National Cancer Institute, Rockville, Maryland, USA.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][11]["AffiliationInfo"][
-                0
-            ]["Identifier"],
-            [],
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["AuthorList"][11][
-                    "AffiliationInfo"
-                ][0].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][11]["ForeName"],
-            "Mary H",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["AuthorList"][11].attributes,
-            {"ValidYN": "Y"},
-        )
-        self.assertEqual(len(article["MedlineCitation"]["Article"]["Language"]), 1)
-        self.assertEqual(article["MedlineCitation"]["Article"]["Language"][0], "eng")
-        self.assertEqual(
-            len(article["MedlineCitation"]["Article"]["PublicationTypeList"]), 1
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["PublicationTypeList"][0],
-            "Journal Article",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["PublicationTypeList"][0].attributes,
-            {"UI": "D016428"},
-        )
-        self.assertEqual(len(article["MedlineCitation"]["Article"]["Journal"]), 4)
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Journal"]["ISSN"], "1470-7926"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Journal"]["ISSN"].attributes,
-            {"IssnType": "Electronic"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Journal"]["ISOAbbreviation"],
-            "Occup Environ Med",
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"]), 3
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"]["Volume"],
-            "75",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"]["Issue"],
-            "2",
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"][
-                    "PubDate"
-                ]
-            ),
-            2,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"]["PubDate"][
-                "Month"
-            ],
-            "Feb",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"]["PubDate"][
-                "Year"
-            ],
-            "2018",
-        )
-        self.assertEqual(
-            len(
-                article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"][
-                    "PubDate"
-                ].attributes
-            ),
-            0,
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"].attributes,
-            {"CitedMedium": "Internet"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Journal"]["Title"],
-            "Occupational and environmental medicine",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Journal"]["ISSN"].attributes,
-            {"IssnType": "Electronic"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["ArticleTitle"],
-            "Occupational pesticide exposure and subclinical hypothyroidism among male pesticide applicators.",
-        )
-        self.assertEqual(len(article["MedlineCitation"]["Article"]["ELocationID"]), 1)
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["ELocationID"][0],
-            "10.1136/oemed-2017-104431",
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["Article"]["ELocationID"][0].attributes), 2
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["ELocationID"][0].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["ELocationID"][0].attributes[
-                "EIdType"
-            ],
-            "doi",
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"]), 4
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"][0],
-            "Animal studies suggest that exposure to pesticides may alter thyroid function; however, few epidemiologic studies have examined this association. We evaluated the relationship between individual pesticides and thyroid function in 679 men enrolled in a substudy of the Agricultural Health Study, a cohort of licensed pesticide applicators.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"][
-                0
-            ].attributes,
-            {"NlmCategory": "OBJECTIVE", "Label": "OBJECTIVES"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"][1],
-            "Self-reported lifetime pesticide use was obtained at cohort enrolment (1993-1997). Intensity-weighted lifetime days were computed for 33 pesticides, which adjusts cumulative days of pesticide use for factors that modify exposure (eg, use of personal protective equipment). Thyroid-stimulating hormone (TSH), thyroxine (T4), triiodothyronine (T3) and antithyroid peroxidase (anti-TPO) autoantibodies were measured in serum collected in 2010-2013. We used multivariate logistic regression to estimate ORs and 95% CIs for subclinical hypothyroidism (TSH &gt;4.5 mIU/L) compared with normal TSH (0.4-<u>&lt;</u>4.5 mIU/L) and for anti-TPO positivity. We also examined pesticide associations with TSH, T4 and T3 in multivariate linear regression models.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"][
-                1
-            ].attributes,
-            {"NlmCategory": "METHODS", "Label": "METHODS"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"][2],
-            "Higher exposure to the insecticide aldrin (third and fourth quartiles of intensity-weighted days vs no exposure) was positively associated with subclinical hypothyroidism (OR<sub>Q3</sub>=4.15, 95% CI 1.56 to 11.01, OR<sub>Q4</sub>=4.76, 95% CI 1.53 to 14.82, p<sub>trend</sub> &lt;0.01), higher TSH (p<sub>trend</sub>=0.01) and lower T4 (p<sub>trend</sub>=0.04). Higher exposure to the herbicide pendimethalin was associated with subclinical hypothyroidism (fourth quartile vs no exposure: OR<sub>Q4</sub>=2.78, 95% CI 1.30 to 5.95, p<sub>trend</sub>=0.02), higher TSH (p<sub>trend</sub>=0.04) and anti-TPO positivity (p<sub>trend</sub>=0.01). The fumigant methyl bromide was inversely associated with TSH (p<sub>trend</sub>=0.02) and positively associated with T4 (p<sub>trend</sub>=0.01).",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"][
-                2
-            ].attributes,
-            {"NlmCategory": "RESULTS", "Label": "RESULTS"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"][3],
-            "Our results suggest that long-term exposure to aldrin, pendimethalin and methyl bromide may alter thyroid function among male pesticide applicators.",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"][
-                3
-            ].attributes,
-            {"NlmCategory": "CONCLUSIONS", "Label": "CONCLUSIONS"},
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["Abstract"]["CopyrightInformation"],
-            "\xa9 Article author(s) (or their employer(s) unless otherwise stated in the text of the article) 2018. All rights reserved. No commercial use is permitted unless otherwise expressly granted.",
-        )
-        self.assertEqual(len(article["MedlineCitation"]["Article"]["GrantList"]), 3)
-        self.assertEqual(len(article["MedlineCitation"]["Article"]["GrantList"][0]), 4)
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][0]["Acronym"], "CP"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][0]["Country"],
-            "United States",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][0]["Agency"],
-            "NCI NIH HHS",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][0]["GrantID"],
-            "Z01 CP010119",
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["Article"]["GrantList"][0].attributes), 0
-        )
-        self.assertEqual(len(article["MedlineCitation"]["Article"]["GrantList"][1]), 4)
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][1]["Acronym"], "ES"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][1]["Country"],
-            "United States",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][1]["Agency"],
-            "NIEHS NIH HHS",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][1]["GrantID"],
-            "Z01 ES049030",
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["Article"]["GrantList"][1].attributes), 0
-        )
-        self.assertEqual(len(article["MedlineCitation"]["Article"]["GrantList"][2]), 4)
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][2]["Acronym"], "NULL"
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][2]["Country"],
-            "United States",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][2]["Agency"],
-            "Intramural NIH HHS",
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"][2]["GrantID"],
-            "Z99 CA999999",
-        )
-        self.assertEqual(
-            len(article["MedlineCitation"]["Article"]["GrantList"][2].attributes), 0
-        )
-        self.assertEqual(
-            article["MedlineCitation"]["Article"]["GrantList"].attributes,
-            {"CompleteYN": "Y"},
-        )
-
-    def test_pubmed_html_mathml_tags(self):
-        """Test parsing XML returned by EFetch, PubMed database, with both HTML and MathML tags."""
-        # In PubMed display PMID 30108519 in xml retrieval mode, containing
-        # both HTML and MathML tags in the abstract text.
-        # To create the XML file, use
-        # >>> Bio.Entrez.efetch(db="pubmed", id='30108519', rettype="null",
-        #                       retmode="xml", parsed=True)
-        with open("Entrez/pubmed6.xml", "rb") as stream:
-            record = Entrez.read(stream)
-        self.assertEqual(len(record), 2)
-        self.assertEqual(record["PubmedBookArticle"], [])
-        self.assertEqual(len(record["PubmedArticle"]), 1)
-        pubmed_article = record["PubmedArticle"][0]
-        self.assertEqual(len(pubmed_article), 2)
-        self.assertEqual(len(pubmed_article["PubmedData"]), 3)
-        self.assertEqual(len(pubmed_article["PubmedData"]["ArticleIdList"]), 3)
-        self.assertEqual(pubmed_article["PubmedData"]["ArticleIdList"][0], "30108519")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["ArticleIdList"][0].attributes,
-            {"IdType": "pubmed"},
-        )
-        self.assertEqual(
-            pubmed_article["PubmedData"]["ArticleIdList"][1], "10.3389/fphys.2018.01034"
-        )
-        self.assertEqual(
-            pubmed_article["PubmedData"]["ArticleIdList"][1].attributes,
-            {"IdType": "doi"},
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["ArticleIdList"][2], "PMC6079548")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["ArticleIdList"][2].attributes,
-            {"IdType": "pmc"},
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["PublicationStatus"], "epublish")
-        self.assertEqual(len(pubmed_article["PubmedData"]["History"]), 5)
-        self.assertEqual(len(pubmed_article["PubmedData"]["History"][0]), 3)
-        self.assertEqual(pubmed_article["PubmedData"]["History"][0]["Year"], "2018")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][0]["Month"], "05")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][0]["Day"], "22")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][0].attributes,
-            {"PubStatus": "received"},
-        )
-        self.assertEqual(len(pubmed_article["PubmedData"]["History"][1]), 3)
-        self.assertEqual(pubmed_article["PubmedData"]["History"][1]["Year"], "2018")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][1]["Month"], "07")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][1]["Day"], "11")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][1].attributes,
-            {"PubStatus": "accepted"},
-        )
-        self.assertEqual(len(pubmed_article["PubmedData"]["History"][2]), 5)
-        self.assertEqual(pubmed_article["PubmedData"]["History"][2]["Year"], "2018")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][2]["Month"], "8")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][2]["Day"], "16")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][2]["Hour"], "6")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][2]["Minute"], "0")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][2].attributes,
-            {"PubStatus": "entrez"},
-        )
-        self.assertEqual(len(pubmed_article["PubmedData"]["History"][3]), 5)
-        self.assertEqual(pubmed_article["PubmedData"]["History"][3]["Year"], "2018")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][3]["Month"], "8")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][3]["Day"], "16")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][3]["Hour"], "6")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][3]["Minute"], "0")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][3].attributes,
-            {"PubStatus": "pubmed"},
-        )
-        self.assertEqual(len(pubmed_article["PubmedData"]["History"][4]), 5)
-        self.assertEqual(pubmed_article["PubmedData"]["History"][4]["Year"], "2018")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][4]["Month"], "8")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][4]["Day"], "16")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][4]["Hour"], "6")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][4]["Minute"], "1")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][4].attributes,
-            {"PubStatus": "medline"},
-        )
-        medline_citation = pubmed_article["MedlineCitation"]
-        self.assertEqual(len(medline_citation), 11)
-        self.assertEqual(medline_citation["GeneralNote"], [])
-        self.assertEqual(len(medline_citation["KeywordList"]), 1)
-        self.assertEqual(len(medline_citation["KeywordList"][0]), 8)
-        self.assertEqual(medline_citation["KeywordList"][0][0], "Owles' point")
-        self.assertEqual(
-            medline_citation["KeywordList"][0][0].attributes, {"MajorTopicYN": "N"}
-        )
-        self.assertEqual(medline_citation["KeywordList"][0][1], "aerobic capacity")
-        self.assertEqual(
-            medline_citation["KeywordList"][0][1].attributes, {"MajorTopicYN": "N"}
-        )
-        self.assertEqual(medline_citation["KeywordList"][0][2], "aerobic threshold")
-        self.assertEqual(
-            medline_citation["KeywordList"][0][2].attributes, {"MajorTopicYN": "N"}
-        )
-        self.assertEqual(medline_citation["KeywordList"][0][3], "anaerobic threshold")
-        self.assertEqual(
-            medline_citation["KeywordList"][0][3].attributes, {"MajorTopicYN": "N"}
-        )
-        self.assertEqual(medline_citation["KeywordList"][0][4], "endurance assessment")
-        self.assertEqual(
-            medline_citation["KeywordList"][0][4].attributes, {"MajorTopicYN": "N"}
-        )
-        self.assertEqual(medline_citation["KeywordList"][0][5], "lactate threshold")
-        self.assertEqual(
-            medline_citation["KeywordList"][0][5].attributes, {"MajorTopicYN": "N"}
-        )
-        self.assertEqual(
-            medline_citation["KeywordList"][0][6], "oxygen endurance performance limit"
-        )
-        self.assertEqual(
-            medline_citation["KeywordList"][0][6].attributes, {"MajorTopicYN": "N"}
-        )
-        self.assertEqual(
-            medline_citation["KeywordList"][0][7], "submaximal exercise testing"
-        )
-        self.assertEqual(
-            medline_citation["KeywordList"][0][7].attributes, {"MajorTopicYN": "N"}
-        )
-        self.assertEqual(medline_citation["CitationSubset"], [])
-        self.assertEqual(medline_citation["OtherAbstract"], [])
-        self.assertEqual(medline_citation["OtherID"], [])
-        self.assertEqual(medline_citation["SpaceFlightMission"], [])
-        self.assertEqual(medline_citation["PMID"], "30108519")
-        self.assertEqual(medline_citation["PMID"].attributes, {"Version": "1"})
-        self.assertEqual(len(medline_citation["DateRevised"]), 3)
-        self.assertEqual(medline_citation["DateRevised"]["Year"], "2018")
-        self.assertEqual(medline_citation["DateRevised"]["Month"], "08")
-        self.assertEqual(medline_citation["DateRevised"]["Day"], "17")
-        self.assertEqual(medline_citation["DateRevised"].attributes, {})
-        self.assertEqual(len(medline_citation["MedlineJournalInfo"]), 4)
-        self.assertEqual(
-            medline_citation["MedlineJournalInfo"]["Country"], "Switzerland"
-        )
-        self.assertEqual(
-            medline_citation["MedlineJournalInfo"]["MedlineTA"], "Front Physiol"
-        )
-        self.assertEqual(
-            medline_citation["MedlineJournalInfo"]["NlmUniqueID"], "101549006"
-        )
-        self.assertEqual(
-            medline_citation["MedlineJournalInfo"]["ISSNLinking"], "1664-042X"
-        )
-        self.assertEqual(medline_citation["MedlineJournalInfo"].attributes, {})
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"]), 53)
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][0]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][0]["RefSource"],
-            "Stat Med. 2008 Feb 28;27(5):778-80",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][0]["PMID"], "17907247"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][0]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][0].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][1]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][1]["RefSource"],
-            "Int J Sports Med. 2009 Jan;30(1):40-45",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][1]["PMID"], "19202577"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][1]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][1].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][2]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][2]["RefSource"],
-            "Med Sci Sports Exerc. 1995 Jun;27(6):863-7",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][2]["PMID"], "7658947"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][2]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][2].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][3]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][3]["RefSource"],
-            "Eur J Appl Physiol. 2010 Apr;108(6):1153-67",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][3]["PMID"], "20033207"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][3]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][3].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][4]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][4]["RefSource"],
-            "Med Sci Sports Exerc. 1999 Apr;31(4):578-82",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][4]["PMID"], "10211855"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][4]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][4].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][5]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][5]["RefSource"],
-            "Br J Sports Med. 1988 Jun;22(2):51-4",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][5]["PMID"], "3167501"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][5]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][5].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][6]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][6]["RefSource"],
-            "Front Physiol. 2017 Jun 08;8:389",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][6]["PMID"], "28642717"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][6]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][6].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][7]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][7]["RefSource"],
-            "Med Sci Sports Exerc. 1999 Sep;31(9):1342-5",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][7]["PMID"], "10487378"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][7]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][7].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][8]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][8]["RefSource"],
-            "Med Sci Sports Exerc. 1998 Aug;30(8):1304-13",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][8]["PMID"], "9710874"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][8]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][8].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][9]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][9]["RefSource"],
-            "Med Sci Sports. 1979 Winter;11(4):338-44",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][9]["PMID"], "530025"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][9]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][9].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][10]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][10]["RefSource"],
-            "J Strength Cond Res. 2005 May;19(2):364-8",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][10]["PMID"], "15903376"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][10]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][10].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][11]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][11]["RefSource"],
-            "Eur J Appl Physiol Occup Physiol. 1984;53(3):196-9",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][11]["PMID"], "6542852"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][11]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][11].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][12]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][12]["RefSource"],
-            "Eur J Appl Physiol Occup Physiol. 1978 Oct 20;39(4):219-27",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][12]["PMID"], "710387"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][12]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][12].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][13]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][13]["RefSource"],
-            "J Appl Physiol Respir Environ Exerc Physiol. 1980 Mar;48(3):523-7",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][13]["PMID"], "7372524"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][13]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][13].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][14]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][14]["RefSource"],
-            "Int J Sports Med. 2015 Dec;36(14):1142-8",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][14]["PMID"], "26332904"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][14]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][14].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][15]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][15]["RefSource"],
-            "J Physiol. 1930 Apr 14;69(2):214-37",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][15]["PMID"], "16994099"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][15]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][15].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][16]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][16]["RefSource"],
-            "J Strength Cond Res. 2015 Oct;29(10):2794-801",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][16]["PMID"], "25844867"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][16]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][16].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][17]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][17]["RefSource"],
-            "PLoS One. 2018 Mar 13;13(3):e0194313",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][17]["PMID"], "29534108"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][17]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][17].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][18]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][18]["RefSource"],
-            "J Cardiopulm Rehabil Prev. 2012 Nov-Dec;32(6):327-50",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][18]["PMID"], "23103476"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][18]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][18].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][19]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][19]["RefSource"],
-            "Exerc Sport Sci Rev. 1982;10:49-83",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][19]["PMID"], "6811284"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][19]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][19].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][20]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][20]["RefSource"],
-            "Int J Sports Physiol Perform. 2010 Sep;5(3):276-91",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][20]["PMID"], "20861519"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][20]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][20].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][21]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][21]["RefSource"],
-            "Eur J Appl Physiol Occup Physiol. 1990;60(4):249-53",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][21]["PMID"], "2357979"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][21]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][21].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][22]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][22]["RefSource"],
-            "Med Sci Sports Exerc. 2004 Oct;36(10):1737-42",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][22]["PMID"], "15595295"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][22]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][22].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][23]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][23]["RefSource"],
-            "Int J Sports Med. 2016 Jun;37(7):539-46",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][23]["PMID"], "27116348"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][23]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][23].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][24]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][24]["RefSource"],
-            "Scand J Med Sci Sports. 2017 May;27(5):462-473",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][24]["PMID"], "28181710"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][24]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][24].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][25]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][25]["RefSource"],
-            "Int J Sports Med. 1983 Nov;4(4):226-30",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][25]["PMID"], "6654546"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][25]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][25].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][26]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][26]["RefSource"],
-            "J Appl Physiol (1985). 1988 Jun;64(6):2622-30",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][26]["PMID"], "3403447"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][26]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][26].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][27]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][27]["RefSource"],
-            "Med Sci Sports Exerc. 2009 Jan;41(1):3-13",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][27]["PMID"], "19092709"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][27]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][27].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][28]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][28]["RefSource"],
-            "Int J Sports Med. 2009 Sep;30(9):643-6",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][28]["PMID"], "19569005"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][28]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][28].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][29]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][29]["RefSource"],
-            "Eur J Appl Physiol Occup Physiol. 1988;57(4):420-4",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][29]["PMID"], "3396556"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][29]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][29].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][30]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][30]["RefSource"],
-            "J Physiol. 2004 Jul 1;558(Pt 1):5-30",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][30]["PMID"], "15131240"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][30]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][30].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][31]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][31]["RefSource"],
-            "Int J Sports Med. 1990 Feb;11(1):26-32",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][31]["PMID"], "2318561"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][31]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][31].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][32]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][32]["RefSource"],
-            "J Appl Physiol. 1973 Aug;35(2):236-43",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][32]["PMID"], "4723033"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][32]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][32].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][33]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][33]["RefSource"],
-            "Int J Sports Med. 1987 Dec;8(6):401-6",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][33]["PMID"], "3429086"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][33]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][33].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][34]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][34]["RefSource"],
-            "J Sci Med Sport. 2008 Jun;11(3):280-6",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][34]["PMID"], "17553745"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][34]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][34].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][35]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][35]["RefSource"],
-            "J Appl Physiol Respir Environ Exerc Physiol. 1984 May;56(5):1260-4",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][35]["PMID"], "6725086"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][35]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][35].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][36]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][36]["RefSource"],
-            "Int J Sports Med. 2008 Jun;29(6):475-9",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][36]["PMID"], "18302077"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][36]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][36].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][37]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][37]["RefSource"],
-            "Med Sci Sports Exerc. 1985 Feb;17(1):22-34",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][37]["PMID"], "3884959"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][37]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][37].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][38]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][38]["RefSource"],
-            "Sports Med. 2009;39(6):469-90",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][38]["PMID"], "19453206"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][38]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][38].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][39]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][39]["RefSource"],
-            "Int J Sports Med. 2004 Aug;25(6):403-8",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][39]["PMID"], "15346226"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][39]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][39].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][40]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][40]["RefSource"],
-            "J Sports Med Phys Fitness. 2004 Jun;44(2):132-40",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][40]["PMID"], "15470310"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][40]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][40].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][41]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][41]["RefSource"],
-            "Int J Sports Med. 1985 Jun;6(3):117-30",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][41]["PMID"], "4030186"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][41]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][41].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][42]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][42]["RefSource"],
-            "Int J Sports Med. 1999 Feb;20(2):122-7",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][42]["PMID"], "10190774"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][42]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][42].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][43]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][43]["RefSource"],
-            "Int J Sports Med. 2006 May;27(5):368-72",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][43]["PMID"], "16729378"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][43]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][43].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][44]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][44]["RefSource"],
-            "Int J Sports Med. 1985 Jun;6(3):109-16",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][44]["PMID"], "3897079"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][44]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][44].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][45]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][45]["RefSource"],
-            "Pneumologie. 1990 Jan;44(1):2-13",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][45]["PMID"], "2408033"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][45]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][45].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][46]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][46]["RefSource"],
-            "Eur J Appl Physiol. 2018 Apr;118(4):691-728",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][46]["PMID"], "29322250"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][46]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][46].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][47]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][47]["RefSource"],
-            "J Appl Physiol Respir Environ Exerc Physiol. 1983 Oct;55(4):1178-86",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][47]["PMID"], "6629951"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][47]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][47].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][48]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][48]["RefSource"],
-            "Sports Med. 2014 Nov;44 Suppl 2:S139-47",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][48]["PMID"], "25200666"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][48]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][48].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][49]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][49]["RefSource"],
-            "Front Physiol. 2015 Oct 30;6:308",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][49]["PMID"], "26578980"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][49]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][49].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][50]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][50]["RefSource"],
-            "Int J Sports Med. 2013 Mar;34(3):196-9",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][50]["PMID"], "22972242"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][50]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][50].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][51]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][51]["RefSource"],
-            "Int J Sports Med. 1992 Oct;13(7):518-22",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][51]["PMID"], "1459746"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][51]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][51].attributes,
-            {"RefType": "Cites"},
-        )
-        self.assertEqual(len(medline_citation["CommentsCorrectionsList"][52]), 2)
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][52]["RefSource"],
-            "Med Sci Sports Exerc. 1993 May;25(5):620-7",
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][52]["PMID"], "8492691"
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][52]["PMID"].attributes,
-            {"Version": "1"},
-        )
-        self.assertEqual(
-            medline_citation["CommentsCorrectionsList"][52].attributes,
-            {"RefType": "Cites"},
-        )
-        article = medline_citation["Article"]
-        self.assertEqual(len(article["ELocationID"]), 1)
-        self.assertEqual(article["ELocationID"][0], "10.3389/fphys.2018.01034")
-        self.assertEqual(
-            article["ELocationID"][0].attributes, {"EIdType": "doi", "ValidYN": "Y"}
-        )
-        self.assertEqual(len(article["ArticleDate"]), 1)
-        self.assertEqual(len(article["ArticleDate"][0]), 3)
-        self.assertEqual(article["ArticleDate"][0]["Year"], "2018")
-        self.assertEqual(article["ArticleDate"][0]["Month"], "07")
-        self.assertEqual(article["ArticleDate"][0]["Day"], "31")
-        self.assertEqual(
-            article["ArticleDate"][0].attributes, {"DateType": "Electronic"}
-        )
-        self.assertEqual(article["Language"], ["eng"])
-        self.assertEqual(len(article["Journal"]), 4)
-        self.assertEqual(article["Journal"]["ISSN"], "1664-042X")
-        self.assertEqual(article["Journal"]["ISSN"].attributes, {"IssnType": "Print"})
-        self.assertEqual(article["Journal"]["JournalIssue"]["Volume"], "9")
-        self.assertEqual(article["Journal"]["JournalIssue"]["PubDate"]["Year"], "2018")
-        self.assertEqual(article["Journal"]["JournalIssue"]["PubDate"].attributes, {})
-        self.assertEqual(
-            article["Journal"]["JournalIssue"].attributes, {"CitedMedium": "Print"}
-        )
-        self.assertEqual(article["Journal"]["Title"], "Frontiers in physiology")
-        self.assertEqual(article["Journal"]["ISOAbbreviation"], "Front Physiol")
-        self.assertEqual(article["Journal"].attributes, {})
-        self.assertEqual(len(article["PublicationTypeList"]), 1)
-        self.assertEqual(article["PublicationTypeList"][0], "Journal Article")
-        self.assertEqual(
-            article["PublicationTypeList"][0].attributes, {"UI": "D016428"}
-        )
-        self.assertEqual(
-            article["ArticleTitle"],
-            'A "<i>Blood Relationship"</i> Between the Overlooked Minimum Lactate Equivalent and Maximal Lactate Steady State in Trained Runners. Back to the Old Days?',
-        )
-        self.assertEqual(len(article["Pagination"]), 1)
-        self.assertEqual(article["Pagination"]["MedlinePgn"], "1034")
-        self.assertEqual(article["Pagination"].attributes, {})
-        self.assertEqual(len(article["AuthorList"]), 2)
-        self.assertEqual(len(article["AuthorList"][0]), 5)
-        self.assertEqual(article["AuthorList"][0]["Identifier"], [])
-        self.assertEqual(len(article["AuthorList"][0]["AffiliationInfo"]), 1)
-        self.assertEqual(len(article["AuthorList"][0]["AffiliationInfo"][0]), 2)
-        self.assertEqual(
-            article["AuthorList"][0]["AffiliationInfo"][0]["Identifier"], []
-        )
-        self.assertEqual(
-            article["AuthorList"][0]["AffiliationInfo"][0]["Affiliation"],
-            "Studies, Research and Sports Medicine Center, Government of Navarre, Pamplona, Spain.",
-        )
-        self.assertEqual(article["AuthorList"][0]["AffiliationInfo"][0].attributes, {})
-        self.assertEqual(article["AuthorList"][0]["LastName"], "Garcia-Tabar")
-        self.assertEqual(article["AuthorList"][0]["ForeName"], "Ibai")
-        self.assertEqual(article["AuthorList"][0]["Initials"], "I")
-        self.assertEqual(article["AuthorList"][0].attributes, {"ValidYN": "Y"})
-        self.assertEqual(len(article["AuthorList"][1]), 5)
-        self.assertEqual(article["AuthorList"][1]["Identifier"], [])
-        self.assertEqual(len(article["AuthorList"][1]["AffiliationInfo"]), 1)
-        self.assertEqual(len(article["AuthorList"][1]["AffiliationInfo"][0]), 2)
-        self.assertEqual(
-            article["AuthorList"][1]["AffiliationInfo"][0]["Identifier"], []
-        )
-        self.assertEqual(
-            article["AuthorList"][1]["AffiliationInfo"][0]["Affiliation"],
-            "Studies, Research and Sports Medicine Center, Government of Navarre, Pamplona, Spain.",
-        )
-        self.assertEqual(article["AuthorList"][1]["AffiliationInfo"][0].attributes, {})
-        self.assertEqual(article["AuthorList"][1]["LastName"], "Gorostiaga")
-        self.assertEqual(article["AuthorList"][1]["ForeName"], "Esteban M")
-        self.assertEqual(article["AuthorList"][1]["Initials"], "EM")
-        self.assertEqual(article["AuthorList"][1].attributes, {"ValidYN": "Y"})
-        self.assertEqual(len(article["Abstract"]), 1)
-        self.assertEqual(
-            article["Abstract"]["AbstractText"][0],
-            """\
-Maximal Lactate Steady State (MLSS) and Lactate Threshold (LT) are physiologically-related and fundamental concepts within the sports and exercise sciences. Literature supporting their relationship, however, is scarce. Among the recognized LTs, we were particularly interested in the disused "Minimum Lactate Equivalent" (LE<sub>min</sub>), first described in the early 1980s. We hypothesized that velocity at LT, conceptually comprehended as in the old days (LE<sub>min</sub>), could predict velocity at MLSS (<sub>V</sub>MLSS) more accurate than some other blood lactate-related thresholds (BL<sub>R</sub>Ts) routinely used nowadays by many sport science practitioners. Thirteen male endurance-trained [<sub>V</sub>MLSS 15.0 ± 1.1 km·h<sup>-1</sup>; maximal oxygen uptake ( <math xmlns="http://www.w3.org/1998/Math/MathML">
-                        <msub>
-                            <mrow>
-                                <mover>
-                                    <mrow>
-                                        <mi>V</mi>
-                                    </mrow>
-                                    <mo>.</mo>
-                                </mover>
-                                <mi>O</mi>
-                            </mrow>
-                            <mrow>
-                                <mn>2</mn>
-                                <mi>m</mi>
-                                <mi>a</mi>
-                                <mi>x</mi>
-                            </mrow>
-                        </msub>
-                    </math> ) 67.6 ± 4.1 ml·kg<sup>-1</sup>·min<sup>-1</sup>] homogeneous (coefficient of variation: ≈7%) runners conducted 1) a submaximal discontinuous incremental running test to determine several BL<sub>R</sub>Ts followed by a maximal ramp incremental running test for <math xmlns="http://www.w3.org/1998/Math/MathML">
-                        <msub>
-                            <mrow>
-                                <mover>
-                                    <mrow>
-                                        <mi>V</mi>
-                                    </mrow>
-                                    <mo>.</mo>
-                                </mover>
-                                <mi>O</mi>
-                            </mrow>
-                            <mrow>
-                                <mn>2</mn>
-                                <mi>m</mi>
-                                <mi>a</mi>
-                                <mi>x</mi>
-                            </mrow>
-                        </msub>
-                        <mtext> </mtext>
-                    </math> determination, and 2) several (4-5) constant velocity running tests to determine <sub>V</sub>MLSS with a precision of 0.20 km·h<sup>-1</sup>. Determined BL<sub>R</sub>Ts include LE<sub>min</sub> and LE<sub>min</sub>-related LE<sub>min</sub> plus 1 (LE<sub>min+1mM</sub>) and 1.5 mmol·L<sup>-1</sup> (LE<sub>min+1.5mM</sub>), along with well-established BL<sub>R</sub>Ts such as conventionally-calculated LT, D<sub>max</sub> and fixed blood lactate concentration thresholds. LE<sub>min</sub> did not differ from LT (<i>P</i> = 0.71; ES: 0.08) and was 27% lower than MLSS (<i>P</i> < 0.001; ES: 3.54). LE<sub>min+1mM</sub> was not different from MLSS (<i>P</i> = 0.47; ES: 0.09). LE<sub>min</sub> was the best predictor of <sub>V</sub>MLSS (<i>r</i> = 0.91; <i>P</i> < 0.001; SEE = 0.47 km·h<sup>-1</sup>), followed by LE<sub>min+1mM</sub> (<i>r</i> = 0.86; <i>P</i> < 0.001; SEE = 0.58 km·h<sup>-1</sup>) and LE<sub>min+1.5mM</sub> (<i>r</i> = 0.84; <i>P</i> < 0.001; SEE = 0.86 km·h<sup>-1</sup>). There was no statistical difference between MLSS and estimated MLSS using LE<sub>min</sub> prediction formula (<i>P</i> = 0.99; ES: 0.001). Mean bias and limits of agreement were 0.00 ± 0.45 km·h<sup>-1</sup> and ±0.89 km·h<sup>-1</sup>. Additionally, LE<sub>min</sub>, LE<sub>min+1mM</sub> and LE<sub>min+1.5mM</sub> were the best predictors of <math xmlns="http://www.w3.org/1998/Math/MathML">
-                        <msub>
-                            <mrow>
-                                <mover>
-                                    <mrow>
-                                        <mi>V</mi>
-                                    </mrow>
-                                    <mo>.</mo>
-                                </mover>
-                                <mi>O</mi>
-                            </mrow>
-                            <mrow>
-                                <mn>2</mn>
-                                <mi>m</mi>
-                                <mi>a</mi>
-                                <mi>x</mi>
-                            </mrow>
-                        </msub>
-                    </math> (<i>r</i> = 0.72-0.79; <i>P</i> < 0.001). These results support LE<sub>min</sub>, an objective submaximal overlooked and underused BL<sub>R</sub>T, to be one of the best single MLSS predictors in endurance trained runners. Our study advocates factors controlling LE<sub>min</sub> to be shared, at least partly, with those controlling MLSS.""",
-        )
-
-    def test_pubmed_mathml_tags(self):
-        """Test parsing XML returned by EFetch, PubMed database, with extensive MathML tags."""
-        # In PubMed display PMID 29963580 in xml retrieval mode, containing
-        # extensive MathML tags in the abstract text.
-        # To create the XML file, use
-        # >>> Bio.Entrez.efetch(db="pubmed", id="29963580", retmode="xml")
-        with open("Entrez/pubmed7.xml", "rb") as stream:
-            record = Entrez.read(stream)
-        self.assertEqual(len(record), 2)
-        self.assertEqual(record["PubmedBookArticle"], [])
-        self.assertEqual(len(record["PubmedArticle"]), 1)
-        pubmed_article = record["PubmedArticle"][0]
-        self.assertEqual(len(pubmed_article), 2)
-        self.assertEqual(len(pubmed_article["MedlineCitation"].attributes), 2)
-        self.assertEqual(
-            pubmed_article["MedlineCitation"].attributes["Status"], "PubMed-not-MEDLINE"
-        )
-        self.assertEqual(pubmed_article["MedlineCitation"].attributes["Owner"], "NLM")
-        self.assertEqual(pubmed_article["MedlineCitation"]["PMID"], "29963580")
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["PMID"].attributes["Version"], "1"
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["DateRevised"].attributes, {}
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["DateRevised"]["Year"], "2018"
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["DateRevised"]["Month"], "11"
-        )
-        self.assertEqual(pubmed_article["MedlineCitation"]["DateRevised"]["Day"], "14")
-        self.assertEqual(
-            len(pubmed_article["MedlineCitation"]["Article"].attributes), 1
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"].attributes["PubModel"],
-            "Print-Electronic",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Journal"].attributes, {}
-        )
-        self.assertEqual(
-            len(
-                pubmed_article["MedlineCitation"]["Article"]["Journal"][
-                    "ISSN"
-                ].attributes
-            ),
-            1,
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Journal"]["ISSN"].attributes[
-                "IssnType"
-            ],
-            "Print",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Journal"]["ISSN"], "2329-4302"
-        )
-        self.assertEqual(
-            len(
-                pubmed_article["MedlineCitation"]["Article"]["Journal"][
-                    "JournalIssue"
-                ].attributes
-            ),
-            1,
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Journal"][
-                "JournalIssue"
-            ].attributes["CitedMedium"],
-            "Print",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"][
-                "Volume"
-            ],
-            "5",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"][
-                "Issue"
-            ],
-            "2",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"][
-                "PubDate"
-            ]["Year"],
-            "2018",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Journal"]["JournalIssue"][
-                "PubDate"
-            ]["Month"],
-            "Apr",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Journal"]["Title"],
-            "Journal of medical imaging (Bellingham, Wash.)",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Journal"]["ISOAbbreviation"],
-            "J Med Imaging (Bellingham)",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["ArticleTitle"],
-            "Development of a pulmonary imaging biomarker pipeline for phenotyping of chronic lung disease.",
-        )
-        self.assertEqual(
-            len(pubmed_article["MedlineCitation"]["Article"]["Pagination"]), 1
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Pagination"]["MedlinePgn"],
-            "026002",
-        )
-        self.assertEqual(
-            len(pubmed_article["MedlineCitation"]["Article"]["ELocationID"]), 1
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["ELocationID"][0].attributes[
-                "EIdType"
-            ],
-            "doi",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["ELocationID"][0].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["ELocationID"][0],
-            "10.1117/1.JMI.5.2.026002",
-        )
-        self.assertEqual(
-            len(pubmed_article["MedlineCitation"]["Article"]["Abstract"]), 1
-        )
-        self.assertEqual(
-            len(
-                pubmed_article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"]
-            ),
-            1,
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Abstract"]["AbstractText"][0],
-            """\
-We designed and generated pulmonary imaging biomarker pipelines to facilitate high-throughput research and point-of-care use in patients with chronic lung disease. Image processing modules and algorithm pipelines were embedded within a graphical user interface (based on the .NET framework) for pulmonary magnetic resonance imaging (MRI) and x-ray computed-tomography (CT) datasets. The software pipelines were generated using C++ and included: (1) inhaled <math xmlns="http://www.w3.org/1998/Math/MathML">
-                        <mrow>
-                            <mmultiscripts>
-                                <mrow>
-                                    <mi>He</mi>
-                                </mrow>
-                                <mprescripts></mprescripts>
-                                <none></none>
-                                <mrow>
-                                    <mn>3</mn>
-                                </mrow>
-                            </mmultiscripts>
-                            <mo>/</mo>
-                            <mmultiscripts>
-                                <mrow>
-                                    <mi>Xe</mi>
-                                </mrow>
-                                <mprescripts></mprescripts>
-                                <none></none>
-                                <mrow>
-                                    <mn>129</mn>
-                                </mrow>
-                            </mmultiscripts>
-                            <mtext> </mtext>
-                            <mi>MRI</mi>
-                        </mrow>
-                    </math> ventilation and apparent diffusion coefficients, (2) CT-MRI coregistration for lobar and segmental ventilation and perfusion measurements, (3) ultrashort echo-time <math xmlns="http://www.w3.org/1998/Math/MathML">
-                        <mrow>
-                            <mmultiscripts>
-                                <mrow>
-                                    <mi>H</mi>
-                                </mrow>
-                                <mprescripts></mprescripts>
-                                <none></none>
-                                <mrow>
-                                    <mn>1</mn>
-                                </mrow>
-                            </mmultiscripts>
-                            <mtext> </mtext>
-                            <mi>MRI</mi>
-                        </mrow>
-                    </math> proton density measurements, (4) free-breathing Fourier-decomposition <math xmlns="http://www.w3.org/1998/Math/MathML">
-                        <mrow>
-                            <mmultiscripts>
-                                <mrow>
-                                    <mi>H</mi>
-                                </mrow>
-                                <mprescripts></mprescripts>
-                                <none></none>
-                                <mrow>
-                                    <mn>1</mn>
-                                </mrow>
-                            </mmultiscripts>
-                            <mtext> </mtext>
-                            <mi>MRI</mi>
-                        </mrow>
-                    </math> ventilation/perfusion and free-breathing <math xmlns="http://www.w3.org/1998/Math/MathML">
-                        <mrow>
-                            <mmultiscripts>
-                                <mrow>
-                                    <mi>H</mi>
-                                </mrow>
-                                <mprescripts></mprescripts>
-                                <none></none>
-                                <mrow>
-                                    <mn>1</mn>
-                                </mrow>
-                            </mmultiscripts>
-                            <mtext> </mtext>
-                            <mi>MRI</mi>
-                        </mrow>
-                    </math> specific ventilation, (5)\u00a0multivolume CT and MRI parametric response maps, and (6)\u00a0MRI and CT texture analysis and radiomics. The image analysis framework was implemented on a desktop workstation/tablet to generate biomarkers of regional lung structure and function related to ventilation, perfusion, lung tissue texture, and integrity as well as multiparametric measures of gas trapping and airspace enlargement. All biomarkers were generated within 10 min with measurement reproducibility consistent with clinical and research requirements. The resultant pulmonary imaging biomarker pipeline provides real-time and automated lung imaging measurements for point-of-care and high-throughput research.""",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"].attributes[
-                "CompleteYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            len(pubmed_article["MedlineCitation"]["Article"]["AuthorList"]), 9
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][0].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][0]["LastName"],
-            "Guo",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][0]["ForeName"],
-            "Fumin",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][0]["Initials"],
-            "F",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][0][
-                "AffiliationInfo"
-            ][0]["Affiliation"],
-            "University of Western Ontario, Robarts Research Institute, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][0][
-                "AffiliationInfo"
-            ][1]["Affiliation"],
-            "University of Western Ontario, Graduate Program in Biomedical Engineering, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][0][
-                "AffiliationInfo"
-            ][2]["Affiliation"],
-            "University of Toronto, Sunnybrook Research Institute, Toronto, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][1].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][1]["LastName"],
-            "Capaldi",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][1]["ForeName"],
-            "Dante",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][1]["Initials"],
-            "D",
-        )
-        self.assertEqual(
-            len(
-                pubmed_article["MedlineCitation"]["Article"]["AuthorList"][1][
-                    "Identifier"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][1]["Identifier"][
-                0
-            ].attributes["Source"],
-            "ORCID",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][1]["Identifier"][
-                0
-            ],
-            "https://orcid.org/0000-0002-4590-7461",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][1][
-                "AffiliationInfo"
-            ][0]["Affiliation"],
-            "University of Western Ontario, Robarts Research Institute, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][1][
-                "AffiliationInfo"
-            ][1]["Affiliation"],
-            "University of Western Ontario, Department of Medical Biophysics, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][2].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][2]["LastName"],
-            "Kirby",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][2]["ForeName"],
-            "Miranda",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][2]["Initials"],
-            "M",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][2][
-                "AffiliationInfo"
-            ][0]["Affiliation"],
-            "University of British Columbia, St. Paul's Hospital, Centre for Heart Lung Innovation, Vancouver, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][3].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][3]["LastName"],
-            "Sheikh",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][3]["ForeName"],
-            "Khadija",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][3]["Initials"],
-            "K",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][3][
-                "AffiliationInfo"
-            ][0]["Affiliation"],
-            "University of Western Ontario, Robarts Research Institute, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][4].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][4]["LastName"],
-            "Svenningsen",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][4]["ForeName"],
-            "Sarah",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][4]["Initials"],
-            "S",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][4][
-                "AffiliationInfo"
-            ][0]["Affiliation"],
-            "University of Western Ontario, Robarts Research Institute, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][5].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][5]["LastName"],
-            "McCormack",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][5]["ForeName"],
-            "David G",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][5]["Initials"],
-            "DG",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][5][
-                "AffiliationInfo"
-            ][0]["Affiliation"],
-            "University of Western Ontario, Division of Respirology, Department of Medicine, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][6].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][6]["LastName"],
-            "Fenster",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][6]["ForeName"],
-            "Aaron",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][6]["Initials"],
-            "A",
-        )
-        self.assertEqual(
-            len(
-                pubmed_article["MedlineCitation"]["Article"]["AuthorList"][6][
-                    "Identifier"
-                ]
-            ),
-            1,
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][6]["Identifier"][
-                0
-            ].attributes["Source"],
-            "ORCID",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][6]["Identifier"][
-                0
-            ],
-            "https://orcid.org/0000-0003-3525-2788",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][6][
-                "AffiliationInfo"
-            ][0]["Affiliation"],
-            "University of Western Ontario, Robarts Research Institute, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][6][
-                "AffiliationInfo"
-            ][1]["Affiliation"],
-            "University of Western Ontario, Graduate Program in Biomedical Engineering, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][6][
-                "AffiliationInfo"
-            ][2]["Affiliation"],
-            "University of Western Ontario, Department of Medical Biophysics, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][7].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][7]["LastName"],
-            "Parraga",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][7]["ForeName"],
-            "Grace",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][7]["Initials"],
-            "G",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][7][
-                "AffiliationInfo"
-            ][0]["Affiliation"],
-            "University of Western Ontario, Robarts Research Institute, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][7][
-                "AffiliationInfo"
-            ][1]["Affiliation"],
-            "University of Western Ontario, Graduate Program in Biomedical Engineering, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][7][
-                "AffiliationInfo"
-            ][2]["Affiliation"],
-            "University of Western Ontario, Department of Medical Biophysics, London, Ontario, Canada.",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][8].attributes[
-                "ValidYN"
-            ],
-            "Y",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["AuthorList"][8][
-                "CollectiveName"
-            ],
-            "Canadian Respiratory Research Network",
-        )
-        self.assertEqual(
-            len(pubmed_article["MedlineCitation"]["Article"]["Language"]), 1
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["Language"][0], "eng"
-        )
-        self.assertEqual(
-            len(pubmed_article["MedlineCitation"]["Article"]["PublicationTypeList"]), 1
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["PublicationTypeList"][
-                0
-            ].attributes["UI"],
-            "D016428",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["PublicationTypeList"][0],
-            "Journal Article",
-        )
-        self.assertEqual(
-            len(pubmed_article["MedlineCitation"]["Article"]["ArticleDate"]), 1
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["ArticleDate"][0].attributes[
-                "DateType"
-            ],
-            "Electronic",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["ArticleDate"][0]["Year"],
-            "2018",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["ArticleDate"][0]["Month"],
-            "06",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["Article"]["ArticleDate"][0]["Day"], "28"
-        )
-        self.assertEqual(
-            len(pubmed_article["MedlineCitation"]["MedlineJournalInfo"]), 4
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["MedlineJournalInfo"]["Country"],
-            "United States",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["MedlineJournalInfo"]["MedlineTA"],
-            "J Med Imaging (Bellingham)",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["MedlineJournalInfo"]["NlmUniqueID"],
-            "101643461",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["MedlineJournalInfo"]["ISSNLinking"],
-            "2329-4302",
-        )
-        self.assertEqual(len(pubmed_article["MedlineCitation"]["KeywordList"]), 1)
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0].attributes["Owner"],
-            "NOTNLM",
-        )
-        self.assertEqual(len(pubmed_article["MedlineCitation"]["KeywordList"][0]), 5)
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0][0].attributes[
-                "MajorTopicYN"
-            ],
-            "N",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0][0], "asthma"
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0][1].attributes[
-                "MajorTopicYN"
-            ],
-            "N",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0][1],
-            "chronic obstructive lung disease",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0][2].attributes[
-                "MajorTopicYN"
-            ],
-            "N",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0][2],
-            "image processing, biomarkers",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0][3].attributes[
-                "MajorTopicYN"
-            ],
-            "N",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0][3],
-            "magnetic resonance imaging",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0][4].attributes[
-                "MajorTopicYN"
-            ],
-            "N",
-        )
-        self.assertEqual(
-            pubmed_article["MedlineCitation"]["KeywordList"][0][4],
-            "thoracic computed tomography",
-        )
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][0].attributes["PubStatus"],
-            "received",
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["History"][0]["Year"], "2017")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][0]["Month"], "12")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][0]["Day"], "12")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][1].attributes["PubStatus"],
-            "accepted",
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["History"][1]["Year"], "2018")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][1]["Month"], "06")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][1]["Day"], "14")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][2].attributes["PubStatus"],
-            "pmc-release",
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["History"][2]["Year"], "2019")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][2]["Month"], "06")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][2]["Day"], "28")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][3].attributes["PubStatus"], "entrez"
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["History"][3]["Year"], "2018")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][3]["Month"], "7")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][3]["Day"], "3")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][3]["Hour"], "6")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][3]["Minute"], "0")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][4].attributes["PubStatus"], "pubmed"
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["History"][4]["Year"], "2018")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][4]["Month"], "7")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][4]["Day"], "3")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][4]["Hour"], "6")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][4]["Minute"], "0")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["History"][5].attributes["PubStatus"],
-            "medline",
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["History"][5]["Year"], "2018")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][5]["Month"], "7")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][5]["Day"], "3")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][5]["Hour"], "6")
-        self.assertEqual(pubmed_article["PubmedData"]["History"][5]["Minute"], "1")
-        self.assertEqual(pubmed_article["PubmedData"]["PublicationStatus"], "ppublish")
-        self.assertEqual(len(pubmed_article["PubmedData"]["ArticleIdList"]), 4)
-        self.assertEqual(
-            pubmed_article["PubmedData"]["ArticleIdList"][0].attributes["IdType"],
-            "pubmed",
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["ArticleIdList"][0], "29963580")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["ArticleIdList"][1].attributes["IdType"], "doi"
-        )
-        self.assertEqual(
-            pubmed_article["PubmedData"]["ArticleIdList"][1], "10.1117/1.JMI.5.2.026002"
-        )
-        self.assertEqual(
-            pubmed_article["PubmedData"]["ArticleIdList"][2].attributes["IdType"], "pii"
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["ArticleIdList"][2], "17360RR")
-        self.assertEqual(
-            pubmed_article["PubmedData"]["ArticleIdList"][3].attributes["IdType"], "pmc"
-        )
-        self.assertEqual(pubmed_article["PubmedData"]["ArticleIdList"][3], "PMC6022861")
-        self.assertEqual(len(pubmed_article["PubmedData"]["ReferenceList"]), 1)
-        self.assertEqual(len(pubmed_article["PubmedData"]["ReferenceList"][0]), 2)
-        self.assertEqual(
-            len(pubmed_article["PubmedData"]["ReferenceList"][0]["ReferenceList"]), 0
-        )
-        references = pubmed_article["PubmedData"]["ReferenceList"][0]["Reference"]
-        self.assertEqual(len(references), 49)
-        self.assertEqual(references[0]["Citation"], "Radiology. 2015 Jan;274(1):250-9")
-        self.assertEqual(len(references[0]["ArticleIdList"]), 1)
-        self.assertEqual(references[0]["ArticleIdList"][0], "25144646")
-        self.assertEqual(
-            references[0]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[1]["Citation"], "Nature. 1994 Jul 21;370(6486):199-201"
-        )
-        self.assertEqual(len(references[1]["ArticleIdList"]), 1)
-        self.assertEqual(references[1]["ArticleIdList"][0], "8028666")
-        self.assertEqual(
-            references[1]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[2]["Citation"], "Magn Reson Med. 2009 Sep;62(3):656-64"
-        )
-        self.assertEqual(len(references[2]["ArticleIdList"]), 1)
-        self.assertEqual(references[2]["ArticleIdList"][0], "19585597")
-        self.assertEqual(
-            references[2]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[3]["Citation"], "Radiology. 2016 Feb;278(2):563-77")
-        self.assertEqual(len(references[3]["ArticleIdList"]), 1)
-        self.assertEqual(references[3]["ArticleIdList"][0], "26579733")
-        self.assertEqual(
-            references[3]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[4]["Citation"], "Radiology. 1991 Jun;179(3):777-81")
-        self.assertEqual(len(references[4]["ArticleIdList"]), 1)
-        self.assertEqual(references[4]["ArticleIdList"][0], "2027991")
-        self.assertEqual(
-            references[4]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[5]["Citation"], "Radiology. 2010 Jul;256(1):280-9")
-        self.assertEqual(len(references[5]["ArticleIdList"]), 1)
-        self.assertEqual(references[5]["ArticleIdList"][0], "20574101")
-        self.assertEqual(
-            references[5]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[6]["Citation"], "Phys Med Biol. 2001 May;46(5):R67-99"
-        )
-        self.assertEqual(len(references[6]["ArticleIdList"]), 1)
-        self.assertEqual(references[6]["ArticleIdList"][0], "11384074")
-        self.assertEqual(
-            references[6]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[7]["Citation"], "IEEE Trans Med Imaging. 2011 Nov;30(11):1901-20"
-        )
-        self.assertEqual(len(references[7]["ArticleIdList"]), 1)
-        self.assertEqual(references[7]["ArticleIdList"][0], "21632295")
-        self.assertEqual(
-            references[7]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[8]["Citation"], "Eur J Cancer. 2012 Mar;48(4):441-6"
-        )
-        self.assertEqual(len(references[8]["ArticleIdList"]), 1)
-        self.assertEqual(references[8]["ArticleIdList"][0], "22257792")
-        self.assertEqual(
-            references[8]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[9]["Citation"], "Med Phys. 2017 May;44(5):1718-1733"
-        )
-        self.assertEqual(len(references[9]["ArticleIdList"]), 1)
-        self.assertEqual(references[9]["ArticleIdList"][0], "28206676")
-        self.assertEqual(
-            references[9]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[10]["Citation"], "COPD. 2014 Apr;11(2):125-32")
-        self.assertEqual(len(references[10]["ArticleIdList"]), 1)
-        self.assertEqual(references[10]["ArticleIdList"][0], "22433011")
-        self.assertEqual(
-            references[10]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[11]["Citation"],
-            "Am J Respir Crit Care Med. 2015 Nov 15;192(10):1215-22",
-        )
-        self.assertEqual(len(references[11]["ArticleIdList"]), 1)
-        self.assertEqual(references[11]["ArticleIdList"][0], "26186608")
-        self.assertEqual(
-            references[11]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[12]["Citation"], "N Engl J Med. 2016 May 12;374(19):1811-21"
-        )
-        self.assertEqual(len(references[12]["ArticleIdList"]), 1)
-        self.assertEqual(references[12]["ArticleIdList"][0], "27168432")
-        self.assertEqual(
-            references[12]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[13]["Citation"], "Am J Epidemiol. 2002 Nov 1;156(9):871-81"
-        )
-        self.assertEqual(len(references[13]["ArticleIdList"]), 1)
-        self.assertEqual(references[13]["ArticleIdList"][0], "12397006")
-        self.assertEqual(
-            references[13]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[14]["Citation"], "BMC Cancer. 2014 Dec 11;14:934")
-        self.assertEqual(len(references[14]["ArticleIdList"]), 1)
-        self.assertEqual(references[14]["ArticleIdList"][0], "25496482")
-        self.assertEqual(
-            references[14]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[15]["Citation"], "Acad Radiol. 2015 Mar;22(3):320-9"
-        )
-        self.assertEqual(len(references[15]["ArticleIdList"]), 1)
-        self.assertEqual(references[15]["ArticleIdList"][0], "25491735")
-        self.assertEqual(
-            references[15]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[16]["Citation"], "Chest. 1999 Dec;116(6):1750-61")
-        self.assertEqual(len(references[16]["ArticleIdList"]), 1)
-        self.assertEqual(references[16]["ArticleIdList"][0], "10593802")
-        self.assertEqual(
-            references[16]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[17]["Citation"], "Acad Radiol. 2012 Feb;19(2):141-52"
-        )
-        self.assertEqual(len(references[17]["ArticleIdList"]), 1)
-        self.assertEqual(references[17]["ArticleIdList"][0], "22104288")
-        self.assertEqual(
-            references[17]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[18]["Citation"], "Med Phys. 2014 Mar;41(3):033502")
-        self.assertEqual(len(references[18]["ArticleIdList"]), 1)
-        self.assertEqual(references[18]["ArticleIdList"][0], "24593744")
-        self.assertEqual(
-            references[18]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[19]["Citation"], "Med Phys. 2008 Oct;35(10):4695-707"
-        )
-        self.assertEqual(len(references[19]["ArticleIdList"]), 1)
-        self.assertEqual(references[19]["ArticleIdList"][0], "18975715")
-        self.assertEqual(
-            references[19]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[20]["Citation"], "Thorax. 2017 May;72(5):475-477")
-        self.assertEqual(len(references[20]["ArticleIdList"]), 1)
-        self.assertEqual(references[20]["ArticleIdList"][0], "28258250")
-        self.assertEqual(
-            references[20]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[21]["Citation"], "Nat Med. 1996 Nov;2(11):1236-9")
-        self.assertEqual(len(references[21]["ArticleIdList"]), 1)
-        self.assertEqual(references[21]["ArticleIdList"][0], "8898751")
-        self.assertEqual(
-            references[21]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[22]["Citation"], "J Magn Reson Imaging. 2015 May;41(5):1465-74"
-        )
-        self.assertEqual(len(references[22]["ArticleIdList"]), 1)
-        self.assertEqual(references[22]["ArticleIdList"][0], "24965907")
-        self.assertEqual(
-            references[22]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[23]["Citation"], "Acad Radiol. 2008 Jun;15(6):776-85"
-        )
-        self.assertEqual(len(references[23]["ArticleIdList"]), 1)
-        self.assertEqual(references[23]["ArticleIdList"][0], "18486013")
-        self.assertEqual(
-            references[23]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[24]["Citation"], "Magn Reson Med. 2000 Aug;44(2):174-9"
-        )
-        self.assertEqual(len(references[24]["ArticleIdList"]), 1)
-        self.assertEqual(references[24]["ArticleIdList"][0], "10918314")
-        self.assertEqual(
-            references[24]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[25]["Citation"],
-            "Am J Respir Crit Care Med. 2014 Jul 15;190(2):135-44",
-        )
-        self.assertEqual(len(references[25]["ArticleIdList"]), 1)
-        self.assertEqual(references[25]["ArticleIdList"][0], "24873985")
-        self.assertEqual(
-            references[25]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[26]["Citation"], "Med Phys. 2016 Jun;43(6):2911-2926"
-        )
-        self.assertEqual(len(references[26]["ArticleIdList"]), 1)
-        self.assertEqual(references[26]["ArticleIdList"][0], "27277040")
-        self.assertEqual(
-            references[26]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[27]["Citation"], "Nat Med. 2009 May;15(5):572-6")
-        self.assertEqual(len(references[27]["ArticleIdList"]), 1)
-        self.assertEqual(references[27]["ArticleIdList"][0], "19377487")
-        self.assertEqual(
-            references[27]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[28]["Citation"], "Eur J Radiol. 2014 Nov;83(11):2093-101"
-        )
-        self.assertEqual(len(references[28]["ArticleIdList"]), 1)
-        self.assertEqual(references[28]["ArticleIdList"][0], "25176287")
-        self.assertEqual(
-            references[28]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[29]["Citation"], "Radiology. 2004 Sep;232(3):739-48"
-        )
-        self.assertEqual(len(references[29]["ArticleIdList"]), 1)
-        self.assertEqual(references[29]["ArticleIdList"][0], "15333795")
-        self.assertEqual(
-            references[29]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[30]["Citation"], "Med Image Anal. 2015 Jul;23(1):43-55"
-        )
-        self.assertEqual(len(references[30]["ArticleIdList"]), 1)
-        self.assertEqual(references[30]["ArticleIdList"][0], "25958028")
-        self.assertEqual(
-            references[30]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[31]["Citation"], "Radiology. 2015 Oct;277(1):192-205"
-        )
-        self.assertEqual(len(references[31]["ArticleIdList"]), 1)
-        self.assertEqual(references[31]["ArticleIdList"][0], "25961632")
-        self.assertEqual(
-            references[31]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[32]["Citation"], "Med Image Anal. 2012 Oct;16(7):1423-35"
-        )
-        self.assertEqual(len(references[32]["ArticleIdList"]), 1)
-        self.assertEqual(references[32]["ArticleIdList"][0], "22722056")
-        self.assertEqual(
-            references[32]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[33]["Citation"], "Radiology. 2016 May;279(2):597-608"
-        )
-        self.assertEqual(len(references[33]["ArticleIdList"]), 1)
-        self.assertEqual(references[33]["ArticleIdList"][0], "26744928")
-        self.assertEqual(
-            references[33]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[34]["Citation"],
-            "J Allergy Clin Immunol. 2003 Jun;111(6):1205-11",
-        )
-        self.assertEqual(len(references[34]["ArticleIdList"]), 1)
-        self.assertEqual(references[34]["ArticleIdList"][0], "12789218")
-        self.assertEqual(
-            references[34]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[35]["Citation"], "J Magn Reson Imaging. 2016 Mar;43(3):544-57"
-        )
-        self.assertEqual(len(references[35]["ArticleIdList"]), 1)
-        self.assertEqual(references[35]["ArticleIdList"][0], "26199216")
-        self.assertEqual(
-            references[35]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[36]["Citation"],
-            "Am J Respir Crit Care Med. 2016 Oct 1;194(7):794-806",
-        )
-        self.assertEqual(len(references[36]["ArticleIdList"]), 1)
-        self.assertEqual(references[36]["ArticleIdList"][0], "27482984")
-        self.assertEqual(
-            references[36]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[37]["Citation"], "Radiology. 1996 Nov;201(2):564-8")
-        self.assertEqual(len(references[37]["ArticleIdList"]), 1)
-        self.assertEqual(references[37]["ArticleIdList"][0], "8888259")
-        self.assertEqual(
-            references[37]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[38]["Citation"], "Thorax. 2014 May;69(5):491-4")
-        self.assertEqual(len(references[38]["ArticleIdList"]), 1)
-        self.assertEqual(references[38]["ArticleIdList"][0], "24029743")
-        self.assertEqual(
-            references[38]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[39]["Citation"], "J Magn Reson Imaging. 2017 Apr;45(4):1204-1215"
-        )
-        self.assertEqual(len(references[39]["ArticleIdList"]), 1)
-        self.assertEqual(references[39]["ArticleIdList"][0], "27731948")
-        self.assertEqual(
-            references[39]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[40]["Citation"], "J Appl Physiol (1985). 2009 Oct;107(4):1258-65"
-        )
-        self.assertEqual(len(references[40]["ArticleIdList"]), 1)
-        self.assertEqual(references[40]["ArticleIdList"][0], "19661452")
-        self.assertEqual(
-            references[40]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[41]["Citation"], "Acad Radiol. 2016 Feb;23(2):176-85"
-        )
-        self.assertEqual(len(references[41]["ArticleIdList"]), 1)
-        self.assertEqual(references[41]["ArticleIdList"][0], "26601971")
-        self.assertEqual(
-            references[41]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[42]["Citation"], "Radiology. 2018 May;287(2):693-704"
-        )
-        self.assertEqual(len(references[42]["ArticleIdList"]), 1)
-        self.assertEqual(references[42]["ArticleIdList"][0], "29470939")
-        self.assertEqual(
-            references[42]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[43]["Citation"], "Eur Respir J. 2016 Aug;48(2):370-9"
-        )
-        self.assertEqual(len(references[43]["ArticleIdList"]), 1)
-        self.assertEqual(references[43]["ArticleIdList"][0], "27174885")
-        self.assertEqual(
-            references[43]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[44]["Citation"], "Radiology. 2011 Oct;261(1):283-92"
-        )
-        self.assertEqual(len(references[44]["ArticleIdList"]), 1)
-        self.assertEqual(references[44]["ArticleIdList"][0], "21813741")
-        self.assertEqual(
-            references[44]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[45]["Citation"],
-            "Am J Respir Crit Care Med. 2014 Mar 15;189(6):650-7",
-        )
-        self.assertEqual(len(references[45]["ArticleIdList"]), 1)
-        self.assertEqual(references[45]["ArticleIdList"][0], "24401150")
-        self.assertEqual(
-            references[45]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[46]["Citation"],
-            "Am J Respir Crit Care Med. 2012 Feb 15;185(4):356-62",
-        )
-        self.assertEqual(len(references[46]["ArticleIdList"]), 1)
-        self.assertEqual(references[46]["ArticleIdList"][0], "22095547")
-        self.assertEqual(
-            references[46]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(references[47]["Citation"], "COPD. 2010 Feb;7(1):32-43")
-        self.assertEqual(len(references[47]["ArticleIdList"]), 1)
-        self.assertEqual(references[47]["ArticleIdList"][0], "20214461")
-        self.assertEqual(
-            references[47]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-        self.assertEqual(
-            references[48]["Citation"], "Eur Respir J. 2008 Apr;31(4):869-73"
-        )
-        self.assertEqual(len(references[48]["ArticleIdList"]), 1)
-        self.assertEqual(references[48]["ArticleIdList"][0], "18216052")
-        self.assertEqual(
-            references[48]["ArticleIdList"][0].attributes["IdType"], "pubmed"
-        )
-
-    def test_pmc(self):
-        """Test parsing XML returned by EFetch from PubMed Central."""
-        # To create the XML file, use
-        # >>> Bio.Entrez.efetch(db='pmc', id="2682512,3468381")
-        with open("Entrez/efetch_pmc.xml", "rb") as stream:
-            records = Entrez.parse(stream)
-            records = list(records)
-        self.assertEqual(len(records), 1)
-        record = records[0]
-        self.assertEqual(len(record), 2)
-        self.assertEqual(len(record["front"]), 9)
-        self.assertEqual(len(record["front"]["journal-meta"]), 10)
-        self.assertEqual(len(record["front"]["journal-meta"]["journal-id"]), 4)
-        self.assertEqual(
-            record["front"]["journal-meta"]["journal-id"][0], "ERJ Open Res"
-        )
-        self.assertEqual(
-            record["front"]["journal-meta"]["journal-id"][0].attributes,
-            {"journal-id-type": "nlm-ta"},
-        )
-        self.assertEqual(
-            record["front"]["journal-meta"]["journal-id"][1], "ERJ Open Res"
-        )
-        self.assertEqual(
-            record["front"]["journal-meta"]["journal-id"][1].attributes,
-            {"journal-id-type": "iso-abbrev"},
-        )
-        self.assertEqual(record["front"]["journal-meta"]["journal-id"][2], "ERJOR")
-        self.assertEqual(
-            record["front"]["journal-meta"]["journal-id"][2].attributes,
-            {"journal-id-type": "publisher-id"},
-        )
-        self.assertEqual(record["front"]["journal-meta"]["journal-id"][3], "erjor")
-        self.assertEqual(
-            record["front"]["journal-meta"]["journal-id"][3].attributes,
-            {"journal-id-type": "hwp"},
-        )
-        self.assertEqual(len(record["front"]["journal-meta"]["journal-title-group"]), 1)
-        journal_title_group = record["front"]["journal-meta"]["journal-title-group"][0]
-        self.assertEqual(len(journal_title_group), 4)
-        self.assertEqual(journal_title_group["journal-title"], ["ERJ Open Research"])
-        self.assertEqual(journal_title_group["journal-subtitle"], [])
-        self.assertEqual(journal_title_group["abbrev-journal-title"], [])
-        self.assertEqual(journal_title_group["trans-title-group"], [])
-        self.assertEqual(len(record["front"]["journal-meta"]["issn"]), 1)
-        self.assertEqual(record["front"]["journal-meta"]["issn"][0], "2312-0541")
-        self.assertEqual(
-            record["front"]["journal-meta"]["issn"][0].attributes, {"pub-type": "epub"}
-        )
-        self.assertEqual(len(record["front"]["journal-meta"]["publisher"]), 1)
-        self.assertEqual(len(record["front"]["journal-meta"]["publisher"][0]), 1)
-        self.assertEqual(
-            record["front"]["journal-meta"]["publisher"][0][0],
-            "European Respiratory Society",
-        )
-        self.assertEqual(
-            record["front"]["journal-meta"]["publisher"][0][0].tag, "publisher-name"
-        )
-        self.assertEqual(record["front"]["journal-meta"]["contrib-group"], [])
-        self.assertEqual(record["front"]["journal-meta"]["notes"], [])
-        self.assertEqual(record["front"]["journal-meta"]["aff"], [])
-        self.assertEqual(record["front"]["journal-meta"]["aff-alternatives"], [])
-        self.assertEqual(record["front"]["journal-meta"]["self-uri"], [])
-        self.assertEqual(record["front"]["journal-meta"]["isbn"], [])
-        self.assertEqual(len(record["front"]["article-meta"]), 34)
-        self.assertEqual(record["front"]["article-meta"]["abstract"], [])
-        self.assertEqual(record["front"]["article-meta"]["funding-group"], [])
-        self.assertEqual(record["front"]["article-meta"]["aff"], [])
-        self.assertEqual(record["front"]["article-meta"]["issue-title"], [])
-        self.assertEqual(len(record["front"]["article-meta"]["pub-date"]), 3)
-        self.assertEqual(record["front"]["article-meta"]["pub-date"][0], ["7", "2021"])
-        self.assertEqual(
-            record["front"]["article-meta"]["pub-date"][0].attributes,
-            {"pub-type": "collection"},
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["pub-date"][1], ["13", "9", "2021"]
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["pub-date"][1].attributes,
-            {"pub-type": "epub"},
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["pub-date"][2], ["13", "9", "2021"]
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["pub-date"][2].attributes,
-            {"pub-type": "pmc-release"},
-        )
-        self.assertEqual(record["front"]["article-meta"]["conference"], [])
-        self.assertEqual(record["front"]["article-meta"]["supplementary-material"], [])
-        self.assertEqual(len(record["front"]["article-meta"]["related-article"]), 1)
-        self.assertEqual(record["front"]["article-meta"]["related-article"][0], "")
-        self.assertEqual(
-            record["front"]["article-meta"]["related-article"][0].attributes,
-            {
-                "related-article-type": "corrected-article",
-                "id": "d31e52",
-                "ext-link-type": "doi",
-                "http://www.w3.org/1999/xlink href": "10.1183/23120541.00193-2021",
-            },
-        )
-        self.assertEqual(record["front"]["article-meta"]["kwd-group"], [])
-        self.assertEqual(record["front"]["article-meta"]["contrib-group"], [])
-        self.assertEqual(record["front"]["article-meta"]["issue-sponsor"], [])
-        self.assertEqual(record["front"]["article-meta"]["self-uri"], [])
-        self.assertEqual(record["front"]["article-meta"]["product"], [])
-        self.assertEqual(record["front"]["article-meta"]["issue"], ["3"])
-        self.assertEqual(record["front"]["article-meta"]["ext-link"], [])
-        self.assertEqual(record["front"]["article-meta"]["support-group"], [])
-        self.assertEqual(len(record["front"]["article-meta"]["article-id"]), 4)
-        self.assertEqual(record["front"]["article-meta"]["article-id"][0], "34527728")
-        self.assertEqual(
-            record["front"]["article-meta"]["article-id"][0].attributes,
-            {"pub-id-type": "pmid"},
-        )
-        self.assertEqual(record["front"]["article-meta"]["article-id"][1], "8435807")
-        self.assertEqual(
-            record["front"]["article-meta"]["article-id"][1].attributes,
-            {"pub-id-type": "pmc"},
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["article-id"][2],
-            "10.1183/23120541.50193-2021",
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["article-id"][2].attributes,
-            {"pub-id-type": "doi"},
-        )
-        self.assertEqual(record["front"]["article-meta"]["article-id"][3], "50193-2021")
-        self.assertEqual(
-            record["front"]["article-meta"]["article-id"][3].attributes,
-            {"pub-id-type": "publisher-id"},
-        )
-        self.assertEqual(record["front"]["article-meta"]["issue-title-group"], [])
-        self.assertEqual(record["front"]["article-meta"]["x"], [])
-        self.assertEqual(record["front"]["article-meta"]["uri"], [])
-        self.assertEqual(record["front"]["article-meta"]["email"], [])
-        self.assertEqual(record["front"]["article-meta"]["volume-id"], [])
-        self.assertEqual(record["front"]["article-meta"]["issue-id"], [])
-        self.assertEqual(record["front"]["article-meta"]["trans-abstract"], [])
-        self.assertEqual(record["front"]["article-meta"]["volume-issue-group"], [])
-        self.assertEqual(record["front"]["article-meta"]["related-object"], [])
-        self.assertEqual(record["front"]["article-meta"]["isbn"], [])
-        self.assertEqual(record["front"]["article-meta"]["volume"], ["7"])
-        self.assertEqual(record["front"]["article-meta"]["aff-alternatives"], [])
-        self.assertEqual(
-            record["front"]["article-meta"]["article-version"], "Version of Record"
-        )
-        self.assertEqual(
-            len(record["front"]["article-meta"]["article-version"].attributes), 3
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["article-version"].attributes["vocab"],
-            "JAV",
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["article-version"].attributes[
-                "vocab-identifier"
-            ],
-            "http://www.niso.org/publications/rp/RP-8-2008.pdf",
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["article-version"].attributes[
-                "article-version-type"
-            ],
-            "VoR",
-        )
-        self.assertEqual(len(record["front"]["article-meta"]["article-categories"]), 3)
-        self.assertEqual(
-            record["front"]["article-meta"]["article-categories"]["series-text"], []
-        )
-        self.assertEqual(
-            len(record["front"]["article-meta"]["article-categories"]["subj-group"]), 1
-        )
-        self.assertEqual(
-            len(record["front"]["article-meta"]["article-categories"]["subj-group"][0]),
-            3,
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["article-categories"]["subj-group"][0][
-                "subject"
-            ],
-            ["Author Correction"],
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["article-categories"]["subj-group"][0][
-                "subj-group"
-            ],
-            [],
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["article-categories"]["subj-group"][0][
-                "compound-subject"
-            ],
-            [],
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["article-categories"]["subj-group"][
-                0
-            ].attributes,
-            {"subj-group-type": "heading"},
-        )
-        self.assertEqual(len(record["front"]["article-meta"]["title-group"]), 4)
-        self.assertEqual(
-            record["front"]["article-meta"]["title-group"]["trans-title-group"], []
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["title-group"]["alt-title"], []
-        )
-        self.assertEqual(record["front"]["article-meta"]["title-group"]["subtitle"], [])
-        self.assertEqual(
-            record["front"]["article-meta"]["title-group"]["article-title"],
-            '“Lung diffusing capacity for nitric oxide measured by two commercial devices: a randomised crossover comparison in healthy adults”. Thomas Radtke, Quintin de Groot, Sarah R. Haile, Marion Maggi, Connie C.W. Hsia and Holger Dressel. <italic toggle="yes">ERJ Open Res</italic> 2021; 7: 00193-2021.',
-        )
-        self.assertEqual(record["front"]["article-meta"]["elocation-id"], "50193-2021")
-        self.assertEqual(len(record["front"]["article-meta"]["permissions"]), 5)
-        self.assertEqual(
-            record["front"]["article-meta"]["permissions"]["copyright-year"], ["2021"]
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["permissions"]["copyright-holder"], []
-        )
-        self.assertEqual(
-            len(record["front"]["article-meta"]["permissions"]["license"]), 1
-        )
-        self.assertEqual(
-            len(record["front"]["article-meta"]["permissions"]["license"][0]), 2
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["permissions"]["license"][0][0],
-            "https://creativecommons.org/licenses/by-nc/4.0/",
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["permissions"]["license"][0][0].attributes,
-            {"specific-use": "textmining", "content-type": "ccbynclicense"},
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["permissions"]["license"][0][1],
-            'This version is distributed under the terms of the Creative Commons Attribution Non-Commercial Licence 4.0. For commercial reproduction rights and permissions contact <ext-link ext-link-type="uri" http://www.w3.org/1999/xlink href="mailto:permissions@ersnet.org">permissions@ersnet.org</ext-link>',
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["permissions"]["copyright-statement"],
-            ["Copyright ©The authors 2021"],
-        )
-        self.assertEqual(
-            record["front"]["article-meta"]["permissions"]["ali:free_to_read"], []
+            article["Abstract"]["AbstractText"][0],
+            """\
+We designed and generated pulmonary imaging biomarker pipelines to facilitate high-throughput research and point-of-care use in patients with chronic lung disease. Image processing modules and algorithm pipelines were embedded within a graphical user interface (based on the .NET framework) for pulmonary magnetic resonance imaging (MRI) and x-ray computed-tomography (CT) datasets. The software pipelines were generated using C++ and included: (1) inhaled <math xmlns="http://www.w3.org/1998/Math/MathML">
+                        <mrow>
+                            <mmultiscripts>
+                                <mrow>
+                                    <mi>He</mi>
+                                </mrow>
+                                <mprescripts></mprescripts>
+                                <none></none>
+                                <mrow>
+                                    <mn>3</mn>
+                                </mrow>
+                            </mmultiscripts>
+                            <mo>/</mo>
+                            <mmultiscripts>
+                                <mrow>
+                                    <mi>Xe</mi>
+                                </mrow>
+                                <mprescripts></mprescripts>
+                                <none></none>
+                                <mrow>
+                                    <mn>129</mn>
+                                </mrow>
+                            </mmultiscripts>
+                            <mtext> </mtext>
+                            <mi>MRI</mi>
+                        </mrow>
+                    </math> ventilation and apparent diffusion coefficients, (2) CT-MRI coregistration for lobar and segmental ventilation and perfusion measurements, (3) ultrashort echo-time <math xmlns="http://www.w3.org/1998/Math/MathML">
+                        <mrow>
+                            <mmultiscripts>
+                                <mrow>
+                                    <mi>H</mi>
+                                </mrow>
+                                <mprescripts></mprescripts>
+                                <none></none>
+                                <mrow>
+                                    <mn>1</mn>
+                                </mrow>
+                            </mmultiscripts>
+                            <mtext> </mtext>
+                            <mi>MRI</mi>
+                        </mrow>
+                    </math> proton density measurements, (4) free-breathing Fourier-decomposition <math xmlns="http://www.w3.org/1998/Math/MathML">
+                        <mrow>
+                            <mmultiscripts>
+                                <mrow>
+                                    <mi>H</mi>
+                                </mrow>
+                                <mprescripts></mprescripts>
+                                <none></none>
+                                <mrow>
+                                    <mn>1</mn>
+                                </mrow>
+                            </mmultiscripts>
+                            <mtext> </mtext>
+                            <mi>MRI</mi>
+                        </mrow>
+                    </math> ventilation/perfusion and free-breathing <math xmlns="http://www.w3.org/1998/Math/MathML">
+                        <mrow>
+                            <mmultiscripts>
+                                <mrow>
+                                    <mi>H</mi>
+                                </mrow>
+                                <mprescripts></mprescripts>
+                                <none></none>
+                                <mrow>
+                                    <mn>1</mn>
+                                </mrow>
+                            </mmultiscripts>
+                            <mtext> </mtext>
+                            <mi>MRI</mi>
+                        </mrow>
+                    </math> specific ventilation, (5)\u00a0multivolume CT and MRI parametric response maps, and (6)\u00a0MRI and CT texture analysis and radiomics. The image analysis framework was implemented on a desktop workstation/tablet to generate biomarkers of regional lung structure and function related to ventilation, perfusion, lung tissue texture, and integrity as well as multiparametric measures of gas trapping and airspace enlargement. All biomarkers were generated within 10 min with measurement reproducibility consistent with clinical and research requirements. The resultant pulmonary imaging biomarker pipeline provides real-time and automated lung imaging measurements for point-of-care and high-throughput research.""",
         )
-        self.assertEqual(record["front"]["glossary"], [])
-        self.assertEqual(record["front"]["fn-group"], [])
-        self.assertEqual(record["front"]["notes"], [])
-        self.assertEqual(record["front"]["bio"], [])
-        self.assertEqual(record["front"]["list"], [])
-        self.assertEqual(record["front"]["def-list"], [])
-        self.assertEqual(record["front"]["ack"], [])
-        self.assertEqual(len(record["body"]), 37)
-
-        self.assertEqual(record["body"]["table-wrap-group"], [])
-        self.assertEqual(record["body"]["disp-formula"], [])
-        self.assertEqual(record["body"]["answer-set"], [])
-        self.assertEqual(record["body"]["graphic"], [])
-        self.assertEqual(record["body"]["statement"], [])
-        self.assertEqual(record["body"]["fig-group"], [])
-        self.assertEqual(record["body"]["verse-group"], [])
-        self.assertEqual(record["body"]["supplementary-material"], [])
-        self.assertEqual(record["body"]["related-article"], [])
-        self.assertEqual(record["body"]["code"], [])
-        self.assertEqual(record["body"]["question"], [])
-        self.assertEqual(record["body"]["preformat"], [])
-        self.assertEqual(record["body"]["tex-math"], [])
-        self.assertEqual(record["body"]["mml:math"], [])
-        self.assertEqual(record["body"]["speech"], [])
-        self.assertEqual(record["body"]["block-alternatives"], [])
-        self.assertEqual(record["body"]["explanation"], [])
-        self.assertEqual(record["body"]["array"], [])
-        self.assertEqual(record["body"]["question-wrap-group"], [])
-        self.assertEqual(record["body"]["alternatives"], [])
-        self.assertEqual(record["body"]["media"], [])
-        self.assertEqual(record["body"]["x"], [])
-        self.assertEqual(record["body"]["sec"], [])
-        self.assertEqual(record["body"]["address"], [])
-        self.assertEqual(record["body"]["disp-quote"], [])
-        self.assertEqual(record["body"]["table-wrap"], [])
-        self.assertEqual(record["body"]["ack"], [])
-        self.assertEqual(record["body"]["chem-struct-wrap"], [])
-        self.assertEqual(record["body"]["related-object"], [])
-        self.assertEqual(record["body"]["list"], [])
-        self.assertEqual(record["body"]["def-list"], [])
-        self.assertEqual(
-            record["body"]["p"],
+        authors = article["AuthorList"]
+        self.assertEqual(authors.attributes, {"CompleteYN": "Y"})
+        robarts = "University of Western Ontario, Robarts Research Institute, London, Ontario, Canada."
+        engineering = "University of Western Ontario, Graduate Program in Biomedical Engineering, London, Ontario, Canada."
+        biophysics = "University of Western Ontario, Department of Medical Biophysics, London, Ontario, Canada."
+        self.assertListEqual(
+            authors,
             [
-                "This article was originally published with an error in table 2. The upper 95% confidence limit of the per cent difference in the primary end-point (diffusing capacity of the lung for nitric oxide) was incorrectly given as 15.1% and has now been corrected to −15.1% in the published article.\n"
+                {
+                    "Identifier": [],
+                    "AffiliationInfo": [
+                        {"Identifier": [], "Affiliation": robarts},
+                        {"Identifier": [], "Affiliation": engineering},
+                        {
+                            "Identifier": [],
+                            "Affiliation": "University of Toronto, Sunnybrook Research Institute, Toronto, Canada.",
+                        },
+                    ],
+                    "LastName": "Guo",
+                    "ForeName": "Fumin",
+                    "Initials": "F",
+                },
+                {
+                    "Identifier": ["https://orcid.org/0000-0002-4590-7461"],
+                    "AffiliationInfo": [
+                        {"Identifier": [], "Affiliation": robarts},
+                        {"Identifier": [], "Affiliation": biophysics},
+                    ],
+                    "LastName": "Capaldi",
+                    "ForeName": "Dante",
+                    "Initials": "D",
+                },
+                {
+                    "Identifier": [],
+                    "AffiliationInfo": [
+                        {
+                            "Identifier": [],
+                            "Affiliation": "University of British Columbia, St. Paul's Hospital, Centre for Heart Lung Innovation, Vancouver, Canada.",
+                        },
+                    ],
+                    "LastName": "Kirby",
+                    "ForeName": "Miranda",
+                    "Initials": "M",
+                },
+                {
+                    "Identifier": [],
+                    "AffiliationInfo": [{"Identifier": [], "Affiliation": robarts}],
+                    "LastName": "Sheikh",
+                    "ForeName": "Khadija",
+                    "Initials": "K",
+                },
+                {
+                    "Identifier": [],
+                    "AffiliationInfo": [{"Identifier": [], "Affiliation": robarts}],
+                    "LastName": "Svenningsen",
+                    "ForeName": "Sarah",
+                    "Initials": "S",
+                },
+                {
+                    "Identifier": [],
+                    "AffiliationInfo": [
+                        {
+                            "Identifier": [],
+                            "Affiliation": "University of Western Ontario, Division of Respirology, Department of Medicine, London, Ontario, Canada.",
+                        },
+                    ],
+                    "LastName": "McCormack",
+                    "ForeName": "David G",
+                    "Initials": "DG",
+                },
+                {
+                    "Identifier": ["https://orcid.org/0000-0003-3525-2788"],
+                    "AffiliationInfo": [
+                        {"Identifier": [], "Affiliation": robarts},
+                        {"Identifier": [], "Affiliation": engineering},
+                        {"Identifier": [], "Affiliation": biophysics},
+                    ],
+                    "LastName": "Fenster",
+                    "ForeName": "Aaron",
+                    "Initials": "A",
+                },
+                {
+                    "Identifier": [],
+                    "AffiliationInfo": [
+                        {"Identifier": [], "Affiliation": robarts},
+                        {"Identifier": [], "Affiliation": engineering},
+                        {"Identifier": [], "Affiliation": biophysics},
+                    ],
+                    "LastName": "Parraga",
+                    "ForeName": "Grace",
+                    "Initials": "G",
+                },
+                {
+                    "Identifier": [],
+                    "AffiliationInfo": [],
+                    "CollectiveName": "Canadian Respiratory Research Network",
+                },
             ],
         )
-        self.assertEqual(record["body"]["fig"], [])
-        self.assertEqual(record["body"]["answer"], [])
-        self.assertEqual(record["body"]["boxed-text"], [])
-        self.assertEqual(record["body"]["disp-formula-group"], [])
-        self.assertEqual(record["body"]["question-wrap"], [])
-
-    def test_taxonomy(self):
-        # Access the Taxonomy database using efetch.
-        # To create the XML file, use
-        # >>> Bio.Entrez.efetch(db="taxonomy", id="9615,9685", retmode="xml")
-        with open("Entrez/taxonomy.xml", "rb") as stream:
-            record = Entrez.read(stream)
-        # fmt: off
-        self.assertEqual(len(record), 2)
-        self.assertEqual(record[0]["TaxId"], "9615")
-        self.assertEqual(record[0]["ScientificName"], "Canis lupus familiaris")
-        self.assertEqual(record[0]["OtherNames"]["GenbankCommonName"], "dog")
-        self.assertEqual(len(record[0]["OtherNames"]["Synonym"]), 5)
-        self.assertEqual(record[0]["OtherNames"]["Synonym"][0], "Canis borealis")
-        self.assertEqual(record[0]["OtherNames"]["Synonym"][1], "Canis canis")
-        self.assertEqual(record[0]["OtherNames"]["Synonym"][2], "Canis domesticus")
-        self.assertEqual(record[0]["OtherNames"]["Synonym"][3], "Canis familiaris")
-        self.assertEqual(record[0]["OtherNames"]["Synonym"][4], "Canis lupus borealis")
-        self.assertEqual(len(record[0]["OtherNames"]["CommonName"]), 1)
-        self.assertEqual(record[0]["OtherNames"]["CommonName"][0], "dogs")
-        self.assertEqual(record[0]["OtherNames"]["Includes"][0], "beagle dog")
-        self.assertEqual(record[0]["OtherNames"]["Includes"][1], "beagle dogs")
-        self.assertEqual(record[0]["ParentTaxId"], "9612")
-        self.assertEqual(record[0]["Rank"], "subspecies")
-        self.assertEqual(record[0]["Division"], "Mammals")
-        self.assertEqual(record[0]["GeneticCode"]["GCId"], "1")
-        self.assertEqual(record[0]["GeneticCode"]["GCName"], "Standard")
-        self.assertEqual(record[0]["MitoGeneticCode"]["MGCId"], "2")
-        self.assertEqual(
-            record[0]["MitoGeneticCode"]["MGCName"], "Vertebrate Mitochondrial"
-        )
-        self.assertEqual(
-            record[0]["Lineage"],
-            "cellular organisms; Eukaryota; Opisthokonta; Metazoa; Eumetazoa; Bilateria; Deuterostomia; Chordata; Craniata; Vertebrata; Gnathostomata; Teleostomi; Euteleostomi; Sarcopterygii; Dipnotetrapodomorpha; Tetrapoda; Amniota; Mammalia; Theria; Eutheria; Boreoeutheria; Laurasiatheria; Carnivora; Caniformia; Canidae; Canis; Canis lupus",
-        )
-
-        self.assertEqual(record[0]["LineageEx"][0]["TaxId"], "131567")
-        self.assertEqual(
-            record[0]["LineageEx"][0]["ScientificName"], "cellular organisms"
-        )
-        self.assertEqual(record[0]["LineageEx"][0]["Rank"], "cellular root")
-        self.assertEqual(record[0]["LineageEx"][1]["TaxId"], "2759")
-        self.assertEqual(record[0]["LineageEx"][1]["ScientificName"], "Eukaryota")
-        self.assertEqual(record[0]["LineageEx"][1]["Rank"], "domain")
-        self.assertEqual(record[0]["LineageEx"][2]["TaxId"], "33154")
-        self.assertEqual(record[0]["LineageEx"][2]["ScientificName"], "Opisthokonta")
-        self.assertEqual(record[0]["LineageEx"][2]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][3]["TaxId"], "33208")
-        self.assertEqual(record[0]["LineageEx"][3]["ScientificName"], "Metazoa")
-        self.assertEqual(record[0]["LineageEx"][3]["Rank"], "kingdom")
-        self.assertEqual(record[0]["LineageEx"][4]["TaxId"], "6072")
-        self.assertEqual(record[0]["LineageEx"][4]["ScientificName"], "Eumetazoa")
-        self.assertEqual(record[0]["LineageEx"][4]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][5]["TaxId"], "33213")
-        self.assertEqual(record[0]["LineageEx"][5]["ScientificName"], "Bilateria")
-        self.assertEqual(record[0]["LineageEx"][5]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][6]["TaxId"], "33511")
-        self.assertEqual(record[0]["LineageEx"][6]["ScientificName"], "Deuterostomia")
-        self.assertEqual(record[0]["LineageEx"][6]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][7]["TaxId"], "7711")
-        self.assertEqual(record[0]["LineageEx"][7]["ScientificName"], "Chordata")
-        self.assertEqual(record[0]["LineageEx"][7]["Rank"], "phylum")
-        self.assertEqual(record[0]["LineageEx"][8]["TaxId"], "89593")
-        self.assertEqual(record[0]["LineageEx"][8]["ScientificName"], "Craniata")
-        self.assertEqual(record[0]["LineageEx"][8]["Rank"], "subphylum")
-        self.assertEqual(record[0]["LineageEx"][9]["TaxId"], "7742")
-        self.assertEqual(record[0]["LineageEx"][9]["ScientificName"], "Vertebrata")
-        self.assertEqual(record[0]["LineageEx"][9]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][10]["TaxId"], "7776")
-        self.assertEqual(record[0]["LineageEx"][10]["ScientificName"], "Gnathostomata")
-        self.assertEqual(record[0]["LineageEx"][10]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][11]["TaxId"], "117570")
-        self.assertEqual(record[0]["LineageEx"][11]["ScientificName"], "Teleostomi")
-        self.assertEqual(record[0]["LineageEx"][11]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][12]["TaxId"], "117571")
-        self.assertEqual(record[0]["LineageEx"][12]["ScientificName"], "Euteleostomi")
-        self.assertEqual(record[0]["LineageEx"][12]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][13]["TaxId"], "8287")
-        self.assertEqual(record[0]["LineageEx"][13]["ScientificName"], "Sarcopterygii")
-        self.assertEqual(record[0]["LineageEx"][13]["Rank"], "superclass")
-        self.assertEqual(record[0]["LineageEx"][14]["TaxId"], "1338369")
-        self.assertEqual(record[0]["LineageEx"][14]["ScientificName"], "Dipnotetrapodomorpha")
-        self.assertEqual(record[0]["LineageEx"][14]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][15]["TaxId"], "32523")
-        self.assertEqual(record[0]["LineageEx"][15]["ScientificName"], "Tetrapoda")
-        self.assertEqual(record[0]["LineageEx"][15]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][16]["TaxId"], "32524")
-        self.assertEqual(record[0]["LineageEx"][16]["ScientificName"], "Amniota")
-        self.assertEqual(record[0]["LineageEx"][16]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][17]["TaxId"], "40674")
-        self.assertEqual(record[0]["LineageEx"][17]["ScientificName"], "Mammalia")
-        self.assertEqual(record[0]["LineageEx"][17]["Rank"], "class")
-        self.assertEqual(record[0]["LineageEx"][18]["TaxId"], "32525")
-        self.assertEqual(record[0]["LineageEx"][18]["ScientificName"], "Theria")
-        self.assertEqual(record[0]["LineageEx"][18]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][19]["TaxId"], "9347")
-        self.assertEqual(record[0]["LineageEx"][19]["ScientificName"], "Eutheria")
-        self.assertEqual(record[0]["LineageEx"][19]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][20]["TaxId"], "1437010")
-        self.assertEqual(record[0]["LineageEx"][20]["ScientificName"], "Boreoeutheria")
-        self.assertEqual(record[0]["LineageEx"][20]["Rank"], "clade")
-        self.assertEqual(record[0]["LineageEx"][21]["TaxId"], "314145")
-        self.assertEqual(record[0]["LineageEx"][21]["ScientificName"], "Laurasiatheria")
-        self.assertEqual(record[0]["LineageEx"][21]["Rank"], "superorder")
-        self.assertEqual(record[0]["LineageEx"][22]["TaxId"], "33554")
-        self.assertEqual(record[0]["LineageEx"][22]["ScientificName"], "Carnivora")
-        self.assertEqual(record[0]["LineageEx"][22]["Rank"], "order")
-        self.assertEqual(record[0]["LineageEx"][23]["TaxId"], "379584")
-        self.assertEqual(record[0]["LineageEx"][23]["ScientificName"], "Caniformia")
-        self.assertEqual(record[0]["LineageEx"][23]["Rank"], "suborder")
-        self.assertEqual(record[0]["LineageEx"][24]["TaxId"], "9608")
-        self.assertEqual(record[0]["LineageEx"][24]["ScientificName"], "Canidae")
-        self.assertEqual(record[0]["LineageEx"][24]["Rank"], "family")
-        self.assertEqual(record[0]["LineageEx"][25]["TaxId"], "9611")
-        self.assertEqual(record[0]["LineageEx"][25]["ScientificName"], "Canis")
-        self.assertEqual(record[0]["LineageEx"][25]["Rank"], "genus")
-        self.assertEqual(record[0]["LineageEx"][26]["TaxId"], "9612")
-        self.assertEqual(record[0]["LineageEx"][26]["ScientificName"], "Canis lupus")
-        self.assertEqual(record[0]["LineageEx"][26]["Rank"], "species")
-        self.assertEqual(record[0]["CreateDate"], "1995/02/27 09:24:00")
-        self.assertEqual(record[0]["UpdateDate"], "2024/02/09 13:11:20")
-        self.assertEqual(record[0]["PubDate"], "1993/04/27 01:00:00")
-        self.assertEqual(record[1]["TaxId"], "9685")
-        self.assertEqual(record[1]["ScientificName"], "Felis catus")
-        self.assertEqual(record[1]["OtherNames"]["GenbankCommonName"], "domestic cat")
-        self.assertEqual(len(record[1]["OtherNames"]["Synonym"]), 2)
-        self.assertEqual(record[1]["OtherNames"]["Synonym"][0], "Felis domesticus")
-        self.assertEqual(record[1]["OtherNames"]["Synonym"][1], "Felis silvestris catus")
-        self.assertEqual(len(record[1]["OtherNames"]["CommonName"]), 2)
-        self.assertEqual(record[1]["OtherNames"]["CommonName"][0], "cat")
-        self.assertEqual(record[1]["OtherNames"]["CommonName"][1], "cats")
-        self.assertEqual(record[1]["OtherNames"]["Includes"][0], "Korat cats")
-        self.assertEqual(record[1]["ParentTaxId"], "9682")
-        self.assertEqual(record[1]["Rank"], "species")
-        self.assertEqual(record[1]["Division"], "Mammals")
-        self.assertEqual(record[1]["GeneticCode"]["GCId"], "1")
-        self.assertEqual(record[1]["GeneticCode"]["GCName"], "Standard")
-        self.assertEqual(record[1]["MitoGeneticCode"]["MGCId"], "2")
-        self.assertEqual(
-            record[1]["MitoGeneticCode"]["MGCName"], "Vertebrate Mitochondrial"
-        )
-        self.assertEqual(
-            record[1]["Lineage"],
-            "cellular organisms; Eukaryota; Opisthokonta; Metazoa; Eumetazoa; Bilateria; Deuterostomia; Chordata; Craniata; Vertebrata; Gnathostomata; Teleostomi; Euteleostomi; Sarcopterygii; Dipnotetrapodomorpha; Tetrapoda; Amniota; Mammalia; Theria; Eutheria; Boreoeutheria; Laurasiatheria; Carnivora; Feliformia; Felidae; Felinae; Felis",
-        )
-
-        self.assertEqual(record[1]["LineageEx"][0]["TaxId"], "131567")
-        self.assertEqual(
-            record[1]["LineageEx"][0]["ScientificName"], "cellular organisms"
-        )
-        self.assertEqual(record[1]["LineageEx"][0]["Rank"], "cellular root")
-        self.assertEqual(record[1]["LineageEx"][1]["TaxId"], "2759")
-        self.assertEqual(record[1]["LineageEx"][1]["ScientificName"], "Eukaryota")
-        self.assertEqual(record[1]["LineageEx"][1]["Rank"], "domain")
-        self.assertEqual(record[1]["LineageEx"][2]["TaxId"], "33154")
-        self.assertEqual(record[1]["LineageEx"][2]["ScientificName"], "Opisthokonta")
-        self.assertEqual(record[1]["LineageEx"][2]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][3]["TaxId"], "33208")
-        self.assertEqual(record[1]["LineageEx"][3]["ScientificName"], "Metazoa")
-        self.assertEqual(record[1]["LineageEx"][3]["Rank"], "kingdom")
-        self.assertEqual(record[1]["LineageEx"][4]["TaxId"], "6072")
-        self.assertEqual(record[1]["LineageEx"][4]["ScientificName"], "Eumetazoa")
-        self.assertEqual(record[1]["LineageEx"][4]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][5]["TaxId"], "33213")
-        self.assertEqual(record[1]["LineageEx"][5]["ScientificName"], "Bilateria")
-        self.assertEqual(record[1]["LineageEx"][5]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][6]["TaxId"], "33511")
-        self.assertEqual(record[1]["LineageEx"][6]["ScientificName"], "Deuterostomia")
-        self.assertEqual(record[1]["LineageEx"][6]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][7]["TaxId"], "7711")
-        self.assertEqual(record[1]["LineageEx"][7]["ScientificName"], "Chordata")
-        self.assertEqual(record[1]["LineageEx"][7]["Rank"], "phylum")
-        self.assertEqual(record[1]["LineageEx"][8]["TaxId"], "89593")
-        self.assertEqual(record[1]["LineageEx"][8]["ScientificName"], "Craniata")
-        self.assertEqual(record[1]["LineageEx"][8]["Rank"], "subphylum")
-        self.assertEqual(record[1]["LineageEx"][9]["TaxId"], "7742")
-        self.assertEqual(record[1]["LineageEx"][9]["ScientificName"], "Vertebrata")
-        self.assertEqual(record[1]["LineageEx"][9]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][10]["TaxId"], "7776")
-        self.assertEqual(record[1]["LineageEx"][10]["ScientificName"], "Gnathostomata")
-        self.assertEqual(record[1]["LineageEx"][10]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][11]["TaxId"], "117570")
-        self.assertEqual(record[1]["LineageEx"][11]["ScientificName"], "Teleostomi")
-        self.assertEqual(record[1]["LineageEx"][11]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][12]["TaxId"], "117571")
-        self.assertEqual(record[1]["LineageEx"][12]["ScientificName"], "Euteleostomi")
-        self.assertEqual(record[1]["LineageEx"][12]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][13]["TaxId"], "8287")
-        self.assertEqual(record[1]["LineageEx"][13]["ScientificName"], "Sarcopterygii")
-        self.assertEqual(record[1]["LineageEx"][13]["Rank"], "superclass")
-        self.assertEqual(record[1]["LineageEx"][14]["TaxId"], "1338369")
-        self.assertEqual(record[1]["LineageEx"][14]["ScientificName"], "Dipnotetrapodomorpha")
-        self.assertEqual(record[1]["LineageEx"][14]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][15]["TaxId"], "32523")
-        self.assertEqual(record[1]["LineageEx"][15]["ScientificName"], "Tetrapoda")
-        self.assertEqual(record[1]["LineageEx"][15]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][16]["TaxId"], "32524")
-        self.assertEqual(record[1]["LineageEx"][16]["ScientificName"], "Amniota")
-        self.assertEqual(record[1]["LineageEx"][16]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][17]["TaxId"], "40674")
-        self.assertEqual(record[1]["LineageEx"][17]["ScientificName"], "Mammalia")
-        self.assertEqual(record[1]["LineageEx"][17]["Rank"], "class")
-        self.assertEqual(record[1]["LineageEx"][18]["TaxId"], "32525")
-        self.assertEqual(record[1]["LineageEx"][18]["ScientificName"], "Theria")
-        self.assertEqual(record[1]["LineageEx"][18]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][19]["TaxId"], "9347")
-        self.assertEqual(record[1]["LineageEx"][19]["ScientificName"], "Eutheria")
-        self.assertEqual(record[1]["LineageEx"][19]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][20]["TaxId"], "1437010")
-        self.assertEqual(record[1]["LineageEx"][20]["ScientificName"], "Boreoeutheria")
-        self.assertEqual(record[1]["LineageEx"][20]["Rank"], "clade")
-        self.assertEqual(record[1]["LineageEx"][21]["TaxId"], "314145")
-        self.assertEqual(record[1]["LineageEx"][21]["ScientificName"], "Laurasiatheria")
-        self.assertEqual(record[1]["LineageEx"][21]["Rank"], "superorder")
-        self.assertEqual(record[1]["LineageEx"][22]["TaxId"], "33554")
-        self.assertEqual(record[1]["LineageEx"][22]["ScientificName"], "Carnivora")
-        self.assertEqual(record[1]["LineageEx"][22]["Rank"], "order")
-        self.assertEqual(record[1]["LineageEx"][23]["TaxId"], "379583")
-        self.assertEqual(record[1]["LineageEx"][23]["ScientificName"], "Feliformia")
-        self.assertEqual(record[1]["LineageEx"][23]["Rank"], "suborder")
-        self.assertEqual(record[1]["LineageEx"][24]["TaxId"], "9681")
-        self.assertEqual(record[1]["LineageEx"][24]["ScientificName"], "Felidae")
-        self.assertEqual(record[1]["LineageEx"][24]["Rank"], "family")
-        self.assertEqual(record[1]["LineageEx"][25]["TaxId"], "338152")
-        self.assertEqual(record[1]["LineageEx"][25]["ScientificName"], "Felinae")
-        self.assertEqual(record[1]["LineageEx"][25]["Rank"], "subfamily")
-        self.assertEqual(record[1]["LineageEx"][26]["TaxId"], "9682")
-        self.assertEqual(record[1]["LineageEx"][26]["ScientificName"], "Felis")
-        self.assertEqual(record[1]["LineageEx"][26]["Rank"], "genus")
-        self.assertEqual(record[1]["CreateDate"], "1995/02/27 09:24:00")
-        self.assertEqual(record[1]["UpdateDate"], "2024/03/03 11:27:08")
-        self.assertEqual(record[1]["PubDate"], "1993/07/26 01:00:00")
-        # fmt: on
-
-    def test_nucleotide1(self):
-        """Test parsing XML returned by EFetch, Nucleotide database (first test)."""
-        # Access the nucleotide database using efetch.
-        # To create the XML file, use
-        # >>> Bio.Entrez.efetch(db='nucleotide', id=5, retmode='xml')
-        with open("Entrez/nucleotide1.xml", "rb") as stream:
-            record = Entrez.read(stream)
-        # fmt: off
-        self.assertEqual(record[0]["GBSeq_locus"], "X60065")
-        self.assertEqual(record[0]["GBSeq_length"], "1136")
-        self.assertEqual(record[0]["GBSeq_strandedness"], "single")
-        self.assertEqual(record[0]["GBSeq_moltype"], "mRNA")
-        self.assertEqual(record[0]["GBSeq_topology"], "linear")
-        self.assertEqual(record[0]["GBSeq_division"], "MAM")
-        self.assertEqual(record[0]["GBSeq_update-date"], "26-JUL-2016")
-        self.assertEqual(record[0]["GBSeq_create-date"], "05-MAY-1992")
-        self.assertEqual(
-            record[0]["GBSeq_definition"],
-            "B.bovis beta-2-gpI mRNA for beta-2-glycoprotein I",
-        )
-        self.assertEqual(record[0]["GBSeq_primary-accession"], "X60065")
-        self.assertEqual(record[0]["GBSeq_accession-version"], "X60065.1")
-        self.assertEqual(record[0]["GBSeq_other-seqids"][0], "emb|X60065.1|")
-        self.assertEqual(record[0]["GBSeq_other-seqids"][1], "gi|5")
-        self.assertEqual(record[0]["GBSeq_keywords"][0], "beta-2 glycoprotein I")
-        self.assertEqual(record[0]["GBSeq_source"], "Bos taurus (domestic cattle)")
-        self.assertEqual(record[0]["GBSeq_organism"], "Bos taurus")
-        self.assertEqual(
-            record[0]["GBSeq_taxonomy"],
-            "Eukaryota; Metazoa; Chordata; Craniata; Vertebrata; Euteleostomi; Mammalia; Eutheria; Laurasiatheria; Artiodactyla; Ruminantia; Pecora; Bovidae; Bovinae; Bos",
-        )
-        self.assertEqual(record[0]["GBSeq_references"][0]["GBReference_reference"], "1")
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_authors"][0], "Bendixen,E."
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_authors"][1], "Halkier,T."
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_authors"][2], "Magnusson,S."
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_authors"][3], "Sottrup-Jensen,L.",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_authors"][4], "Kristensen,T."
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_title"],
-            "Complete primary structure of bovine beta 2-glycoprotein I: localization of the disulfide bridges",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_journal"],
-            "Biochemistry 31 (14), 3611-3617 (1992)",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_pubmed"], "1567819"
-        )
-        self.assertEqual(record[0]["GBSeq_references"][1]["GBReference_reference"], "2")
-        self.assertEqual(
-            record[0]["GBSeq_references"][1]["GBReference_position"], "1..1136"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][1]["GBReference_authors"][0], "Kristensen,T."
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][1]["GBReference_title"], "Direct Submission"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][1]["GBReference_journal"],
-            "Submitted (11-JUN-1991) T. Kristensen, Dept of Mol Biology, University of Aarhus, C F Mollers Alle 130, DK-8000 Aarhus C, DENMARK",
-        )
-        self.assertEqual(len(record[0]["GBSeq_feature-table"]), 7)
-        self.assertEqual(record[0]["GBSeq_feature-table"][0]["GBFeature_key"], "source")
-        self.assertEqual(record[0]["GBSeq_feature-table"][0]["GBFeature_location"], "1..1136")
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_intervals"][0]["GBInterval_from"],
-            "1",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_intervals"][0]["GBInterval_to"],
-            "1136",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_intervals"][0]["GBInterval_accession"],
-            "X60065.1",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][0]["GBQualifier_name"],
-            "organism",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][0]["GBQualifier_value"],
-            "Bos taurus",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][1]["GBQualifier_name"],
-            "mol_type",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][1]["GBQualifier_value"],
-            "mRNA",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][2]["GBQualifier_name"],
-            "db_xref",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][2]["GBQualifier_value"],
-            "taxon:9913",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][3]["GBQualifier_name"],
-            "clone",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][3]["GBQualifier_value"],
-            "pBB2I",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][4]["GBQualifier_name"],
-            "tissue_type",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][4]["GBQualifier_value"],
-            "liver",
-        )
-        self.assertEqual(record[0]["GBSeq_feature-table"][1]["GBFeature_key"], "gene")
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_location"], "<1..1136"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_intervals"][0]["GBInterval_from"],
-            "1",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_intervals"][0]["GBInterval_to"],
-            "1136",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_intervals"][0]["GBInterval_accession"],
-            "X60065.1",
-        )
-        self.assertEqual(record[0]["GBSeq_feature-table"][1]["GBFeature_partial5"], "")
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_partial5"].attributes["value"],
-            "true",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_quals"][0]["GBQualifier_name"],
-            "gene",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_quals"][0]["GBQualifier_value"],
-            "beta-2-gpI",
-        )
-        self.assertEqual(record[0]["GBSeq_feature-table"][2]["GBFeature_key"], "CDS")
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_location"], "<1..1029"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_intervals"][0]["GBInterval_from"],
-            "1",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_intervals"][0]["GBInterval_to"],
-            "1029",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_intervals"][0]["GBInterval_accession"],
-            "X60065.1",
-        )
-        self.assertEqual(record[0]["GBSeq_feature-table"][2]["GBFeature_partial5"], "")
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_partial5"].attributes["value"],
-            "true",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][0]["GBQualifier_name"],
-            "gene",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][0]["GBQualifier_value"],
-            "beta-2-gpI",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][1]["GBQualifier_name"],
-            "codon_start",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][1]["GBQualifier_value"],
-            "1",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][2]["GBQualifier_name"],
-            "transl_table",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][2]["GBQualifier_value"],
-            "1",
-        )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][3]["GBQualifier_name"],
-            "product",
+            [author.attributes for author in authors], [{"ValidYN": "Y"}] * len(authors)
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][3]["GBQualifier_value"],
-            "beta-2-glycoprotein I",
+            [
+                [identifier.attributes for identifier in author["Identifier"]]
+                for author in authors
+            ],
+            [[], [{"Source": "ORCID"}], [], [], [], [], [{"Source": "ORCID"}], [], []],
         )
+        self.assertEqual(len(article["Language"]), 1)
+        self.assertEqual(article["Language"][0], "eng")
+        self.assertEqual(len(article["PublicationTypeList"]), 1)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][4]["GBQualifier_name"],
-            "protein_id",
+            article["PublicationTypeList"][0].attributes, {"UI": "D016428"}
         )
+        self.assertEqual(article["PublicationTypeList"][0], "Journal Article")
+        self.assertEqual(len(article["ArticleDate"]), 1)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][4]["GBQualifier_value"],
-            "CAA42669.1",
+            article["ArticleDate"][0].attributes, {"DateType": "Electronic"}
         )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][5]["GBQualifier_name"],
-            "db_xref",
+        self.assertDictEqual(
+            article["ArticleDate"][0], {"Year": "2018", "Month": "06", "Day": "28"}
         )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][5]["GBQualifier_value"],
-            "GOA:P17690",
+        self.assertDictEqual(
+            medline_citation["MedlineJournalInfo"],
+            {
+                "Country": "United States",
+                "MedlineTA": "J Med Imaging (Bellingham)",
+                "NlmUniqueID": "101643461",
+                "ISSNLinking": "2329-4302",
+            },
         )
+        self.assertEqual(len(medline_citation["KeywordList"]), 1)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][6]["GBQualifier_name"],
-            "db_xref",
+            medline_citation["KeywordList"][0].attributes, {"Owner": "NOTNLM"}
         )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][6]["GBQualifier_value"],
-            "InterPro:IPR000436",
+        keywords = medline_citation["KeywordList"][0]
+        self.assertListEqual(
+            keywords,
+            [
+                "asthma",
+                "chronic obstructive lung disease",
+                "image processing, biomarkers",
+                "magnetic resonance imaging",
+                "thoracic computed tomography",
+            ],
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][7]["GBQualifier_name"],
-            "db_xref",
+            [keyword.attributes for keyword in keywords],
+            [{"MajorTopicYN": "N"}] * len(keywords),
         )
+        pubmed_data = pubmed_article["PubmedData"]
+        added = {"Year": "2018", "Month": "7", "Day": "3", "Hour": "6", "Minute": "0"}
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][7]["GBQualifier_value"],
-            "InterPro:IPR015104",
+            [(entry, entry.attributes) for entry in pubmed_data["History"]],
+            [
+                (
+                    {"Year": "2017", "Month": "12", "Day": "12"},
+                    {"PubStatus": "received"},
+                ),
+                (
+                    {"Year": "2018", "Month": "06", "Day": "14"},
+                    {"PubStatus": "accepted"},
+                ),
+                (
+                    {"Year": "2019", "Month": "06", "Day": "28"},
+                    {"PubStatus": "pmc-release"},
+                ),
+                (added, {"PubStatus": "entrez"}),
+                (added, {"PubStatus": "pubmed"}),
+                (
+                    {
+                        "Year": "2018",
+                        "Month": "7",
+                        "Day": "3",
+                        "Hour": "6",
+                        "Minute": "1",
+                    },
+                    {"PubStatus": "medline"},
+                ),
+            ],
         )
+        self.assertEqual(pubmed_data["PublicationStatus"], "ppublish")
+        self.assertEqual(len(pubmed_data["ArticleIdList"]), 4)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][8]["GBQualifier_name"],
-            "db_xref",
+            [
+                (article_id, article_id.attributes)
+                for article_id in pubmed_data["ArticleIdList"]
+            ],
+            [
+                ("29963580", {"IdType": "pubmed"}),
+                ("10.1117/1.JMI.5.2.026002", {"IdType": "doi"}),
+                ("17360RR", {"IdType": "pii"}),
+                ("PMC6022861", {"IdType": "pmc"}),
+            ],
         )
+        self.assertEqual(len(pubmed_data["ReferenceList"]), 1)
+        reference_list = pubmed_data["ReferenceList"][0]
+        self.assertEqual(len(reference_list), 2)
+        self.assertEqual(len(reference_list["ReferenceList"]), 0)
+        references = reference_list["Reference"]
+        self.assertEqual(len(references), 49)
+        cited = [
+            ("Radiology. 2015 Jan;274(1):250-9", "25144646"),
+            ("Nature. 1994 Jul 21;370(6486):199-201", "8028666"),
+            ("Magn Reson Med. 2009 Sep;62(3):656-64", "19585597"),
+            ("Radiology. 2016 Feb;278(2):563-77", "26579733"),
+            ("Radiology. 1991 Jun;179(3):777-81", "2027991"),
+            ("Radiology. 2010 Jul;256(1):280-9", "20574101"),
+            ("Phys Med Biol. 2001 May;46(5):R67-99", "11384074"),
+            ("IEEE Trans Med Imaging. 2011 Nov;30(11):1901-20", "21632295"),
+            ("Eur J Cancer. 2012 Mar;48(4):441-6", "22257792"),
+            ("Med Phys. 2017 May;44(5):1718-1733", "28206676"),
+            ("COPD. 2014 Apr;11(2):125-32", "22433011"),
+            ("Am J Respir Crit Care Med. 2015 Nov 15;192(10):1215-22", "26186608"),
+            ("N Engl J Med. 2016 May 12;374(19):1811-21", "27168432"),
+            ("Am J Epidemiol. 2002 Nov 1;156(9):871-81", "12397006"),
+            ("BMC Cancer. 2014 Dec 11;14:934", "25496482"),
+            ("Acad Radiol. 2015 Mar;22(3):320-9", "25491735"),
+            ("Chest. 1999 Dec;116(6):1750-61", "10593802"),
+            ("Acad Radiol. 2012 Feb;19(2):141-52", "22104288"),
+            ("Med Phys. 2014 Mar;41(3):033502", "24593744"),
+            ("Med Phys. 2008 Oct;35(10):4695-707", "18975715"),
+            ("Thorax. 2017 May;72(5):475-477", "28258250"),
+            ("Nat Med. 1996 Nov;2(11):1236-9", "8898751"),
+            ("J Magn Reson Imaging. 2015 May;41(5):1465-74", "24965907"),
+            ("Acad Radiol. 2008 Jun;15(6):776-85", "18486013"),
+            ("Magn Reson Med. 2000 Aug;44(2):174-9", "10918314"),
+            ("Am J Respir Crit Care Med. 2014 Jul 15;190(2):135-44", "24873985"),
+            ("Med Phys. 2016 Jun;43(6):2911-2926", "27277040"),
+            ("Nat Med. 2009 May;15(5):572-6", "19377487"),
+            ("Eur J Radiol. 2014 Nov;83(11):2093-101", "25176287"),
+            ("Radiology. 2004 Sep;232(3):739-48", "15333795"),
+            ("Med Image Anal. 2015 Jul;23(1):43-55", "25958028"),
+            ("Radiology. 2015 Oct;277(1):192-205", "25961632"),
+            ("Med Image Anal. 2012 Oct;16(7):1423-35", "22722056"),
+            ("Radiology. 2016 May;279(2):597-608", "26744928"),
+            ("J Allergy Clin Immunol. 2003 Jun;111(6):1205-11", "12789218"),
+            ("J Magn Reson Imaging. 2016 Mar;43(3):544-57", "26199216"),
+            ("Am J Respir Crit Care Med. 2016 Oct 1;194(7):794-806", "27482984"),
+            ("Radiology. 1996 Nov;201(2):564-8", "8888259"),
+            ("Thorax. 2014 May;69(5):491-4", "24029743"),
+            ("J Magn Reson Imaging. 2017 Apr;45(4):1204-1215", "27731948"),
+            ("J Appl Physiol (1985). 2009 Oct;107(4):1258-65", "19661452"),
+            ("Acad Radiol. 2016 Feb;23(2):176-85", "26601971"),
+            ("Radiology. 2018 May;287(2):693-704", "29470939"),
+            ("Eur Respir J. 2016 Aug;48(2):370-9", "27174885"),
+            ("Radiology. 2011 Oct;261(1):283-92", "21813741"),
+            ("Am J Respir Crit Care Med. 2014 Mar 15;189(6):650-7", "24401150"),
+            ("Am J Respir Crit Care Med. 2012 Feb 15;185(4):356-62", "22095547"),
+            ("COPD. 2010 Feb;7(1):32-43", "20214461"),
+            ("Eur Respir J. 2008 Apr;31(4):869-73", "18216052"),
+        ]
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][8]["GBQualifier_value"],
-            "InterPro:IPR016060",
+            [
+                (reference["Citation"], reference["ArticleIdList"])
+                for reference in references
+            ],
+            [(citation, [pmid]) for citation, pmid in cited],
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_key"], "sig_peptide"
+            [reference["ArticleIdList"][0].attributes for reference in references],
+            [{"IdType": "pubmed"}] * len(references),
         )
+
+    def test_pmc(self):
+        """Test parsing XML returned by EFetch from PubMed Central."""
+        # To create the XML file, use
+        # >>> Bio.Entrez.efetch(db='pmc', id="2682512,3468381")
+        with open("Entrez/efetch_pmc.xml", "rb") as stream:
+            records = Entrez.parse(stream)
+            record = next(records)
+            self.assertRaises(StopIteration, next, records)
+        self.assertEqual(len(record), 2)
+        front = record["front"]
+        self.assertEqual(len(front), 9)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_location"], "<1..48"
+            {key for key, value in front.items() if value == []},
+            {"glossary", "fn-group", "notes", "bio", "list", "def-list", "ack"},
         )
+        journal_meta = front["journal-meta"]
+        self.assertEqual(len(journal_meta), 10)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_intervals"][0]["GBInterval_from"],
-            "1",
+            {key for key, value in journal_meta.items() if value == []},
+            {"contrib-group", "notes", "aff", "aff-alternatives", "self-uri", "isbn"},
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_intervals"][0]["GBInterval_to"],
-            "48",
+            [
+                (journal_id, journal_id.attributes)
+                for journal_id in journal_meta["journal-id"]
+            ],
+            [
+                ("ERJ Open Res", {"journal-id-type": "nlm-ta"}),
+                ("ERJ Open Res", {"journal-id-type": "iso-abbrev"}),
+                ("ERJOR", {"journal-id-type": "publisher-id"}),
+                ("erjor", {"journal-id-type": "hwp"}),
+            ],
         )
+        self.assertEqual(len(journal_meta["journal-title-group"]), 1)
+        journal_title_group = journal_meta["journal-title-group"][0]
+        self.assertEqual(len(journal_title_group), 4)
+        self.assertEqual(journal_title_group["journal-title"], ["ERJ Open Research"])
+        self.assertEqual(journal_title_group["journal-subtitle"], [])
+        self.assertEqual(journal_title_group["abbrev-journal-title"], [])
+        self.assertEqual(journal_title_group["trans-title-group"], [])
+        self.assertEqual(len(journal_meta["issn"]), 1)
+        self.assertEqual(journal_meta["issn"][0], "2312-0541")
+        self.assertEqual(journal_meta["issn"][0].attributes, {"pub-type": "epub"})
+        self.assertEqual(len(journal_meta["publisher"]), 1)
+        self.assertEqual(len(journal_meta["publisher"][0]), 1)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_intervals"][0]["GBInterval_accession"],
-            "X60065.1",
+            journal_meta["publisher"][0][0],
+            "European Respiratory Society",
         )
-        self.assertEqual(record[0]["GBSeq_feature-table"][3]["GBFeature_partial5"], "")
+        self.assertEqual(journal_meta["publisher"][0][0].tag, "publisher-name")
+        article_meta = front["article-meta"]
+        self.assertEqual(len(article_meta), 34)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_partial5"].attributes["value"],
-            "true",
+            {key for key, value in article_meta.items() if value == []},
+            {
+                "abstract",
+                "funding-group",
+                "aff",
+                "issue-title",
+                "conference",
+                "supplementary-material",
+                "kwd-group",
+                "contrib-group",
+                "issue-sponsor",
+                "self-uri",
+                "product",
+                "ext-link",
+                "support-group",
+                "issue-title-group",
+                "x",
+                "uri",
+                "email",
+                "volume-id",
+                "issue-id",
+                "trans-abstract",
+                "volume-issue-group",
+                "related-object",
+                "isbn",
+                "aff-alternatives",
+            },
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][0]["GBQualifier_name"],
-            "gene",
+            [(pub_date, pub_date.attributes) for pub_date in article_meta["pub-date"]],
+            [
+                (["7", "2021"], {"pub-type": "collection"}),
+                (["13", "9", "2021"], {"pub-type": "epub"}),
+                (["13", "9", "2021"], {"pub-type": "pmc-release"}),
+            ],
         )
+        self.assertEqual(len(article_meta["related-article"]), 1)
+        self.assertEqual(article_meta["related-article"][0], "")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][0]["GBQualifier_value"],
-            "beta-2-gpI",
+            article_meta["related-article"][0].attributes,
+            {
+                "related-article-type": "corrected-article",
+                "id": "d31e52",
+                "ext-link-type": "doi",
+                "http://www.w3.org/1999/xlink href": "10.1183/23120541.00193-2021",
+            },
         )
+        self.assertEqual(article_meta["issue"], ["3"])
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_key"], "mat_peptide"
+            [
+                (article_id, article_id.attributes)
+                for article_id in article_meta["article-id"]
+            ],
+            [
+                ("34527728", {"pub-id-type": "pmid"}),
+                ("8435807", {"pub-id-type": "pmc"}),
+                ("10.1183/23120541.50193-2021", {"pub-id-type": "doi"}),
+                ("50193-2021", {"pub-id-type": "publisher-id"}),
+            ],
         )
+        self.assertEqual(article_meta["volume"], ["7"])
+        self.assertEqual(article_meta["article-version"], "Version of Record")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_location"], "49..1026"
+            article_meta["article-version"].attributes,
+            {
+                "vocab": "JAV",
+                "vocab-identifier": "http://www.niso.org/publications/rp/RP-8-2008.pdf",
+                "article-version-type": "VoR",
+            },
         )
+        article_categories = article_meta["article-categories"]
+        self.assertEqual(len(article_categories), 3)
+        self.assertEqual(article_categories["series-text"], [])
+        self.assertEqual(len(article_categories["subj-group"]), 1)
+        self.assertEqual(len(article_categories["subj-group"][0]), 3)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_intervals"][0]["GBInterval_from"],
-            "49",
+            article_categories["subj-group"][0]["subject"],
+            ["Author Correction"],
         )
+        self.assertEqual(article_categories["subj-group"][0]["subj-group"], [])
+        self.assertEqual(article_categories["subj-group"][0]["compound-subject"], [])
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_intervals"][0]["GBInterval_to"],
-            "1026",
+            article_categories["subj-group"][0].attributes,
+            {"subj-group-type": "heading"},
         )
+        title_group = article_meta["title-group"]
+        self.assertEqual(len(title_group), 4)
+        self.assertEqual(title_group["trans-title-group"], [])
+        self.assertEqual(title_group["alt-title"], [])
+        self.assertEqual(title_group["subtitle"], [])
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_intervals"][0]["GBInterval_accession"],
-            "X60065.1",
+            title_group["article-title"],
+            '“Lung diffusing capacity for nitric oxide measured by two commercial devices: a randomised crossover comparison in healthy adults”. Thomas Radtke, Quintin de Groot, Sarah R. Haile, Marion Maggi, Connie C.W. Hsia and Holger Dressel. <italic toggle="yes">ERJ Open Res</italic> 2021; 7: 00193-2021.',
         )
+        self.assertEqual(article_meta["elocation-id"], "50193-2021")
+        permissions = article_meta["permissions"]
+        self.assertEqual(len(permissions), 5)
+        self.assertEqual(permissions["copyright-year"], ["2021"])
+        self.assertEqual(permissions["copyright-holder"], [])
+        self.assertEqual(len(permissions["license"]), 1)
+        self.assertEqual(len(permissions["license"][0]), 2)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_quals"][0]["GBQualifier_name"],
-            "gene",
+            permissions["license"][0][0],
+            "https://creativecommons.org/licenses/by-nc/4.0/",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_quals"][0]["GBQualifier_value"],
-            "beta-2-gpI",
+            permissions["license"][0][0].attributes,
+            {"specific-use": "textmining", "content-type": "ccbynclicense"},
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_quals"][1]["GBQualifier_name"],
-            "product",
+            permissions["license"][0][1],
+            'This version is distributed under the terms of the Creative Commons Attribution Non-Commercial Licence 4.0. For commercial reproduction rights and permissions contact <ext-link ext-link-type="uri" http://www.w3.org/1999/xlink href="mailto:permissions@ersnet.org">permissions@ersnet.org</ext-link>',
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_quals"][1]["GBQualifier_value"],
-            "beta-2-glycoprotein I",
+            permissions["copyright-statement"],
+            ["Copyright ©The authors 2021"],
         )
+        self.assertEqual(permissions["ali:free_to_read"], [])
+        body = record["body"]
+        self.assertEqual(len(body), 37)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_quals"][2]["GBQualifier_name"],
-            "peptide",
+            {key for key, value in body.items() if value == []},
+            {
+                "table-wrap-group",
+                "disp-formula",
+                "answer-set",
+                "graphic",
+                "statement",
+                "fig-group",
+                "verse-group",
+                "supplementary-material",
+                "related-article",
+                "code",
+                "question",
+                "preformat",
+                "tex-math",
+                "mml:math",
+                "speech",
+                "block-alternatives",
+                "explanation",
+                "array",
+                "question-wrap-group",
+                "alternatives",
+                "media",
+                "x",
+                "sec",
+                "address",
+                "disp-quote",
+                "table-wrap",
+                "ack",
+                "chem-struct-wrap",
+                "related-object",
+                "list",
+                "def-list",
+                "fig",
+                "answer",
+                "boxed-text",
+                "disp-formula-group",
+                "question-wrap",
+            },
         )
+
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][4]["GBFeature_quals"][2]["GBQualifier_value"],
-            "GRTCPKPDELPFSTVVPLKRTYEPGEQIVFSCQPGYVSRGGIRRFTCPLTGLWPINTLKCMPRVCPFAGILENGTVRYTTFEYPNTISFSCHTGFYLKGASSAKCTEEGKWSPDLPVCAPITCPPPPIPKFASLSVYKPLAGNNSFYGSKAVFKCLPHHAMFGNDTVTCTEHGNWTQLPECREVRCPFPSRPDNGFVNHPANPVLYYKDTATFGCHETYSLDGPEEVECSKFGNWSAQPSCKASCKLSIKRATVIYEGERVAIQNKFKNGMLHGQKVSFFCKHKEKKCSYTEDAQCIDGTIEIPKCFKEHSSLAFWKTDASDVKPC",
+            body["p"],
+            [
+                "This article was originally published with an error in table 2. The upper 95% confidence limit of the per cent difference in the primary end-point (diffusing capacity of the lung for nitric oxide) was incorrectly given as 15.1% and has now been corrected to −15.1% in the published article.\n"
+            ],
         )
+
+    def test_taxonomy(self):
+        # Access the Taxonomy database using efetch.
+        # To create the XML file, use
+        # >>> Bio.Entrez.efetch(db="taxonomy", id="9615,9685", retmode="xml")
+        with open("Entrez/taxonomy.xml", "rb") as stream:
+            record = Entrez.read(stream)
+        # fmt: off
+        self.assertEqual(len(record), 2)
+        self.assertEqual(record[0]["TaxId"], "9615")
+        self.assertEqual(record[0]["ScientificName"], "Canis lupus familiaris")
+        self.assertEqual(record[0]["OtherNames"]["GenbankCommonName"], "dog")
+        self.assertEqual(len(record[0]["OtherNames"]["Synonym"]), 5)
+        self.assertEqual(record[0]["OtherNames"]["Synonym"][0], "Canis borealis")
+        self.assertEqual(record[0]["OtherNames"]["Synonym"][1], "Canis canis")
+        self.assertEqual(record[0]["OtherNames"]["Synonym"][2], "Canis domesticus")
+        self.assertEqual(record[0]["OtherNames"]["Synonym"][3], "Canis familiaris")
+        self.assertEqual(record[0]["OtherNames"]["Synonym"][4], "Canis lupus borealis")
+        self.assertEqual(len(record[0]["OtherNames"]["CommonName"]), 1)
+        self.assertEqual(record[0]["OtherNames"]["CommonName"][0], "dogs")
+        self.assertEqual(record[0]["OtherNames"]["Includes"][0], "beagle dog")
+        self.assertEqual(record[0]["OtherNames"]["Includes"][1], "beagle dogs")
+        self.assertEqual(record[0]["ParentTaxId"], "9612")
+        self.assertEqual(record[0]["Rank"], "subspecies")
+        self.assertEqual(record[0]["Division"], "Mammals")
+        self.assertEqual(record[0]["GeneticCode"]["GCId"], "1")
+        self.assertEqual(record[0]["GeneticCode"]["GCName"], "Standard")
+        self.assertEqual(record[0]["MitoGeneticCode"]["MGCId"], "2")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][5]["GBFeature_key"], "regulatory",
+            record[0]["MitoGeneticCode"]["MGCName"], "Vertebrate Mitochondrial"
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][5]["GBFeature_location"], "1101..1106"
+            record[0]["Lineage"],
+            "cellular organisms; Eukaryota; Opisthokonta; Metazoa; Eumetazoa; Bilateria; Deuterostomia; Chordata; Craniata; Vertebrata; Gnathostomata; Teleostomi; Euteleostomi; Sarcopterygii; Dipnotetrapodomorpha; Tetrapoda; Amniota; Mammalia; Theria; Eutheria; Boreoeutheria; Laurasiatheria; Carnivora; Caniformia; Canidae; Canis; Canis lupus",
         )
+
+        carnivora = [
+            ("131567", "cellular organisms", "cellular root"),
+            ("2759", "Eukaryota", "domain"),
+            ("33154", "Opisthokonta", "clade"),
+            ("33208", "Metazoa", "kingdom"),
+            ("6072", "Eumetazoa", "clade"),
+            ("33213", "Bilateria", "clade"),
+            ("33511", "Deuterostomia", "clade"),
+            ("7711", "Chordata", "phylum"),
+            ("89593", "Craniata", "subphylum"),
+            ("7742", "Vertebrata", "clade"),
+            ("7776", "Gnathostomata", "clade"),
+            ("117570", "Teleostomi", "clade"),
+            ("117571", "Euteleostomi", "clade"),
+            ("8287", "Sarcopterygii", "superclass"),
+            ("1338369", "Dipnotetrapodomorpha", "clade"),
+            ("32523", "Tetrapoda", "clade"),
+            ("32524", "Amniota", "clade"),
+            ("40674", "Mammalia", "class"),
+            ("32525", "Theria", "clade"),
+            ("9347", "Eutheria", "clade"),
+            ("1437010", "Boreoeutheria", "clade"),
+            ("314145", "Laurasiatheria", "superorder"),
+            ("33554", "Carnivora", "order"),
+        ]
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][5]["GBFeature_intervals"][0]["GBInterval_from"],
-            "1101",
+            [
+                (taxon["TaxId"], taxon["ScientificName"], taxon["Rank"])
+                for taxon in record[0]["LineageEx"]
+            ],
+            carnivora + [
+                ("379584", "Caniformia", "suborder"),
+                ("9608", "Canidae", "family"),
+                ("9611", "Canis", "genus"),
+                ("9612", "Canis lupus", "species"),
+            ],
         )
+        self.assertEqual(record[0]["CreateDate"], "1995/02/27 09:24:00")
+        self.assertEqual(record[0]["UpdateDate"], "2024/02/09 13:11:20")
+        self.assertEqual(record[0]["PubDate"], "1993/04/27 01:00:00")
+        self.assertEqual(record[1]["TaxId"], "9685")
+        self.assertEqual(record[1]["ScientificName"], "Felis catus")
+        self.assertEqual(record[1]["OtherNames"]["GenbankCommonName"], "domestic cat")
+        self.assertEqual(len(record[1]["OtherNames"]["Synonym"]), 2)
+        self.assertEqual(record[1]["OtherNames"]["Synonym"][0], "Felis domesticus")
+        self.assertEqual(record[1]["OtherNames"]["Synonym"][1], "Felis silvestris catus")
+        self.assertEqual(len(record[1]["OtherNames"]["CommonName"]), 2)
+        self.assertEqual(record[1]["OtherNames"]["CommonName"][0], "cat")
+        self.assertEqual(record[1]["OtherNames"]["CommonName"][1], "cats")
+        self.assertEqual(record[1]["OtherNames"]["Includes"][0], "Korat cats")
+        self.assertEqual(record[1]["ParentTaxId"], "9682")
+        self.assertEqual(record[1]["Rank"], "species")
+        self.assertEqual(record[1]["Division"], "Mammals")
+        self.assertEqual(record[1]["GeneticCode"]["GCId"], "1")
+        self.assertEqual(record[1]["GeneticCode"]["GCName"], "Standard")
+        self.assertEqual(record[1]["MitoGeneticCode"]["MGCId"], "2")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][5]["GBFeature_intervals"][0]["GBInterval_to"],
-            "1106",
+            record[1]["MitoGeneticCode"]["MGCName"], "Vertebrate Mitochondrial"
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][5]["GBFeature_intervals"][0]["GBInterval_accession"],
-            "X60065.1",
+            record[1]["Lineage"],
+            "cellular organisms; Eukaryota; Opisthokonta; Metazoa; Eumetazoa; Bilateria; Deuterostomia; Chordata; Craniata; Vertebrata; Gnathostomata; Teleostomi; Euteleostomi; Sarcopterygii; Dipnotetrapodomorpha; Tetrapoda; Amniota; Mammalia; Theria; Eutheria; Boreoeutheria; Laurasiatheria; Carnivora; Feliformia; Felidae; Felinae; Felis",
         )
+
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][5]["GBFeature_quals"][0]["GBQualifier_name"],
-            "regulatory_class",
+            [
+                (taxon["TaxId"], taxon["ScientificName"], taxon["Rank"])
+                for taxon in record[1]["LineageEx"]
+            ],
+            carnivora + [
+                ("379583", "Feliformia", "suborder"),
+                ("9681", "Felidae", "family"),
+                ("338152", "Felinae", "subfamily"),
+                ("9682", "Felis", "genus"),
+            ],
         )
+        self.assertEqual(record[1]["CreateDate"], "1995/02/27 09:24:00")
+        self.assertEqual(record[1]["UpdateDate"], "2024/03/03 11:27:08")
+        self.assertEqual(record[1]["PubDate"], "1993/07/26 01:00:00")
+        # fmt: on
+
+    def test_nucleotide1(self):
+        """Test parsing XML returned by EFetch, Nucleotide database (first test)."""
+        # Access the nucleotide database using efetch.
+        # To create the XML file, use
+        # >>> Bio.Entrez.efetch(db='nucleotide', id=5, retmode='xml')
+        with open("Entrez/nucleotide1.xml", "rb") as stream:
+            record = Entrez.read(stream)
+        # fmt: off
+        self.assertEqual(record[0]["GBSeq_locus"], "X60065")
+        self.assertEqual(record[0]["GBSeq_length"], "1136")
+        self.assertEqual(record[0]["GBSeq_strandedness"], "single")
+        self.assertEqual(record[0]["GBSeq_moltype"], "mRNA")
+        self.assertEqual(record[0]["GBSeq_topology"], "linear")
+        self.assertEqual(record[0]["GBSeq_division"], "MAM")
+        self.assertEqual(record[0]["GBSeq_update-date"], "26-JUL-2016")
+        self.assertEqual(record[0]["GBSeq_create-date"], "05-MAY-1992")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][5]["GBFeature_quals"][0]["GBQualifier_value"],
-            "polyA_signal_sequence",
+            record[0]["GBSeq_definition"],
+            "B.bovis beta-2-gpI mRNA for beta-2-glycoprotein I",
         )
+        self.assertEqual(record[0]["GBSeq_primary-accession"], "X60065")
+        self.assertEqual(record[0]["GBSeq_accession-version"], "X60065.1")
+        self.assertEqual(record[0]["GBSeq_other-seqids"][0], "emb|X60065.1|")
+        self.assertEqual(record[0]["GBSeq_other-seqids"][1], "gi|5")
+        self.assertEqual(record[0]["GBSeq_keywords"][0], "beta-2 glycoprotein I")
+        self.assertEqual(record[0]["GBSeq_source"], "Bos taurus (domestic cattle)")
+        self.assertEqual(record[0]["GBSeq_organism"], "Bos taurus")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][5]["GBFeature_quals"][1]["GBQualifier_name"],
-            "gene",
+            record[0]["GBSeq_taxonomy"],
+            "Eukaryota; Metazoa; Chordata; Craniata; Vertebrata; Euteleostomi; Mammalia; Eutheria; Laurasiatheria; Artiodactyla; Ruminantia; Pecora; Bovidae; Bovinae; Bos",
         )
+        references = record[0]["GBSeq_references"]
+        self.assertEqual(references[0]["GBReference_reference"], "1")
+        self.assertEqual(references[0]["GBReference_authors"][0], "Bendixen,E.")
+        self.assertEqual(references[0]["GBReference_authors"][1], "Halkier,T.")
+        self.assertEqual(references[0]["GBReference_authors"][2], "Magnusson,S.")
+        self.assertEqual(references[0]["GBReference_authors"][3], "Sottrup-Jensen,L.")
+        self.assertEqual(references[0]["GBReference_authors"][4], "Kristensen,T.")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][5]["GBFeature_quals"][1]["GBQualifier_value"],
-            "beta-2-gpI",
+            references[0]["GBReference_title"],
+            "Complete primary structure of bovine beta 2-glycoprotein I: localization of the disulfide bridges",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][6]["GBFeature_key"], "polyA_site"
+            references[0]["GBReference_journal"],
+            "Biochemistry 31 (14), 3611-3617 (1992)",
         )
+        self.assertEqual(references[0]["GBReference_pubmed"], "1567819")
+        self.assertEqual(references[1]["GBReference_reference"], "2")
+        self.assertEqual(references[1]["GBReference_position"], "1..1136")
+        self.assertEqual(references[1]["GBReference_authors"][0], "Kristensen,T.")
+        self.assertEqual(references[1]["GBReference_title"], "Direct Submission")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][6]["GBFeature_location"], "1130"
+            references[1]["GBReference_journal"],
+            "Submitted (11-JUN-1991) T. Kristensen, Dept of Mol Biology, University of Aarhus, C F Mollers Alle 130, DK-8000 Aarhus C, DENMARK",
         )
+        features = record[0]["GBSeq_feature-table"]
+        self.assertEqual(len(features), 7)
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][6]["GBFeature_intervals"][0]["GBInterval_point"],
+            [
+                [
+                    (
+                        interval["GBInterval_from"],
+                        interval["GBInterval_to"],
+                        interval["GBInterval_accession"],
+                    )
+                    for interval in feature["GBFeature_intervals"]
+                ]
+                for feature in features[:6]
+            ],
+            [
+                [("1", "1136", "X60065.1")],
+                [("1", "1136", "X60065.1")],
+                [("1", "1029", "X60065.1")],
+                [("1", "48", "X60065.1")],
+                [("49", "1026", "X60065.1")],
+                [("1101", "1106", "X60065.1")],
+            ],
+        )
+        self.assertEqual(features[0]["GBFeature_key"], "source")
+        self.assertEqual(features[0]["GBFeature_location"], "1..1136")
+        self.assertEqual(features[1]["GBFeature_key"], "gene")
+        self.assertEqual(features[1]["GBFeature_location"], "<1..1136")
+        self.assertEqual(features[1]["GBFeature_partial5"], "")
+        self.assertEqual(features[1]["GBFeature_partial5"].attributes["value"], "true")
+        self.assertEqual(features[2]["GBFeature_key"], "CDS")
+        self.assertEqual(features[2]["GBFeature_location"], "<1..1029")
+        self.assertEqual(features[2]["GBFeature_partial5"], "")
+        self.assertEqual(features[2]["GBFeature_partial5"].attributes["value"], "true")
+        self.assertEqual(features[3]["GBFeature_key"], "sig_peptide")
+        self.assertEqual(features[3]["GBFeature_location"], "<1..48")
+        self.assertEqual(features[3]["GBFeature_partial5"], "")
+        self.assertEqual(features[3]["GBFeature_partial5"].attributes["value"], "true")
+        self.assertEqual(features[4]["GBFeature_key"], "mat_peptide")
+        self.assertEqual(features[4]["GBFeature_location"], "49..1026")
+        self.assertEqual(features[5]["GBFeature_key"], "regulatory")
+        self.assertEqual(features[5]["GBFeature_location"], "1101..1106")
+        self.assertEqual(features[6]["GBFeature_key"], "polyA_site")
+        self.assertEqual(features[6]["GBFeature_location"], "1130")
+        self.assertEqual(
+            features[6]["GBFeature_intervals"][0]["GBInterval_point"],
             "1130",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][6]["GBFeature_intervals"][0]["GBInterval_accession"],
+            features[6]["GBFeature_intervals"][0]["GBInterval_accession"],
             "X60065.1",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][6]["GBFeature_quals"][0]["GBQualifier_name"],
-            "gene",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][6]["GBFeature_quals"][0]["GBQualifier_value"],
-            "beta-2-gpI",
+            [
+                [
+                    (qualifier["GBQualifier_name"], qualifier["GBQualifier_value"])
+                    for qualifier in feature["GBFeature_quals"]
+                ]
+                for feature in features
+            ],
+            [
+                [
+                    ("organism", "Bos taurus"),
+                    ("mol_type", "mRNA"),
+                    ("db_xref", "taxon:9913"),
+                    ("clone", "pBB2I"),
+                    ("tissue_type", "liver"),
+                ],
+                [("gene", "beta-2-gpI")],
+                [
+                    ("gene", "beta-2-gpI"),
+                    ("codon_start", "1"),
+                    ("transl_table", "1"),
+                    ("product", "beta-2-glycoprotein I"),
+                    ("protein_id", "CAA42669.1"),
+                    ("db_xref", "GOA:P17690"),
+                    ("db_xref", "InterPro:IPR000436"),
+                    ("db_xref", "InterPro:IPR015104"),
+                    ("db_xref", "InterPro:IPR016060"),
+                    ("db_xref", "UniProtKB/Swiss-Prot:P17690"),
+                    (
+                        "translation",
+                        "PALVLLLGFLCHVAIAGRTCPKPDELPFSTVVPLKRTYEPGEQIVFSCQPGYVSRGGIRRFTCPLTGLWPINTLKCMPRVCPFAGILENGTVRYTTFEYPNTISFSCHTGFYLKGASSAKCTEEGKWSPDLPVCAPITCPPPPIPKFASLSVYKPLAGNNSFYGSKAVFKCLPHHAMFGNDTVTCTEHGNWTQLPECREVRCPFPSRPDNGFVNHPANPVLYYKDTATFGCHETYSLDGPEEVECSKFGNWSAQPSCKASCKLSIKRATVIYEGERVAIQNKFKNGMLHGQKVSFFCKHKEKKCSYTEDAQCIDGTIEIPKCFKEHSSLAFWKTDASDVKPC",
+                    ),
+                ],
+                [("gene", "beta-2-gpI"), ("peptide", "PALVLLLGFLCHVAIA")],
+                [
+                    ("gene", "beta-2-gpI"),
+                    ("product", "beta-2-glycoprotein I"),
+                    (
+                        "peptide",
+                        "GRTCPKPDELPFSTVVPLKRTYEPGEQIVFSCQPGYVSRGGIRRFTCPLTGLWPINTLKCMPRVCPFAGILENGTVRYTTFEYPNTISFSCHTGFYLKGASSAKCTEEGKWSPDLPVCAPITCPPPPIPKFASLSVYKPLAGNNSFYGSKAVFKCLPHHAMFGNDTVTCTEHGNWTQLPECREVRCPFPSRPDNGFVNHPANPVLYYKDTATFGCHETYSLDGPEEVECSKFGNWSAQPSCKASCKLSIKRATVIYEGERVAIQNKFKNGMLHGQKVSFFCKHKEKKCSYTEDAQCIDGTIEIPKCFKEHSSLAFWKTDASDVKPC",
+                    ),
+                ],
+                [("regulatory_class", "polyA_signal_sequence"), ("gene", "beta-2-gpI")],
+                [("gene", "beta-2-gpI")],
+            ],
         )
         self.assertEqual(
             record[0]["GBSeq_sequence"],
@@ -8437,37 +5313,20 @@ We designed and generated pulmonary imaging biomarker pipelines to facilitate hi
             record[0]["GBSeq_taxonomy"],
             "Eukaryota; Metazoa; Chordata; Craniata; Vertebrata; Euteleostomi; Mammalia; Eutheria; Laurasiatheria; Artiodactyla; Ruminantia; Pecora; Bovidae; Bovinae; Bos",
         )
-        self.assertEqual(record[0]["GBSeq_references"][0]["GBReference_reference"], "1")
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_position"], "1..100"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_authors"][0], "Kiefer,M.C."
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_authors"][1], "Saphire,A.C.S."
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_authors"][2], "Bauer,D.M."
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_authors"][3], "Barr,P.J."
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][0]["GBReference_journal"], "Unpublished"
-        )
-        self.assertEqual(record[0]["GBSeq_references"][1]["GBReference_reference"], "2")
-        self.assertEqual(
-            record[0]["GBSeq_references"][1]["GBReference_position"], "1..100"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][1]["GBReference_authors"][0], "Kiefer,M.C."
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][1]["GBReference_title"], "Direct Submission"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_references"][1]["GBReference_journal"],
+        references = record[0]["GBSeq_references"]
+        self.assertEqual(references[0]["GBReference_reference"], "1")
+        self.assertEqual(references[0]["GBReference_position"], "1..100")
+        self.assertEqual(references[0]["GBReference_authors"][0], "Kiefer,M.C.")
+        self.assertEqual(references[0]["GBReference_authors"][1], "Saphire,A.C.S.")
+        self.assertEqual(references[0]["GBReference_authors"][2], "Bauer,D.M.")
+        self.assertEqual(references[0]["GBReference_authors"][3], "Barr,P.J.")
+        self.assertEqual(references[0]["GBReference_journal"], "Unpublished")
+        self.assertEqual(references[1]["GBReference_reference"], "2")
+        self.assertEqual(references[1]["GBReference_position"], "1..100")
+        self.assertEqual(references[1]["GBReference_authors"][0], "Kiefer,M.C.")
+        self.assertEqual(references[1]["GBReference_title"], "Direct Submission")
+        self.assertEqual(
+            references[1]["GBReference_journal"],
             "Submitted (30-JAN-1990) Kiefer M.C., Chiron Corporation, 4560 Hortom St, Emeryville CA 94608-2916, U S A",
         )
         self.assertEqual(
@@ -8475,206 +5334,155 @@ We designed and generated pulmonary imaging biomarker pipelines to facilitate hi
             "See <X15699> for Human sequence.~~Data kindly reviewed (08-MAY-1990) by Kiefer M.C.",
         )
         self.assertEqual(record[0]["GBSeq_source-db"], "embl accession X51700.1")
-        self.assertEqual(record[0]["GBSeq_feature-table"][0]["GBFeature_key"], "source")
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_location"], "1..100"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_intervals"][0]["GBInterval_from"],
-            "1",
-        )
+        features = record[0]["GBSeq_feature-table"]
+        self.assertEqual(features[0]["GBFeature_key"], "source")
+        self.assertEqual(features[0]["GBFeature_location"], "1..100")
+        self.assertEqual(features[0]["GBFeature_intervals"][0]["GBInterval_from"], "1")
+        self.assertEqual(features[0]["GBFeature_intervals"][0]["GBInterval_to"], "100")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_intervals"][0]["GBInterval_to"],
-            "100",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_intervals"][0]["GBInterval_accession"],
+            features[0]["GBFeature_intervals"][0]["GBInterval_accession"],
             "CAA35997.1",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][0]["GBQualifier_name"],
+            features[0]["GBFeature_quals"][0]["GBQualifier_name"],
             "organism",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][0]["GBQualifier_value"],
+            features[0]["GBFeature_quals"][0]["GBQualifier_value"],
             "Bos taurus",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][1]["GBQualifier_name"],
+            features[0]["GBFeature_quals"][1]["GBQualifier_name"],
             "db_xref",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][1]["GBQualifier_value"],
+            features[0]["GBFeature_quals"][1]["GBQualifier_value"],
             "taxon:9913",
         )
+        self.assertEqual(features[0]["GBFeature_quals"][2]["GBQualifier_name"], "clone")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][2]["GBQualifier_name"],
-            "clone",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][2]["GBQualifier_value"],
+            features[0]["GBFeature_quals"][2]["GBQualifier_value"],
             "bBGP-3",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][3]["GBQualifier_name"],
+            features[0]["GBFeature_quals"][3]["GBQualifier_name"],
             "tissue_type",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][3]["GBQualifier_value"],
+            features[0]["GBFeature_quals"][3]["GBQualifier_value"],
             "bone matrix",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][4]["GBQualifier_name"],
+            features[0]["GBFeature_quals"][4]["GBQualifier_name"],
             "clone_lib",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][0]["GBFeature_quals"][4]["GBQualifier_value"],
+            features[0]["GBFeature_quals"][4]["GBQualifier_value"],
             "Zap-bb",
         )
+        self.assertEqual(features[1]["GBFeature_key"], "Protein")
+        self.assertEqual(features[1]["GBFeature_location"], "1..100")
+        self.assertEqual(features[1]["GBFeature_intervals"][0]["GBInterval_from"], "1")
+        self.assertEqual(features[1]["GBFeature_intervals"][0]["GBInterval_to"], "100")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_key"], "Protein"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_location"], "1..100"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_intervals"][0]["GBInterval_from"],
-            "1",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_intervals"][0]["GBInterval_to"],
-            "100",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_intervals"][0]["GBInterval_accession"],
+            features[1]["GBFeature_intervals"][0]["GBInterval_accession"],
             "CAA35997.1",
         )
+        self.assertEqual(features[1]["GBFeature_quals"][0]["GBQualifier_name"], "name")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_quals"][0]["GBQualifier_name"],
-            "name",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][1]["GBFeature_quals"][0]["GBQualifier_value"],
+            features[1]["GBFeature_quals"][0]["GBQualifier_value"],
             "unnamed protein product",
         )
-        self.assertEqual(record[0]["GBSeq_feature-table"][2]["GBFeature_key"], "Region")
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_location"], "33..97"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_intervals"][0]["GBInterval_from"],
-            "33",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_intervals"][0]["GBInterval_to"],
-            "97",
-        )
+        self.assertEqual(features[2]["GBFeature_key"], "Region")
+        self.assertEqual(features[2]["GBFeature_location"], "33..97")
+        self.assertEqual(features[2]["GBFeature_intervals"][0]["GBInterval_from"], "33")
+        self.assertEqual(features[2]["GBFeature_intervals"][0]["GBInterval_to"], "97")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_intervals"][0]["GBInterval_accession"],
+            features[2]["GBFeature_intervals"][0]["GBInterval_accession"],
             "CAA35997.1",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][0]["GBQualifier_name"],
+            features[2]["GBFeature_quals"][0]["GBQualifier_name"],
             "region_name",
         )
+        self.assertEqual(features[2]["GBFeature_quals"][0]["GBQualifier_value"], "GLA")
+        self.assertEqual(features[2]["GBFeature_quals"][1]["GBQualifier_name"], "note")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][0]["GBQualifier_value"],
-            "GLA",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][1]["GBQualifier_name"],
-            "note",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][1]["GBQualifier_value"],
+            features[2]["GBFeature_quals"][1]["GBQualifier_value"],
             "Domain containing Gla (gamma-carboxyglutamate) residues; smart00069",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][2]["GBQualifier_name"],
+            features[2]["GBFeature_quals"][2]["GBQualifier_name"],
             "db_xref",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][2]["GBFeature_quals"][2]["GBQualifier_value"],
+            features[2]["GBFeature_quals"][2]["GBQualifier_value"],
             "CDD:214503",
         )
-        self.assertEqual(record[0]["GBSeq_feature-table"][3]["GBFeature_key"], "CDS")
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_location"], "1..100"
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_intervals"][0]["GBInterval_from"],
-            "1",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_intervals"][0]["GBInterval_to"],
-            "100",
-        )
+        self.assertEqual(features[3]["GBFeature_key"], "CDS")
+        self.assertEqual(features[3]["GBFeature_location"], "1..100")
+        self.assertEqual(features[3]["GBFeature_intervals"][0]["GBInterval_from"], "1")
+        self.assertEqual(features[3]["GBFeature_intervals"][0]["GBInterval_to"], "100")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_intervals"][0]["GBInterval_accession"],
+            features[3]["GBFeature_intervals"][0]["GBInterval_accession"],
             "CAA35997.1",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][0]["GBQualifier_name"],
+            features[3]["GBFeature_quals"][0]["GBQualifier_name"],
             "coded_by",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][0]["GBQualifier_value"],
+            features[3]["GBFeature_quals"][0]["GBQualifier_value"],
             "X51700.1:28..330",
         )
+        self.assertEqual(features[3]["GBFeature_quals"][1]["GBQualifier_name"], "note")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][1]["GBQualifier_name"],
-            "note",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][1]["GBQualifier_value"],
+            features[3]["GBFeature_quals"][1]["GBQualifier_value"],
             "bone Gla precursor (100 AA)",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][2]["GBQualifier_name"],
+            features[3]["GBFeature_quals"][2]["GBQualifier_name"],
             "transl_table",
         )
+        self.assertEqual(features[3]["GBFeature_quals"][2]["GBQualifier_value"], "1")
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][2]["GBQualifier_value"],
-            "1",
-        )
-        self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][3]["GBQualifier_name"],
+            features[3]["GBFeature_quals"][3]["GBQualifier_name"],
             "db_xref",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][3]["GBQualifier_value"],
+            features[3]["GBFeature_quals"][3]["GBQualifier_value"],
             "GOA:P02820",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][4]["GBQualifier_name"],
+            features[3]["GBFeature_quals"][4]["GBQualifier_name"],
             "db_xref",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][4]["GBQualifier_value"],
+            features[3]["GBFeature_quals"][4]["GBQualifier_value"],
             "InterPro:IPR000294",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][5]["GBQualifier_name"],
+            features[3]["GBFeature_quals"][5]["GBQualifier_name"],
             "db_xref",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][5]["GBQualifier_value"],
+            features[3]["GBFeature_quals"][5]["GBQualifier_value"],
             "InterPro:IPR002384",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][6]["GBQualifier_name"],
+            features[3]["GBFeature_quals"][6]["GBQualifier_name"],
             "db_xref",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][6]["GBQualifier_value"],
+            features[3]["GBFeature_quals"][6]["GBQualifier_value"],
             "PDB:1Q3M",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][7]["GBQualifier_name"],
+            features[3]["GBFeature_quals"][7]["GBQualifier_name"],
             "db_xref",
         )
         self.assertEqual(
-            record[0]["GBSeq_feature-table"][3]["GBFeature_quals"][7]["GBQualifier_value"],
+            features[3]["GBFeature_quals"][7]["GBQualifier_value"],
             "UniProtKB/Swiss-Prot:P02820",
         )
         self.assertEqual(
@@ -8691,9 +5499,9 @@ We designed and generated pulmonary imaging biomarker pipelines to facilitate hi
             records = Entrez.read(stream)
         self.assertEqual(len(records), 1)
         record = records["IPGReport"]
-        self.assertEqual(len(record.attributes), 2)
-        self.assertEqual(record.attributes["product_acc"], "KJV04014.1")
-        self.assertEqual(record.attributes["ipg"], "79092155")
+        self.assertEqual(
+            record.attributes, {"product_acc": "KJV04014.1", "ipg": "79092155"}
+        )
         self.assertEqual(len(record), 3)
         self.assertEqual(record["Product"], "")
         self.assertEqual(record["Product"].attributes["kingdom"], "Bacteria")
@@ -8849,6 +5657,21 @@ We designed and generated pulmonary imaging biomarker pipelines to facilitate hi
             records = Entrez.parse(stream)
             self.assertRaises(ValueError, next, records)
 
+    @patch("Bio.Entrez.Parser.urlopen", side_effect=OSError("no network access"))
+    def test_unavailable_definition(self, urlopen):
+        """Test error handling for a DTD or XML Schema that cannot be fetched."""
+        dtd_xml = b"""<?xml version="1.0" encoding="UTF-8" ?>
+<!DOCTYPE eMissing PUBLIC "-//NLM//DTD eMissing//EN" "https://www.ncbi.nlm.nih.gov/dtd/eMissing.dtd">
+<eMissing></eMissing>
+"""
+        self.assertRaises(RuntimeError, Entrez.read, BytesIO(dtd_xml))
+        xsd_xml = b"""<?xml version="1.0" encoding="UTF-8" ?>
+<MissingSet xmlns:xsi="https://www.w3.org/2001/XMLSchema-instance" xsi:noNamespaceSchemaLocation="https://www.ncbi.nlm.nih.gov/data_specs/schema/MissingSet.xsd">
+</MissingSet>
+"""
+        self.assertRaises(RuntimeError, Entrez.read, BytesIO(xsd_xml))
+        self.assertEqual(urlopen.call_count, 2)
+
     def test_truncated_xml(self):
         """Test error handling for a truncated XML declaration."""
         from io import BytesIO